@@ -3,7 +3,12 @@
 # Lazy imports to avoid dependency issues when only using hardware module
 __all__ = [
     'execute_notebook_experiment',
+    'execute_notebook_sweep',
+    'KernelPool',
+    'CellCache',
+    'log_metric',
     'validate_graduation_requirements',
+    'validate_notebooks',
     'quick_explore',
     'generate_insights',
 ]
@@ -14,9 +19,24 @@ def __getattr__(name):
     if name == "execute_notebook_experiment":
         from .notebook_executor import execute_notebook_experiment
         return execute_notebook_experiment
+    elif name == "execute_notebook_sweep":
+        from .notebook_executor import execute_notebook_sweep
+        return execute_notebook_sweep
+    elif name == "KernelPool":
+        from .kernel_pool import KernelPool
+        return KernelPool
+    elif name == "CellCache":
+        from .cell_cache import CellCache
+        return CellCache
+    elif name == "log_metric":
+        from .metrics_channel import log_metric
+        return log_metric
     elif name == "validate_graduation_requirements":
         from .graduation_validator import validate_graduation_requirements
         return validate_graduation_requirements
+    elif name == "validate_notebooks":
+        from .graduation_validator import validate_notebooks
+        return validate_notebooks
     elif name == "quick_explore":
         from .quick import quick_explore
         return quick_explore
@@ -0,0 +1,282 @@
+"""Memory-aware admission control for data loads.
+
+Before quick_explore/generate_insights load anything, plan_data_access()
+predicts the peak memory of the requested access path from file metadata
+alone and, when it exceeds the budget (memory_budget_gb(): half of available
+memory, as estimate_eda_duration() assumes), switches to a path that fits:
+- streaming: smaller chunks
+- sampling: smaller read chunks, then a smaller sample; Parquet row groups
+  too large to decode at once switch to chunked streaming. Stratified
+  reservoir sampling is budgeted for its worst case, one sample-sized
+  reservoir per stratum (sampling.MAX_STRATA)
+- as a last resort, column projection (target column first, then file order)
+
+Shapes come from the Parquet footer (row count, dtypes, uncompressed column
+sizes) or from parsing the first rows of a CSV/JSONL file, with the row
+count extrapolated from the file size.
+"""
+
+from typing import Dict, Any, List, Optional, TypedDict
+from pathlib import Path
+
+from .hardware import capture_hardware_profile
+from .hardware.estimator import memory_budget_gb
+from .sampling import MAX_STRATA
+
+# Parsing and DataFrame conversion hold about two copies of the rows at once
+PEAK_MEMORY_FACTOR = 2.0
+
+# pandas object column overhead per value (PyObject header of a str)
+OBJECT_OVERHEAD_BYTES = 49
+
+# Rows parsed from the head of a text file to measure row width
+SNIFF_ROWS = 1000
+
+# Smallest adapted chunk / sample before falling back to projection
+MIN_CHUNK_ROWS = 1000
+MIN_SAMPLE_ROWS = 1000
+
+
+class DataShape(TypedDict):
+    """Size of a data file as it would be held in pandas."""
+    rows: int
+    column_bytes: Dict[str, float]  # In-memory bytes per row, by column
+    max_row_group_rows: Optional[int]  # Parquet only
+    source: str  # 'parquet-footer' or 'sniff'
+
+
+class AccessPlan(TypedDict):
+    """How a data file will be read, after admission control."""
+    streaming: bool
+    sample_size: int
+    chunk_size: int
+    columns: Optional[List[str]]
+    predicted_gb: Optional[float]  # Peak memory of the planned path
+    budget_gb: float
+    adapted: bool
+    reason: Optional[str]
+
+
+def inspect_data_file(path: str) -> Optional[DataShape]:
+    """
+    Predict a file's in-memory shape from metadata.
+
+    Args:
+        path: CSV, JSONL or Parquet file
+
+    Returns:
+        DataShape, or None for formats that cannot be sized without loading
+        them (single-document JSON) or unreadable files
+    """
+    path = Path(path)
+    try:
+        if path.suffix == '.parquet':
+            return _inspect_parquet(path)
+        if path.suffix in ('.csv', '.jsonl'):
+            return _sniff_text(path)
+    except (OSError, ValueError, ImportError):
+        return None
+    return None
+
+
+def predict_memory_gb(shape: DataShape, rows: int, columns: Optional[List[str]] = None) -> float:
+    """Peak memory of holding rows of the (projected) columns, with PEAK_MEMORY_FACTOR."""
+    row_bytes = sum(
+        width for name, width in shape['column_bytes'].items()
+        if columns is None or name in columns
+    )
+    return min(rows, shape['rows']) * row_bytes * PEAK_MEMORY_FACTOR / (1024**3)
+
+
+def predict_file_memory_gb(path: str) -> Optional[float]:
+    """Peak memory of loading a whole file with pandas (None if unknown)."""
+    shape = inspect_data_file(path)
+    return predict_memory_gb(shape, shape['rows']) if shape is not None else None
+
+
+def plan_data_access(
+    data_path: str,
+    sample_size: int,
+    streaming: bool = False,
+    chunk_size: int = 100000,
+    columns: Optional[List[str]] = None,
+    target_column: Optional[str] = None,
+    filters: Optional[List[Any]] = None,
+    hardware_profile: Optional[dict] = None,
+    stratify: bool = False,
+) -> AccessPlan:
+    """
+    Fit a data load into the memory budget.
+
+    Args:
+        data_path: Data file to read
+        sample_size: Requested sample rows (sampled path)
+        streaming: Requested streaming path
+        chunk_size: Requested rows per chunk (read chunk when sampling)
+        columns: Requested projection (None: all columns)
+        target_column: Column kept first if projection is needed
+        filters: Requested row filters (filtered Parquet is read in chunks)
+        hardware_profile: Profile for available memory (captured if omitted)
+        stratify: The sample is stratified (CSV/JSONL reservoirs then hold
+            up to MAX_STRATA times the sample)
+
+    Returns:
+        AccessPlan: the request unchanged if it fits (or cannot be sized),
+        otherwise the adapted path with the reason
+    """
+    budget = memory_budget_gb(hardware_profile or capture_hardware_profile())
+    plan = AccessPlan(
+        streaming=streaming,
+        sample_size=sample_size,
+        chunk_size=chunk_size,
+        columns=columns,
+        predicted_gb=None,
+        budget_gb=budget,
+        adapted=False,
+        reason=None,
+    )
+    shape = inspect_data_file(data_path)
+    if shape is None or not shape['column_bytes']:
+        return plan
+    if filters:
+        # Filtered Parquet goes through the chunked reader, not row-group sampling
+        shape = DataShape(**dict(shape, max_row_group_rows=None))
+
+    strata = MAX_STRATA if stratify else 1
+    plan['predicted_gb'] = _planned_peak_gb(shape, plan, strata)
+    if plan['predicted_gb'] <= budget:
+        return plan
+
+    requested = plan['predicted_gb']
+    plan['adapted'] = True
+    rows_fitting = _rows_fitting(shape, budget, columns)
+    if streaming:
+        plan['chunk_size'] = max(MIN_CHUNK_ROWS, min(chunk_size, rows_fitting))
+        plan['reason'] = f"chunk size reduced to {plan['chunk_size']} rows"
+    elif shape['max_row_group_rows'] is not None:
+        # Parquet sampling decodes one row group at a time next to the sample
+        room = rows_fitting - shape['max_row_group_rows']
+        if room >= MIN_SAMPLE_ROWS:
+            plan['sample_size'] = min(sample_size, room, shape['rows'] - 1)
+            plan['reason'] = f"sample reduced to {plan['sample_size']} rows"
+        else:
+            # Row groups alone do not fit; stream them in batches instead
+            plan['streaming'] = True
+            plan['chunk_size'] = max(MIN_CHUNK_ROWS, min(chunk_size, rows_fitting))
+            plan['reason'] = f"row groups too large to sample; streaming in {plan['chunk_size']}-row chunks"
+    else:
+        # Reservoir sampling holds one read chunk plus the sample (per stratum)
+        plan['chunk_size'] = max(MIN_CHUNK_ROWS, min(chunk_size, rows_fitting // 2))
+        plan['sample_size'] = max(MIN_SAMPLE_ROWS, min(sample_size, (rows_fitting - plan['chunk_size']) // strata))
+        plan['reason'] = f"sample reduced to {plan['sample_size']} rows read in {plan['chunk_size']}-row chunks"
+
+    plan['predicted_gb'] = _planned_peak_gb(shape, plan, strata)
+    if plan['predicted_gb'] > budget:
+        plan['columns'] = _project_columns(shape, budget, plan, target_column, strata)
+        dropped = len(columns or shape['column_bytes']) - len(plan['columns'])
+        plan['reason'] = f"{plan['reason'] or 'rows reduced'}; reading {len(plan['columns'])} columns ({dropped} dropped)"
+        plan['predicted_gb'] = _planned_peak_gb(shape, plan, strata)
+
+    plan['reason'] = (
+        f"predicted {requested:.2f} GB exceeds the {budget:.2f} GB memory budget: {plan['reason']}"
+    )
+    return plan
+
+
+def _planned_peak_gb(shape: DataShape, plan: AccessPlan, strata: int = 1) -> float:
+    """Peak memory of the rows a plan holds at once (strata: reservoirs kept)."""
+    if plan['streaming']:
+        rows = plan['chunk_size']
+    elif shape['max_row_group_rows'] is not None:
+        # Parquet sampling: the sample plus one decoded row group, or the whole file
+        rows = shape['rows'] if plan['sample_size'] >= shape['rows'] else plan['sample_size'] + shape['max_row_group_rows']
+    else:
+        rows = min(plan['sample_size'] * strata, shape['rows']) + plan['chunk_size']
+    return predict_memory_gb(shape, rows, plan['columns'])
+
+
+def _rows_fitting(shape: DataShape, budget_gb: float, columns: Optional[List[str]]) -> int:
+    """Rows of the (projected) columns that fit in budget_gb."""
+    per_row_gb = predict_memory_gb(dict(shape, rows=1), 1, columns)
+    return int(budget_gb / per_row_gb) if per_row_gb > 0 else shape['rows']
+
+
+def _project_columns(
+    shape: DataShape,
+    budget_gb: float,
+    plan: AccessPlan,
+    target_column: Optional[str],
+    strata: int = 1,
+) -> List[str]:
+    """Greedy projection: target column first, then file order, while it fits."""
+    candidates = [name for name in (plan['columns'] or shape['column_bytes']) if name in shape['column_bytes']]
+    if target_column in candidates:
+        candidates.remove(target_column)
+        candidates.insert(0, target_column)
+    chosen: List[str] = []
+    for name in candidates:
+        trial = dict(plan, columns=chosen + [name])
+        if chosen and _planned_peak_gb(shape, trial, strata) > budget_gb:
+            break
+        chosen.append(name)
+    return chosen
+
+
+def _inspect_parquet(path: Path) -> DataShape:
+    """Shape from the footer: pandas dtype widths, string sizes from column chunks."""
+    import numpy as np
+    import pyarrow.parquet as pq
+    from .profiling import parquet_footer_profile
+
+    metadata = pq.ParquetFile(path).metadata
+    profile = parquet_footer_profile(str(path))
+    rows = max(profile['rows'], 1)
+    column_bytes: Dict[str, float] = {}
+    for column in profile['columns']:
+        try:
+            dtype = np.dtype(column['dtype'])
+        except TypeError:
+            dtype = None  # category, tz-aware datetimes
+        if dtype is not None and dtype != object:
+            column_bytes[column['name']] = float(dtype.itemsize)
+        else:
+            # Strings, categories and nested values: decoded size plus Python objects
+            column_bytes[column['name']] = column['memory_bytes'] / rows + OBJECT_OVERHEAD_BYTES
+    return DataShape(
+        rows=profile['rows'],
+        column_bytes=column_bytes,
+        max_row_group_rows=max(
+            (metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)), default=0
+        ),
+        source='parquet-footer',
+    )
+
+
+def _sniff_text(path: Path) -> DataShape:
+    """Shape from parsing the first SNIFF_ROWS rows; row count scaled by file size."""
+    import pandas as pd
+
+    header_lines = 1 if path.suffix == '.csv' else 0
+    with open(path, 'rb') as f:
+        head = b''.join(f.readline() for _ in range(SNIFF_ROWS + header_lines))
+    if not head:
+        return DataShape(rows=0, column_bytes={}, max_row_group_rows=None, source='sniff')
+    if path.suffix == '.csv':
+        df = pd.read_csv(path, nrows=SNIFF_ROWS)
+        header_bytes = len(head.split(b'\n', 1)[0]) + 1
+    else:
+        df = pd.read_json(path, lines=True, nrows=SNIFF_ROWS)
+        header_bytes = 0
+    if len(df) == 0:
+        return DataShape(rows=0, column_bytes={}, max_row_group_rows=None, source='sniff')
+
+    sniffed_bytes = max(len(head) - header_bytes, 1)
+    rows = int((path.stat().st_size - header_bytes) * len(df) / sniffed_bytes)
+    usage = df.memory_usage(deep=True, index=False)
+    return DataShape(
+        rows=max(rows, len(df)),
+        column_bytes={str(name): float(usage[name]) / len(df) for name in df.columns},
+        max_row_group_rows=None,
+        source='sniff',
+    )
+
@@ -0,0 +1,204 @@
+"""Persistent on-disk caches for GRD analysis results.
+
+DiskCache stores JSON payloads under a directory (by default inside
+.planning/) with size-bounded LRU eviction. Keys are content-addressed:
+callers hash everything that determines a result, typically a file
+fingerprint (path + size + mtime, or a fast content hash) plus the
+parameters used to compute it.
+
+Payloads are converted to plain JSON types before they are stored
+(to_json_native), so a cache hit returns the same types a caller that
+caches the converted payload computed on the miss.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# Bytes read from each end of a file for the fast content hash
+CONTENT_HASH_BYTES = 1024 * 1024
+
+
+def file_fingerprint(path: str, content_hash: bool = False) -> Dict[str, Any]:
+    """Fingerprint a file cheaply.
+
+    Args:
+        path: Path to the file
+        content_hash: If True, also hash the first and last 1 MiB so that
+            rewrites that preserve size and mtime are still detected
+
+    Returns:
+        Dict with resolved path, size, mtime_ns and optional content hash
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    fingerprint: Dict[str, Any] = {
+        'path': str(path),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+    }
+    if content_hash:
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            digest.update(f.read(CONTENT_HASH_BYTES))
+            if stat.st_size > 2 * CONTENT_HASH_BYTES:
+                f.seek(-CONTENT_HASH_BYTES, os.SEEK_END)
+                digest.update(f.read(CONTENT_HASH_BYTES))
+        fingerprint['content_hash'] = digest.hexdigest()
+    return fingerprint
+
+
+def to_json_native(value: Any) -> Any:
+    """Convert a payload to the plain types json.load() returns.
+
+    NumPy scalars and arrays become Python numbers and lists, dates and
+    times (including pandas Timestamps) ISO strings, timedeltas their
+    str(), and NaT/NA None. Tuples become lists and dict keys strings, as
+    a JSON round trip would make them.
+
+    Raises:
+        TypeError: For any other type, instead of silently stringifying it
+    """
+    if value is None or type(value) in (str, int, float, bool):
+        return value
+    if isinstance(value, dict):
+        return {
+            key if isinstance(key, str) else json.dumps(to_json_native(key)): to_json_native(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [to_json_native(item) for item in value]
+    if type(value).__name__ in ('NaTType', 'NAType'):
+        return None
+    if NUMPY_AVAILABLE and isinstance(value, np.ndarray):
+        return to_json_native(value.tolist())
+    if NUMPY_AVAILABLE and isinstance(value, np.generic):
+        return to_json_native(value.item())
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return str(value)
+    for native in (bool, int, float, str):
+        # Subclasses such as IntEnum
+        if isinstance(value, native):
+            return native(value)
+    raise TypeError(f"Cannot cache value of type {type(value).__name__}: {value!r}")
+
+
+def cache_key(*parts: Any) -> str:
+    """Build a content-addressed key from JSON-serializable parts."""
+    encoded = json.dumps(parts, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class DiskCache:
+    """Size-bounded LRU cache of JSON payloads on disk.
+
+    Each entry is one <key>.json file. Reads refresh the file's mtime, and
+    writes evict least-recently-used entries until the directory fits in
+    max_bytes. Writes are atomic (temp file + rename), so concurrent runs
+    never read a half-written entry.
+
+    Attributes:
+        cache_dir: Directory holding cache entries
+        max_bytes: Total size budget for all entries
+
+    Example:
+        >>> cache = DiskCache(Path(".planning/cache/profiles"))
+        >>> key = cache_key(file_fingerprint("data/train.csv"), {"sample_size": 10000})
+        >>> entry = cache.get(key)
+        >>> if entry is None:
+        ...     cache.put(key, {"rows": 42})
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = 64 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Load an entry, marking it as recently used.
+
+        Args:
+            key: Cache key from cache_key()
+
+        Returns:
+            Cached payload, or None on a miss or unreadable entry
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path) as f:
+                payload = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return payload
+
+    def put(self, key: str, payload: Any) -> Path:
+        """Store an entry atomically, then evict to stay within budget.
+
+        Args:
+            key: Cache key from cache_key()
+            payload: Value to store, converted with to_json_native()
+
+        Returns:
+            Path to the stored entry
+
+        Raises:
+            TypeError: If the payload holds a type to_json_native() rejects
+        """
+        payload = to_json_native(payload)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        self.evict()
+        return path
+
+    def evict(self) -> int:
+        """Remove least-recently-used entries until under max_bytes.
+
+        Returns:
+            Number of entries removed
+        """
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        for path in self.cache_dir.glob("*.json"):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,426 @@
+"""Memoized notebook cell execution with dependency-aware invalidation.
+
+Each code cell gets a chained key: a hash of the previous cell's key, the
+cell source, the values of the run parameters it reads, and fingerprints
+(size, mtime) of files it names in string literals or reads through
+parameters. Changing a hyperparameter therefore only invalidates the cells
+that read it and everything after them. The papermill parameters cells are
+left out of the chain; they still run, and the restore re-applies the
+current parameters.
+
+After a cell runs, a snapshot of the namespace delta (names the cell
+rebound or mentions), imported modules and global RNG states is pickled
+inside the kernel, and the cell outputs are stored next to it. On a later
+run the longest cached prefix is skipped: those cells are blanked (nbclient
+skips empty cells) and the first one restores every delta in order, then
+re-applies the current parameters. The output notebook gets the original
+sources and cached outputs back.
+
+Cells that only define things (imports, functions, classes) are replayed
+instead of pickled, since functions defined in a notebook cannot be
+unpickled in a fresh kernel. Cells that define functions and also compute,
+or whose state cannot be pickled, are not cached and end the prefix.
+"""
+import ast
+import asyncio
+import hashlib
+import json
+import os
+import re
+import tempfile
+import uuid
+from pathlib import Path
+from typing import Any, TypedDict
+
+import nbformat
+from nbclient.exceptions import DeadKernelError
+
+from .cache import file_fingerprint
+
+# Bump when the key recipe or snapshot layout changes
+CELL_CACHE_VERSION = 1
+
+# Metadata key marking cells in the prepared and output notebooks
+_METADATA_KEY = 'grd_cell_cache'
+
+# Cells papermill fills from the run parameters; never keyed or skipped
+_PARAMETER_TAGS = frozenset({'parameters', 'injected-parameters'})
+
+# How often a running snapshot checks that the kernel is still alive
+_SNAPSHOT_POLL_SECONDS = 1.0
+
+_MAGIC_LINE_RE = re.compile(r'^[ \t]*[%!].*$', re.MULTILINE)
+
+_DEFINITION_NODES = (ast.Import, ast.ImportFrom, ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+# Kernel side: record the namespace delta of the cell that just ran.
+# With path None only the id baseline is updated (injected/restore cells).
+_SNAPSHOT_CODE = """
+import os, pickle, sys, types
+shell = __import__('IPython').get_ipython()
+ns = shell.user_ns
+previous = getattr(shell, '_grd_cell_cache_ids', {})
+current = {k: id(v) for k, v in ns.items() if not k.startswith('_') and k not in shell.user_ns_hidden}
+shell._grd_cell_cache_ids = current
+if path is not None:
+    def main_defined(v):
+        return isinstance(v, (types.FunctionType, type)) and getattr(v, '__module__', None) == '__main__'
+    rebound = {k for k in current if previous.get(k) != current[k]}
+    # Mentioned names catch in-place mutation; notebook functions come back by replay
+    changed = {k: ns[k] for k in current if k in rebound or (k in referenced and not main_defined(ns[k]))}
+    modules = {k: v.__name__ for k, v in changed.items() if isinstance(v, types.ModuleType)}
+    values = {} if replay else {k: v for k, v in changed.items() if k not in modules}
+    defined_here = [k for k, v in values.items() if main_defined(v)]
+    rng = {'random': __import__('random').getstate()}
+    if 'numpy' in sys.modules:
+        rng['numpy'] = sys.modules['numpy'].random.get_state()
+    if 'torch' in sys.modules:
+        rng['torch'] = sys.modules['torch'].get_rng_state()
+    if not defined_here:
+        tmp = '%s.%d.tmp' % (path, os.getpid())
+        try:
+            with open(tmp, 'wb') as f:
+                pickle.dump({
+                    'values': values,
+                    'modules': modules,
+                    'deleted': [k for k in previous if k not in current],
+                    'rng': rng,
+                }, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except Exception:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+"""
+
+# Kernel side: rebuild the namespace after the cached prefix. A snapshot
+# evicted since the run was planned (a concurrent run's evict()) ends the
+# restore there; that cell and the rest of the prefix run from source.
+_RESTORE_CODE = """
+import importlib, json, pickle, sys
+shell = __import__('IPython').get_ipython()
+ns = shell.user_ns
+rng = None
+def resume():
+    ns.update(json.loads(parameters))
+    if rng is not None:
+        __import__('random').setstate(rng['random'])
+        if 'numpy' in rng:
+            importlib.import_module('numpy').random.set_state(rng['numpy'])
+        if 'torch' in rng:
+            importlib.import_module('torch').set_rng_state(rng['torch'])
+for i, (source, path, replay) in enumerate(plan):
+    if replay:
+        exec(shell.transform_cell(source), ns)
+    try:
+        with open(path, 'rb') as f:
+            delta = pickle.load(f)
+    except FileNotFoundError:
+        resume()
+        for source, _, replay in plan[i + (1 if replay else 0):]:
+            exec(shell.transform_cell(source), ns)
+        break
+    for name, module in delta['modules'].items():
+        ns[name] = importlib.import_module(module)
+    ns.update(delta['values'])
+    for name in delta['deleted']:
+        ns.pop(name, None)
+    rng = delta['rng']
+else:
+    resume()
+"""
+
+
+class CachePlan(TypedDict):
+    """How a run uses the cell cache."""
+    input_path: str
+    cached_cells: int
+    code_cells: int
+
+
+class CellCache:
+    """
+    Size-bounded store of per-cell namespace snapshots and outputs.
+
+    Each entry is <key>.pkl (written by the kernel) plus <key>.json
+    (outputs). Entries are evicted least-recently-used first, as in
+    cache.DiskCache.
+
+    Attributes:
+        cache_dir: Directory holding entries
+        max_bytes: Total size budget
+
+    Example:
+        >>> cache = CellCache(Path(".planning/cache/cells"))
+        >>> execute_notebook_experiment(..., cell_cache=cache)
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = 10 * 1024 ** 3):
+        self.cache_dir = Path(cache_dir).resolve()
+        self.max_bytes = max_bytes
+
+    def prepare(self, notebook_path: str, parameters: dict[str, Any], prepared_path: Path) -> CachePlan:
+        """
+        Key every code cell and write a notebook that skips the cached prefix.
+
+        Args:
+            notebook_path: Input notebook
+            parameters: Run parameters (as injected by papermill)
+            prepared_path: Where to write the notebook to execute
+
+        Returns:
+            CachePlan with the notebook to execute and the prefix length
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        nb = nbformat.read(notebook_path, as_version=4)
+        kernel_name = nb.metadata.get('kernelspec', {}).get('name')
+
+        previous = hashlib.sha256(json.dumps([CELL_CACHE_VERSION, kernel_name]).encode()).hexdigest()
+        code_cells = []
+        for cell in nb.cells:
+            if cell.cell_type != 'code' or not cell.source.strip():
+                continue
+            if _PARAMETER_TAGS & set(cell.metadata.get('tags', [])):
+                continue
+            analysis = _analyze_cell(cell.source) if previous is not None else None
+            if analysis is None:
+                # Unparseable cell: it and everything after it run uncached
+                previous = None
+                continue
+            key = _cell_key(previous, cell.source, analysis, parameters)
+            cell.metadata[_METADATA_KEY] = {
+                'key': key,
+                'replay': analysis['replay'],
+                'referenced': analysis['referenced'],
+            }
+            code_cells.append(cell)
+            previous = key
+
+        prefix = []
+        for cell in code_cells:
+            if not self._has(cell.metadata[_METADATA_KEY]['key']):
+                break
+            prefix.append(cell)
+
+        if prefix:
+            plan = []
+            for cell in prefix:
+                entry = cell.metadata[_METADATA_KEY]
+                entry['hit'] = True
+                plan.append((cell.source, str(self._path(entry['key'], '.pkl')), entry['replay']))
+                self._touch(entry['key'])
+                entry['source'] = cell.source
+                cell.source = ''
+            restore = _RESTORE_CODE
+            prefix[0].source = "__import__('builtins').exec({code!r}, {{'plan': {plan!r}, 'parameters': {params!r}}})".format(
+                code=restore, plan=plan, params=json.dumps(parameters, default=str),
+            )
+            prefix[0].metadata[_METADATA_KEY]['restore'] = True
+
+        prepared_path = Path(prepared_path)
+        prepared_path.parent.mkdir(parents=True, exist_ok=True)
+        nbformat.write(nb, str(prepared_path))
+        return CachePlan(
+            input_path=str(prepared_path),
+            cached_cells=len(prefix),
+            code_cells=len(code_cells),
+        )
+
+    def cell_hook(self, km: Any) -> '_SnapshotHook':
+        """
+        Build an nbclient hook that snapshots each executed cell.
+
+        Snapshots run through a second client on the same kernel between
+        cells, so nothing is added to the notebook itself. Pass the hook as
+        on_cell_executed and its start() as on_notebook_start; both are
+        coroutines awaited on nbclient's event loop. Call close() on the
+        hook when the run ends.
+
+        Args:
+            km: AsyncKernelManager of the kernel executing the prepared notebook
+
+        Returns:
+            Hook accepting nbclient's (cell, cell_index, execute_reply) kwargs
+        """
+        return _SnapshotHook(self, km)
+
+    def finalize(self, output_path: Path) -> list[list[dict[str, Any]]]:
+        """
+        Put original sources and cached outputs back into the output notebook.
+
+        Returns:
+            Cached outputs of each skipped cell, in notebook order
+        """
+        output_path = Path(output_path)
+        if not output_path.exists():
+            return []
+        nb = nbformat.read(str(output_path), as_version=4)
+        restored = []
+        for cell in nb.cells:
+            entry = cell.metadata.pop(_METADATA_KEY, None)
+            if entry is None or not entry.get('hit'):
+                continue
+            cell.source = entry['source']
+            try:
+                with open(self._path(entry['key'], '.json')) as f:
+                    cached = json.load(f)
+            except (OSError, ValueError):
+                continue
+            cell.outputs = [nbformat.from_dict(output) for output in cached['outputs']]
+            cell.execution_count = cached['execution_count']
+            restored.append(cached['outputs'])
+        nbformat.write(nb, str(output_path))
+        return restored
+
+    def evict(self) -> int:
+        """
+        Remove least-recently-used entries until under max_bytes.
+
+        Returns:
+            Number of entries removed
+        """
+        entries: dict[str, list[Any]] = {}
+        for path in self.cache_dir.iterdir():
+            if path.suffix not in ('.pkl', '.json'):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entry = entries.setdefault(path.stem, [0, 0, []])
+            entry[0] = max(entry[0], stat.st_mtime_ns)
+            entry[1] += stat.st_size
+            entry[2].append(path)
+
+        total = sum(size for _, size, _ in entries.values())
+        removed = 0
+        for _, size, paths in sorted(entries.values(), key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            for path in paths:
+                path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def _path(self, key: str, suffix: str) -> Path:
+        return self.cache_dir / f"{key}{suffix}"
+
+    def _has(self, key: str) -> bool:
+        return self._path(key, '.pkl').exists() and self._path(key, '.json').exists()
+
+    def _touch(self, key: str) -> None:
+        for suffix in ('.pkl', '.json'):
+            try:
+                os.utime(self._path(key, suffix))
+            except OSError:
+                pass
+
+    def _write_outputs(self, key: str, cell: Any) -> None:
+        path = self._path(key, '.json')
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=f".{key}.", suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'outputs': cell.get('outputs', []), 'execution_count': cell.get('execution_count')}, f)
+            os.replace(tmp, path)
+        except OSError:
+            # Concurrent runs write identical outputs for a key; losing the race is harmless
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+
+class _SnapshotHook:
+    """on_cell_executed hook that snapshots each executed cell into a CellCache.
+
+    The client is asynchronous and created on nbclient's event loop: a
+    blocking client would wait for replies on a loop that cannot run while
+    the hook blocks it. It also gets its own session id, since the kernel
+    routes shell replies by session and would otherwise hand nbclient's
+    replies to this client.
+    """
+
+    def __init__(self, cache: CellCache, km: Any):
+        self.cache = cache
+        self.km = km
+        self.client = None
+
+    async def start(self, **kwargs: Any) -> None:
+        """on_notebook_start hook: connect and record the starting namespace."""
+        session = self.km.session.clone()
+        session.session = str(uuid.uuid4())
+        self.client = self.km.client(session=session)
+        self.client.start_channels()
+        await self.client.wait_for_ready()
+        # Pooled kernels keep the shell between leases; start from this namespace
+        await self._snapshot(None, [], False)
+
+    async def __call__(
+        self,
+        cell: Any = None,
+        cell_index: int | None = None,
+        execute_reply: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        entry = cell.get('metadata', {}).get(_METADATA_KEY) if cell is not None else None
+        failed = execute_reply is not None and execute_reply.get('content', {}).get('status') != 'ok'
+        if entry is None or entry.get('hit') or failed:
+            # Parameters, restore cell, failed cell: baseline only
+            await self._snapshot(None, [], False)
+            return
+        key = entry['key']
+        await self._snapshot(str(self.cache._path(key, '.pkl')), entry['referenced'], entry['replay'])
+        if self.cache._path(key, '.pkl').exists():
+            self.cache._write_outputs(key, cell)
+            self.cache.evict()
+
+    def close(self) -> None:
+        if self.client is not None:
+            self.client.stop_channels()
+
+    async def _snapshot(self, path: str | None, referenced: list[str], replay: bool) -> None:
+        code = "__import__('builtins').exec({code!r}, {{'path': {path!r}, 'referenced': {referenced!r}, 'replay': {replay!r}}})".format(
+            code=_SNAPSHOT_CODE, path=path, referenced=set(referenced), replay=replay,
+        )
+        # Large namespaces can take a while to pickle, so no timeout; a kernel
+        # that dies mid-snapshot (e.g. OOM) would otherwise never reply
+        reply = asyncio.ensure_future(self.client.execute_interactive(
+            code, silent=True, store_history=False, output_hook=lambda msg: None,
+        ))
+        while not (await asyncio.wait({reply}, timeout=_SNAPSHOT_POLL_SECONDS))[0]:
+            if not await self.km.is_alive():
+                reply.cancel()
+                raise DeadKernelError("Kernel died while snapshotting a cell for the cell cache")
+        reply.result()
+
+
+def _analyze_cell(source: str) -> dict[str, Any] | None:
+    """Names, string literals and definition-only flag of a cell, or None."""
+    try:
+        tree = ast.parse(_MAGIC_LINE_RE.sub('', source))
+    except SyntaxError:
+        return None
+    names = set()
+    literals = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            names.add(node.id)
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+            literals.append(node.value)
+    return {
+        'referenced': sorted(names),
+        'literals': literals,
+        'replay': all(isinstance(node, _DEFINITION_NODES) for node in tree.body),
+    }
+
+
+def _cell_key(previous: str, source: str, analysis: dict[str, Any], parameters: dict[str, Any]) -> str:
+    """Chain the previous key with everything this cell's result depends on."""
+    read = {name: parameters[name] for name in analysis['referenced'] if name in parameters}
+    files = {}
+    for value in list(analysis['literals']) + [v for v in read.values() if isinstance(v, str)]:
+        if len(value) < 4096 and os.path.isfile(value):
+            fingerprint = file_fingerprint(value)
+            files[value] = [fingerprint['size'], fingerprint['mtime_ns']]
+    payload = json.dumps([previous, source, read, files], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
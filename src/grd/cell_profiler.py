@@ -0,0 +1,166 @@
+"""Cell-level execution profiling for notebook experiments.
+
+CellProfiler hooks into nbclient's per-cell callbacks and measures, for
+every executed cell:
+- wall time
+- kernel CPU time (user + system, including live child processes such as
+  DataLoader workers)
+- peak RSS of the kernel process tree, sampled in a background thread
+- size of the cell's outputs
+
+Results are written to run_dir/profile.json and summarized as a ranked list
+of the slowest cells. CPU and memory need psutil; without it only wall time
+and output size are recorded.
+"""
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, TypedDict
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+# Seconds between RSS samples while a cell runs
+SAMPLE_INTERVAL_SECONDS = 0.05
+
+
+class CellProfile(TypedDict):
+    """Resource usage of one executed cell."""
+    cell_index: int
+    source_preview: str
+    wall_seconds: float
+    cpu_seconds: float | None
+    peak_rss_mb: float | None
+    output_bytes: int
+
+
+class CellProfiler:
+    """
+    Measure per-cell wall time, CPU time, peak RSS and output size.
+
+    Attributes:
+        pid: Kernel process id (None disables CPU/RSS measurement)
+        cells: CellProfile per executed cell, in execution order
+
+    Example:
+        >>> profiler = CellProfiler(kernel_pid)
+        >>> pm.execute_notebook(..., on_cell_execute=profiler.on_cell_start,
+        ...                     on_cell_executed=profiler.on_cell_end)
+        >>> profiler.stop()
+        >>> profiler.write(run_dir / "profile.json")
+        >>> print(profiler.slowest(3))
+    """
+
+    def __init__(self, pid: int | None, interval: float = SAMPLE_INTERVAL_SECONDS):
+        self.pid = pid
+        self.interval = interval
+        self.cells: list[CellProfile] = []
+        self._process = None
+        if PSUTIL_AVAILABLE and pid is not None:
+            try:
+                self._process = psutil.Process(pid)
+            except psutil.Error:
+                self._process = None
+        self._lock = threading.Lock()
+        self._peak_rss = 0
+        self._started: tuple[float, float | None] | None = None
+        self._stop = threading.Event()
+        self._sampler: threading.Thread | None = None
+        if self._process is not None:
+            self._sampler = threading.Thread(target=self._sample, daemon=True)
+            self._sampler.start()
+
+    def on_cell_start(self, cell: Any = None, cell_index: int | None = None, **kwargs: Any) -> None:
+        """nbclient on_cell_execute hook."""
+        with self._lock:
+            self._peak_rss = self._rss() or 0
+        self._started = (time.perf_counter(), self._cpu())
+
+    def on_cell_end(self, cell: Any = None, cell_index: int | None = None, **kwargs: Any) -> None:
+        """nbclient on_cell_executed hook."""
+        if self._started is None:
+            return
+        wall_start, cpu_start = self._started
+        self._started = None
+        wall = time.perf_counter() - wall_start
+        cpu_end = self._cpu()
+        with self._lock:
+            peak = max(self._peak_rss, self._rss() or 0)
+
+        source = cell.get('source', '') if cell is not None else ''
+        outputs = cell.get('outputs', []) if cell is not None else []
+        self.cells.append(CellProfile(
+            cell_index=cell_index if cell_index is not None else len(self.cells),
+            source_preview=source.strip().split('\n', 1)[0][:80],
+            wall_seconds=round(wall, 4),
+            cpu_seconds=round(cpu_end - cpu_start, 4) if cpu_start is not None and cpu_end is not None else None,
+            peak_rss_mb=round(peak / (1024 ** 2), 1) if self._process is not None else None,
+            output_bytes=len(json.dumps(outputs, default=str).encode()),
+        ))
+
+    def stop(self) -> None:
+        """Stop the background RSS sampler."""
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join(timeout=1)
+
+    def slowest(self, n: int = 5) -> list[CellProfile]:
+        """Cells ranked by wall time, slowest first."""
+        return sorted(self.cells, key=lambda cell: cell['wall_seconds'], reverse=True)[:n]
+
+    def write(self, path: Path) -> None:
+        """Write every cell profile plus totals to a JSON file."""
+        report = {
+            'kernel_pid': self.pid,
+            'sample_interval_seconds': self.interval,
+            'total_wall_seconds': round(sum(cell['wall_seconds'] for cell in self.cells), 4),
+            'peak_rss_mb': max((cell['peak_rss_mb'] or 0 for cell in self.cells), default=None),
+            'cells': self.cells,
+        }
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            rss = self._rss()
+            if rss is None:
+                return  # Kernel exited
+            with self._lock:
+                self._peak_rss = max(self._peak_rss, rss)
+
+    def _processes(self) -> list[Any]:
+        return [self._process] + self._process.children(recursive=True)
+
+    def _rss(self) -> int | None:
+        if self._process is None:
+            return None
+        try:
+            total = 0
+            for process in self._processes():
+                try:
+                    total += process.memory_info().rss
+                except psutil.NoSuchProcess:
+                    continue  # Child exited between listing and reading
+            return total
+        except psutil.Error:
+            return None
+
+    def _cpu(self) -> float | None:
+        if self._process is None:
+            return None
+        try:
+            total = 0.0
+            for process in self._processes():
+                try:
+                    times = process.cpu_times()
+                except psutil.NoSuchProcess:
+                    continue
+                total += times.user + times.system
+            return total
+        except psutil.Error:
+            return None
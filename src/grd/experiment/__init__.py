@@ -1,5 +1,5 @@
 """GRD experiment management for long-running ML experiments."""
 from .timeout_manager import ExperimentTimeoutManager
-from .checkpoint_handler import CheckpointHandler
+from .checkpoint_handler import CheckpointHandler, run_checkpoint_dir
 
-__all__ = ['ExperimentTimeoutManager', 'CheckpointHandler']
+__all__ = ['ExperimentTimeoutManager', 'CheckpointHandler', 'run_checkpoint_dir']
@@ -5,13 +5,68 @@ support. When training is interrupted (SIGINT/SIGTERM), the handler saves a
 checkpoint before termination, allowing experiments to resume from the last
 saved state.
 
+Writes are atomic (temp file + fsync + rename), so a crash mid-save never
+leaves a truncated checkpoint. With async_save=True, state is copied to CPU
+memory and written by a background thread while training continues.
+
+With sharded=True, each checkpoint is a JSON manifest plus content-hashed
+shards shared across epochs (checkpoint_shards.py), so unchanged tensors
+are written once.
+
+Resuming does not have to materialize a whole checkpoint:
+read_checkpoint_header() answers epoch/loss/metadata from the index, and
+load_checkpoint(mmap=True) memory-maps tensor data.
+
+An optional retention policy (keep last K, best K by loss, every Nth epoch,
+total byte budget) prunes old epoch files in the background, and saves can
+be checked against free disk space before they start (min_free_gb).
+
 Pattern 7 from RESEARCH.md: Signal handlers for graceful shutdown.
 Pattern 4 from RESEARCH.md: Checkpoint-resume for long training.
 """
+import copy
+import errno
+import json
+import logging
+import os
+import re
+import shutil
 import signal
 import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait as futures_wait
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+from ..hardware.profiler import _capture_disk_info
+from .checkpoint_shards import (
+    collect_garbage,
+    read_sharded,
+    read_skeleton,
+    referenced_shards,
+    write_sharded,
+)
+
+logger = logging.getLogger(__name__)
+
+# Per-epoch loss and size, so retention never has to open a checkpoint
+INDEX_FILENAME = "checkpoint_index.json"
+
+# Shards shared by every sharded checkpoint in the directory
+SHARD_DIRNAME = "shards"
+
+# Directory listings are cached only once the directory has been unchanged
+# this long, so a change within the same mtime tick is never missed
+_LISTING_SETTLE_NS = 1_000_000_000
+
+_EPOCH_FILE_RE = re.compile(r"^checkpoint_epoch_(\d+)\.(pt|manifest\.json)$")
+
+# Where execute_notebook_experiment keeps a run's checkpoints across retry
+# attempts: set in the kernel's environment, and injected as a parameter
+# only when the notebook's parameters cell declares it
+CHECKPOINT_DIR_ENV = "GRD_CHECKPOINT_DIR"
+CHECKPOINT_DIR_PARAMETER = "grd_checkpoint_dir"
 
 
 class CheckpointHandler:
@@ -23,10 +78,27 @@ class CheckpointHandler:
 
     Checkpoints are saved in two formats:
     - checkpoint_epoch_{N}.pt: Versioned checkpoint for specific epoch
-    - checkpoint_latest.pt: Latest checkpoint for easy resume
+    - checkpoint_latest.pt: Hard link to the newest epoch file for easy
+      resume (a copy where the filesystem has no hard links)
+
+    Sharded checkpoints use checkpoint_epoch_{N}.manifest.json and
+    checkpoint_latest.manifest.json instead, plus the shared shards/
+    directory.
+
+    Retention: with no policy every epoch file is kept. When keep_last,
+    keep_best or keep_every is set, an epoch file survives if any of them
+    selects it; max_total_bytes then drops the oldest survivors until the
+    directory fits. The newest and the best checkpoint are never pruned.
 
     Attributes:
         checkpoint_dir: Directory for storing checkpoints
+        async_save: Whether save_checkpoint() writes in the background
+        sharded: Whether checkpoints use the sharded, deduplicated format
+        keep_last: Keep the K most recent epochs
+        keep_best: Keep the K epochs with the lowest loss
+        keep_every: Keep every Nth epoch (epoch % N == 0)
+        max_total_bytes: Byte budget for all epoch files
+        min_free_gb: Free disk space to leave after each save (None: no check)
         interrupted: Flag set when shutdown signal received
         _signal_handlers_registered: Whether handlers are active
 
@@ -43,17 +115,55 @@ class CheckpointHandler:
         5
     """
 
-    def __init__(self, checkpoint_dir: Path):
+    def __init__(
+        self,
+        checkpoint_dir: Path,
+        async_save: bool = False,
+        sharded: bool = False,
+        keep_last: Optional[int] = None,
+        keep_best: Optional[int] = None,
+        keep_every: Optional[int] = None,
+        max_total_bytes: Optional[int] = None,
+        min_free_gb: Optional[float] = None
+    ):
         """Initialize checkpoint handler.
 
         Args:
             checkpoint_dir: Directory for storing checkpoints (created if needed)
+            async_save: If True, save_checkpoint() snapshots state to CPU
+                memory and returns immediately; a background thread writes
+                it. Call wait() before reading checkpoints back.
+            sharded: If True, write a manifest plus content-hashed shards;
+                tensors identical to an earlier epoch's are not rewritten.
+            keep_last: Keep the K most recent epoch files
+            keep_best: Keep the K epoch files with the lowest loss
+            keep_every: Keep every Nth epoch file
+            max_total_bytes: Prune oldest epoch files beyond this budget
+            min_free_gb: Disk space that must remain free after a save
+                (default: None, no check). When short, a handler with a
+                retention policy first prunes down to the newest and best
+                checkpoints; a save that still does not fit raises OSError.
 
         Example:
             >>> ch = CheckpointHandler(Path("experiments/run_001/checkpoints"))
+            >>> ch = CheckpointHandler(Path("checkpoints"), keep_last=3, keep_best=1,
+            ...                        max_total_bytes=50 * 1024**3)
         """
         self.checkpoint_dir = Path(checkpoint_dir)
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        self.async_save = async_save
+        self.sharded = sharded
+        self.keep_last = keep_last
+        self.keep_best = keep_best
+        self.keep_every = keep_every
+        self.max_total_bytes = max_total_bytes
+        self.min_free_gb = min_free_gb
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._pending: list[Future] = []
+        self._pruner: Optional[ThreadPoolExecutor] = None
+        self._prune_future: Optional[Future] = None
+        self._index_lock = threading.Lock()
+        self._listing: Optional[tuple] = None
         self.interrupted = False
         self._signal_handlers_registered = False
         self._setup_signal_handlers()
@@ -97,7 +207,19 @@ class CheckpointHandler:
         """Save complete training state for resumability.
 
         Creates checkpoint dict with epoch, model_state, optimizer_state, loss,
-        and metadata. Saves as both checkpoint_epoch_{N}.pt and checkpoint_latest.pt.
+        and metadata. Saves checkpoint_epoch_{N}.pt and points
+        checkpoint_latest.pt at it.
+
+        In async mode the state is first copied to CPU memory (tensors are
+        detached and copied, so training may keep updating the originals),
+        then written in the background. At most one save is in flight: a
+        new save waits for the previous write to finish.
+
+        With min_free_gb set, free disk space is checked first against the
+        size of the previous checkpoint plus min_free_gb. If it is short and
+        a retention policy is set, old epoch files are pruned down to the
+        newest and best ones; if it is still short, the save is refused and
+        the previous checkpoint kept.
 
         Args:
             epoch: Current epoch number
@@ -107,11 +229,17 @@ class CheckpointHandler:
             metadata: Optional metadata (run_id, timestamp, etc.)
 
         Returns:
-            Path to saved checkpoint file (checkpoint_epoch_{N}.pt)
+            Path to saved checkpoint file (checkpoint_epoch_{N}.pt); in async
+            mode the file exists once wait() returns.
+
+        Raises:
+            OSError: (ENOSPC) if min_free_gb is set and the save was refused
+                for lack of disk space
 
         Note:
-            Uses torch.save() for atomic writes. If torch is not available,
-            falls back to Python pickle (less reliable for large tensors).
+            Uses torch.save() when available, falling back to Python pickle
+            (less reliable for large tensors). Either way the file is
+            written to a temp file, fsynced and renamed into place.
 
         Example:
             >>> ch = CheckpointHandler(Path("checkpoints"))
@@ -132,31 +260,306 @@ class CheckpointHandler:
         }
 
         # Save with epoch number for versioning
-        checkpoint_path = self.checkpoint_dir / f"checkpoint_epoch_{epoch}.pt"
+        suffix = ".manifest.json" if self.sharded else ".pt"
+        checkpoint_path = self.checkpoint_dir / f"checkpoint_epoch_{epoch}{suffix}"
+
+        self._ensure_disk_space()
+
+        if not self.async_save:
+            self._write_checkpoint(checkpoint, checkpoint_path)
+        else:
+            # One save in flight bounds host memory to a single extra copy
+            self.wait()
+            snapshot = _snapshot_to_cpu(checkpoint)
+            self._submit(self._write_checkpoint, snapshot, checkpoint_path)
+
+        if self._has_retention_policy():
+            # Pruning runs on its own thread and never delays a save
+            self._schedule_prune()
+        return checkpoint_path
+
+    def wait(self) -> None:
+        """Block until the pending asynchronous save is on disk.
 
-        # Try torch.save first (preferred for PyTorch models)
+        Raises:
+            Exception: Whatever the background write raised (e.g. OSError
+                when the disk is full)
+
+        Example:
+            >>> ch = CheckpointHandler(Path("checkpoints"), async_save=True)
+            >>> ch.save_checkpoint(epoch, model.state_dict(), opt.state_dict(), loss)
+            >>> # ... next epoch trains while the checkpoint is written ...
+            >>> ch.wait()
+        """
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+    def close(self) -> None:
+        """Finish pending writes and stop the background writer and pruner."""
         try:
-            import torch
-            torch.save(checkpoint, checkpoint_path)
-            # Also save as "latest" for easy resume
-            latest_path = self.checkpoint_dir / "checkpoint_latest.pt"
-            torch.save(checkpoint, latest_path)
-        except ImportError:
-            # Fallback to pickle if torch not available
-            import pickle
-            with open(checkpoint_path, 'wb') as f:
-                pickle.dump(checkpoint, f)
-            latest_path = self.checkpoint_dir / "checkpoint_latest.pt"
-            with open(latest_path, 'wb') as f:
-                pickle.dump(checkpoint, f)
+            self.wait()
+        finally:
+            if self._writer is not None:
+                self._writer.shutdown(wait=True)
+                self._writer = None
+            if self._pruner is not None:
+                self._pruner.shutdown(wait=True)
+                self._pruner = None
 
-        return checkpoint_path
+    def prune(self, emergency: bool = False) -> list[Path]:
+        """Delete epoch files the retention policy no longer keeps.
+
+        Called in the background after each save when a policy is set; safe
+        to call directly.
 
-    def load_checkpoint(self) -> Optional[dict]:
+        Args:
+            emergency: Keep only the newest and the best checkpoint
+
+        Returns:
+            Paths of deleted checkpoint files
+
+        Example:
+            >>> ch = CheckpointHandler(Path("checkpoints"), keep_last=2)
+            >>> removed = ch.prune()
+        """
+        with self._index_lock:
+            entries = self._list_checkpoints()
+            if not entries:
+                return []
+            keep = self._retained_epochs(entries, emergency)
+            removed = []
+            for entry in entries:
+                if entry["epoch"] not in keep:
+                    entry["path"].unlink(missing_ok=True)
+                    removed.append(entry["path"])
+            if removed:
+                index = self._read_index()
+                for entry in entries:
+                    if entry["epoch"] not in keep:
+                        index.pop(str(entry["epoch"]), None)
+                self._write_index(index)
+                # Shards survive while any remaining manifest uses them
+                live = referenced_shards(list(self.checkpoint_dir.glob("*.manifest.json")))
+                collect_garbage(self.checkpoint_dir / SHARD_DIRNAME, live)
+        return removed
+
+    def _retained_epochs(self, entries: list[dict], emergency: bool) -> set:
+        """Epochs to keep; entries are sorted oldest first."""
+        latest = entries[-1]["epoch"]
+        scored = sorted((e for e in entries if e["loss"] is not None), key=lambda e: e["loss"])
+        protected = {latest} | ({scored[0]["epoch"]} if scored else set())
+        if emergency:
+            return protected
+
+        if self.keep_last is None and self.keep_best is None and self.keep_every is None:
+            keep = {e["epoch"] for e in entries}
+        else:
+            keep = set(protected)
+            if self.keep_last:
+                keep.update(e["epoch"] for e in entries[-self.keep_last:])
+            if self.keep_best:
+                keep.update(e["epoch"] for e in scored[:self.keep_best])
+            if self.keep_every:
+                keep.update(e["epoch"] for e in entries if e["epoch"] % self.keep_every == 0)
+
+        if self.max_total_bytes is not None:
+            total = sum(e["bytes"] for e in entries if e["epoch"] in keep)
+            for entry in entries:
+                if total <= self.max_total_bytes:
+                    break
+                if entry["epoch"] in keep and entry["epoch"] not in protected:
+                    keep.discard(entry["epoch"])
+                    total -= entry["bytes"]
+        return keep
+
+    def _has_retention_policy(self) -> bool:
+        return any(
+            rule is not None
+            for rule in (self.keep_last, self.keep_best, self.keep_every, self.max_total_bytes)
+        )
+
+    def _ensure_disk_space(self) -> None:
+        """Check free space for the next save, pruning in an emergency.
+
+        Raises:
+            OSError: (ENOSPC) if the save does not fit
+        """
+        if self.min_free_gb is None:
+            return
+        with self._index_lock:
+            sizes = [entry.get("bytes", 0) for entry in self._read_index().values()]
+        needed_gb = (sizes[-1] if sizes else 0) / (1024**3) + self.min_free_gb
+
+        disk = _capture_disk_info(str(self.checkpoint_dir))
+        if disk["total_gb"] == 0 or disk["free_gb"] >= needed_gb:
+            return  # Enough space, or psutil unavailable
+
+        if self._has_retention_policy():
+            # Only handlers that opted into deleting checkpoints prune here
+            logger.warning(
+                f"Only {disk['free_gb']:.1f} GB free for checkpoints (need {needed_gb:.1f} GB); "
+                "pruning to the newest and best checkpoints"
+            )
+            self.wait()
+            self.prune(emergency=True)
+            disk = _capture_disk_info(str(self.checkpoint_dir))
+            if disk["free_gb"] >= needed_gb:
+                return
+        raise OSError(
+            errno.ENOSPC,
+            f"Checkpoint save refused: {disk['free_gb']:.1f} GB free in {self.checkpoint_dir}, "
+            f"need {needed_gb:.1f} GB. The previous checkpoint is kept.",
+        )
+
+    def _schedule_prune(self) -> None:
+        """Prune on the pruner thread once the writes queued so far finish.
+
+        Pruning never joins _pending, so the next save's wait() does not
+        block on it. A round is skipped while the previous one is still
+        queued or running; the next save schedules another.
+        """
+        if self._prune_future is not None and not self._prune_future.done():
+            return
+        if self._pruner is None:
+            self._pruner = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint-pruner")
+        self._prune_future = self._pruner.submit(self._prune_after, list(self._pending))
+
+    def _prune_after(self, writes: list[Future]) -> None:
+        futures_wait(writes)
+        try:
+            self.prune()
+        except OSError as e:
+            logger.warning(f"Background checkpoint pruning failed: {e}")
+
+    def _submit(self, fn, *args) -> None:
+        """Queue work on the single background writer thread."""
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint-writer")
+        self._pending.append(self._writer.submit(fn, *args))
+
+    def _list_checkpoints(self) -> list[dict]:
+        """Epoch files on disk, oldest first, with loss and size from the index."""
+        index = self._read_index()
+        entries = []
+        for epoch, path in self._epoch_files():
+            recorded = index.get(str(epoch), {})
+            if "bytes" in recorded:
+                size = recorded["bytes"]  # Sharded: manifest plus new shards
+            else:
+                try:
+                    size = path.stat().st_size
+                except OSError:
+                    continue
+            entries.append({"epoch": epoch, "path": path, "loss": recorded.get("loss"), "bytes": size})
+        return entries
+
+    def _epoch_files(self) -> list[tuple]:
+        """(epoch, path) of every epoch checkpoint in either format, oldest first.
+
+        Cached against the directory mtime, so repeated calls (hints, retention)
+        cost one stat() instead of a directory scan.
+        """
+        try:
+            stamp = self.checkpoint_dir.stat().st_mtime_ns
+        except OSError:
+            return []
+        if self._listing is not None and self._listing[0] == stamp:
+            return list(self._listing[1])
+
+        files = []
+        for path in self.checkpoint_dir.iterdir():
+            match = _EPOCH_FILE_RE.match(path.name)
+            if match:
+                files.append((int(match.group(1)), path))
+        files.sort(key=lambda item: item[0])
+        if time.time_ns() - stamp > _LISTING_SETTLE_NS:
+            self._listing = (stamp, files)
+        return list(files)
+
+    def _read_index(self) -> dict:
+        try:
+            with open(self.checkpoint_dir / INDEX_FILENAME) as f:
+                return json.load(f)["checkpoints"]
+        except (OSError, ValueError, KeyError):
+            return {}
+
+    def _write_index(self, index: dict) -> None:
+        path = self.checkpoint_dir / INDEX_FILENAME
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"checkpoints": index}, f, indent=2)
+        os.replace(tmp_path, path)
+
+    def _record(self, checkpoint: dict, checkpoint_path: Path, size: int) -> None:
+        """Add a written checkpoint to the index."""
+        try:
+            loss = float(checkpoint.get("loss"))
+        except (TypeError, ValueError):
+            loss = None
+        with self._index_lock:
+            index = self._read_index()
+            index[str(checkpoint["epoch"])] = {
+                "file": checkpoint_path.name,
+                "loss": loss,
+                "bytes": size,
+                # Stringified where needed, so headers never need the payload
+                "metadata": json.loads(json.dumps(checkpoint.get("metadata") or {}, default=str)),
+            }
+            # Keep epochs in order so the last entry is the newest
+            self._write_index(dict(sorted(index.items(), key=lambda item: int(item[0]))))
+
+    def _write_checkpoint(self, checkpoint: dict, checkpoint_path: Path) -> None:
+        """Atomically write an epoch checkpoint and repoint the latest pointer."""
+        if self.sharded:
+            # Held so a concurrent prune can't collect shards this manifest reuses
+            with self._index_lock:
+                size = write_sharded(checkpoint, checkpoint_path, self.checkpoint_dir / SHARD_DIRNAME)
+            latest_name = "checkpoint_latest.manifest.json"
+        else:
+            tmp_path = checkpoint_path.with_name(f".{checkpoint_path.name}.tmp")
+            with open(tmp_path, 'wb') as f:
+                # Try torch.save first (preferred for PyTorch models)
+                try:
+                    import torch
+                    torch.save(checkpoint, f)
+                except ImportError:
+                    # Fallback to pickle if torch not available
+                    import pickle
+                    pickle.dump(checkpoint, f, protocol=pickle.HIGHEST_PROTOCOL)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, checkpoint_path)
+            size = checkpoint_path.stat().st_size
+            latest_name = "checkpoint_latest.pt"
+
+        # "latest" is a second name for the same file, not a second copy
+        latest_path = self.checkpoint_dir / latest_name
+        tmp_latest = self.checkpoint_dir / f".{latest_name}.tmp"
+        tmp_latest.unlink(missing_ok=True)
+        try:
+            os.link(checkpoint_path, tmp_latest)
+        except OSError:
+            shutil.copyfile(checkpoint_path, tmp_latest)
+        os.replace(tmp_latest, latest_path)
+        _fsync_dir(self.checkpoint_dir)
+        self._record(checkpoint, checkpoint_path, size)
+
+    def load_checkpoint(self, mmap: bool = False) -> Optional[dict]:
         """Load checkpoint for training resumption.
 
-        Loads checkpoint_latest.pt if exists. Returns dict with epoch,
-        model_state, optimizer_state, loss, and metadata.
+        Loads checkpoint_latest.pt (or, for sharded checkpoints,
+        checkpoint_latest.manifest.json with shards read in parallel) if it
+        exists. Returns dict with epoch, model_state, optimizer_state, loss,
+        and metadata.
+
+        Args:
+            mmap: Memory-map tensor data instead of reading it into RAM
+                (torch.load(mmap=True) for .pt files, torch >= 2.1; mapped
+                .npy/.pt shards for sharded checkpoints). Pages are read on
+                first use, so resuming needs about one copy of the model in
+                memory rather than two. Pickle checkpoints written without
+                torch are always read in full.
 
         Returns:
             Checkpoint dict if checkpoint exists, None otherwise
@@ -169,19 +572,90 @@ class CheckpointHandler:
             ...     model.load_state_dict(loaded['model_state'])
             ...     optimizer.load_state_dict(loaded['optimizer_state'])
         """
-        latest_path = self.checkpoint_dir / "checkpoint_latest.pt"
-
-        if not latest_path.exists():
+        self.wait()
+        latest_paths = [
+            path for path in (
+                self.checkpoint_dir / "checkpoint_latest.pt",
+                self.checkpoint_dir / "checkpoint_latest.manifest.json",
+            )
+            if path.exists()
+        ]
+        if not latest_paths:
             return None  # No checkpoint to resume from
 
+        # Both exist only if the format changed mid-run; newest wins
+        latest_path = max(latest_paths, key=lambda path: path.stat().st_mtime_ns)
+        return self._load_file(latest_path, mmap)
+
+    def read_checkpoint_header(self, epoch: Optional[int] = None) -> Optional[dict]:
+        """Read epoch, loss and metadata of a checkpoint without its payload.
+
+        Answered from checkpoint_index.json; checkpoints written before the
+        index existed fall back to the sharded skeleton or a memory-mapped
+        load.
+
+        Args:
+            epoch: Epoch to describe (default: the latest)
+
+        Returns:
+            Dict with epoch, loss, metadata, checkpoint_path and bytes, or
+            None if there is no such checkpoint
+
+        Example:
+            >>> ch = CheckpointHandler(Path("checkpoints"))
+            >>> header = ch.read_checkpoint_header()
+            >>> if header and header["epoch"] >= num_epochs:
+            ...     print("Training already finished")
+        """
+        self.wait()
+        files = dict(self._epoch_files())
+        if epoch is None:
+            epoch = max(files, default=None)
+        if epoch not in files:
+            return None
+        path = files[epoch]
+
+        with self._index_lock:
+            recorded = self._read_index().get(str(epoch))
+        if recorded is not None and recorded.get("file") == path.name and "metadata" in recorded:
+            return {
+                "epoch": epoch,
+                "loss": recorded["loss"],
+                "metadata": recorded["metadata"],
+                "checkpoint_path": str(path),
+                "bytes": recorded["bytes"],
+            }
+
+        if path.name.endswith(".manifest.json"):
+            checkpoint = read_skeleton(path, self.checkpoint_dir / SHARD_DIRNAME)
+        else:
+            checkpoint = self._load_file(path, mmap=True)
+        return {
+            "epoch": checkpoint.get("epoch", epoch),
+            "loss": checkpoint.get("loss"),
+            "metadata": checkpoint.get("metadata", {}),
+            "checkpoint_path": str(path),
+            "bytes": path.stat().st_size,
+        }
+
+    def _load_file(self, path: Path, mmap: bool = False) -> dict:
+        """Load one checkpoint file in either format."""
+        if path.name.endswith(".manifest.json"):
+            return read_sharded(path, self.checkpoint_dir / SHARD_DIRNAME, mmap=mmap)
+
         # Try torch.load first (preferred for PyTorch models)
         try:
             import torch
-            checkpoint = torch.load(latest_path)
+            if mmap:
+                try:
+                    return torch.load(path, mmap=True, map_location="cpu")
+                except TypeError:
+                    pass  # torch < 2.1 has no mmap
+            checkpoint = torch.load(path)
         except ImportError:
             # Fallback to pickle if torch not available
             import pickle
-            with open(latest_path, 'rb') as f:
+            with open(path, 'rb') as f:
                 checkpoint = pickle.load(f)
 
         return checkpoint
@@ -189,8 +663,8 @@ class CheckpointHandler:
     def find_latest_checkpoint(self) -> Optional[Path]:
         """Find most recent checkpoint by epoch number.
 
-        Searches for checkpoint_epoch_*.pt files and returns the one with
-        the highest epoch number.
+        Searches for checkpoint_epoch_* files (.pt or sharded manifests) and
+        returns the one with the highest epoch number.
 
         Returns:
             Path to latest checkpoint, or None if no checkpoints exist
@@ -201,13 +675,10 @@ class CheckpointHandler:
             >>> if latest:
             ...     print(f"Found checkpoint: {latest.name}")
         """
-        checkpoints = list(self.checkpoint_dir.glob("checkpoint_epoch_*.pt"))
+        checkpoints = self._epoch_files()
         if not checkpoints:
             return None
-
-        # Sort by epoch number (extract from filename)
-        checkpoints.sort(key=lambda p: int(p.stem.split("_")[-1]))
-        return checkpoints[-1]
+        return checkpoints[-1][1]
 
     def check_interrupted(self) -> bool:
         """Check if training has been interrupted.
@@ -251,9 +722,9 @@ class CheckpointHandler:
             ... else:
             ...     print("No checkpoint found - starting from scratch")
         """
-        latest_checkpoint = self.find_latest_checkpoint()
+        checkpoints = self._epoch_files()
 
-        if latest_checkpoint is None:
+        if not checkpoints:
             return {
                 "has_checkpoint": False,
                 "latest_epoch": None,
@@ -261,11 +732,8 @@ class CheckpointHandler:
                 "checkpoint_count": 0,
             }
 
-        # Extract epoch from filename
-        epoch = int(latest_checkpoint.stem.split("_")[-1])
-
-        # Count all checkpoints
-        checkpoints = list(self.checkpoint_dir.glob("checkpoint_epoch_*.pt"))
+        # One directory scan yields epochs and count
+        epoch, latest_checkpoint = checkpoints[-1]
 
         return {
             "has_checkpoint": True,
@@ -273,3 +741,59 @@ class CheckpointHandler:
             "checkpoint_path": str(latest_checkpoint),
             "checkpoint_count": len(checkpoints),
         }
+
+
+def run_checkpoint_dir(default: Path = Path("checkpoints")) -> Path:
+    """Checkpoint directory of the current notebook run (call from a notebook).
+
+    Returns the grd_checkpoint_dir parameter if the notebook declares it,
+    then the GRD_CHECKPOINT_DIR environment variable set by
+    execute_notebook_experiment, then default (e.g. interactive use).
+    Pointing CheckpointHandler here lets a retried run resume from its
+    latest checkpoint.
+
+    Example:
+        >>> ch = CheckpointHandler(run_checkpoint_dir())
+        >>> checkpoint = ch.load_checkpoint()
+    """
+    main_ns = getattr(sys.modules.get("__main__"), "__dict__", {})
+    return Path(main_ns.get(CHECKPOINT_DIR_PARAMETER) or os.environ.get(CHECKPOINT_DIR_ENV) or default)
+
+
+def _snapshot_to_cpu(obj: Any) -> Any:
+    """Deep-copy checkpoint state, moving tensors to CPU memory."""
+    try:
+        import torch
+        tensor_type = torch.Tensor
+    except ImportError:
+        tensor_type = None
+    return _copy_to_cpu(obj, tensor_type)
+
+
+def _copy_to_cpu(obj: Any, tensor_type: Optional[type]) -> Any:
+    if tensor_type is not None and isinstance(obj, tensor_type):
+        return obj.detach().to('cpu', copy=True)
+    if isinstance(obj, dict):
+        # A shallow copy keeps the subclass with its state (OrderedDict
+        # order, defaultdict default_factory); values are then replaced
+        snapshot = copy.copy(obj)
+        for key, value in obj.items():
+            snapshot[key] = _copy_to_cpu(value, tensor_type)
+        return snapshot
+    if type(obj) in (list, tuple):
+        return type(obj)(_copy_to_cpu(value, tensor_type) for value in obj)
+    return copy.deepcopy(obj)
+
+
+def _fsync_dir(path: Path) -> None:
+    """Persist renames in a directory (no-op where directories can't be opened)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -0,0 +1,226 @@
+"""Sharded, content-addressed checkpoint format.
+
+A sharded checkpoint is a small JSON manifest plus shard files:
+- Every tensor/array of at least SHARD_MIN_BYTES in the checkpoint (model
+  weights, optimizer moments, ...) is stored as its own shard, named by
+  the SHA-256 of its contents, under checkpoint_dir/shards/
+- Everything else (epoch, loss, param_groups, small tensors) is pickled
+  into a "skeleton" shard in which large values are replaced by
+  {"__grd_shard__": name} placeholders (plain dicts, so skeletons unpickle
+  whichever way this package is imported)
+
+Shards are shared by all epochs, so unchanged tensors (frozen backbones,
+embedding tables) are written once and only referenced afterwards.
+Loading reads shards in parallel, or memory-maps them (mmap=True) so
+tensor data is paged in only when used. Shards no longer referenced by any
+manifest are removed by collect_garbage().
+"""
+import hashlib
+import io
+import json
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Optional
+
+MANIFEST_FORMAT = "grd-sharded-v1"
+
+# Smaller values stay inline in the skeleton shard
+SHARD_MIN_BYTES = 64 * 1024
+
+# Key of the placeholder dicts standing in for sharded values
+SHARD_REF_KEY = "__grd_shard__"
+
+
+def write_sharded(checkpoint: dict, manifest_path: Path, shard_dir: Path) -> int:
+    """Write a checkpoint as a manifest plus deduplicated shards.
+
+    Args:
+        checkpoint: Checkpoint dict (epoch, model_state, optimizer_state, ...)
+        manifest_path: Manifest file to write (atomically, last)
+        shard_dir: Shared shard directory
+
+    Returns:
+        Bytes written (new shards plus manifest); unchanged shards cost nothing
+    """
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    written = 0
+    shards: dict[str, int] = {}
+
+    def store(digest: str, suffix: str, serialize) -> str:
+        nonlocal written
+        name = digest + suffix
+        path = shard_dir / name
+        if path.exists():
+            shards[name] = path.stat().st_size
+        else:
+            # Only new content is serialized and written
+            payload = serialize()
+            _write_atomic(path, payload)
+            written += len(payload)
+            shards[name] = len(payload)
+        return name
+
+    def replace(value: Any) -> Any:
+        encoded = _encode_array(value)
+        if encoded is not None:
+            return {SHARD_REF_KEY: store(*encoded)}
+        if isinstance(value, dict):
+            return value.__class__((key, replace(item)) for key, item in value.items())
+        if type(value) in (list, tuple):
+            return type(value)(replace(item) for item in value)
+        return value
+
+    skeleton = pickle.dumps(replace(checkpoint), protocol=pickle.HIGHEST_PROTOCOL)
+    skeleton_name = store(hashlib.sha256(skeleton).hexdigest(), ".pkl", lambda: skeleton)
+
+    manifest = json.dumps({
+        "format": MANIFEST_FORMAT,
+        "epoch": checkpoint.get("epoch"),
+        "skeleton": skeleton_name,
+        "shards": shards,
+    }, indent=2).encode()
+    _write_atomic(manifest_path, manifest)
+    return written + len(manifest)
+
+
+def read_manifest(manifest_path: Path) -> dict:
+    """Parse a manifest (cheap: no shard is read)."""
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    if manifest.get("format") != MANIFEST_FORMAT:
+        raise ValueError(f"{manifest_path} is not a {MANIFEST_FORMAT} manifest")
+    return manifest
+
+
+def read_sharded(manifest_path: Path, shard_dir: Path, max_workers: int = 8, mmap: bool = False) -> dict:
+    """Load a sharded checkpoint, reading shards in parallel.
+
+    Args:
+        manifest_path: Manifest written by write_sharded()
+        shard_dir: Shared shard directory
+        max_workers: Concurrent shard reads
+        mmap: Memory-map array shards instead of reading them (copy-on-write,
+            so loaded arrays may still be modified in memory)
+
+    Returns:
+        The checkpoint dict as it was saved
+    """
+    manifest = read_manifest(manifest_path)
+    skeleton = read_skeleton(manifest_path, shard_dir)
+    names = [name for name in manifest["shards"] if name != manifest["skeleton"]]
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(names) or 1))) as pool:
+        values = dict(zip(names, pool.map(lambda name: load_shard(shard_dir / name, mmap), names)))
+    return resolve_refs(skeleton, values.__getitem__)
+
+
+def read_skeleton(manifest_path: Path, shard_dir: Path) -> dict:
+    """Load only the skeleton: epoch, loss, metadata and small values.
+
+    Large values are left as placeholder dicts, so this never touches the
+    tensor payload.
+    """
+    return load_shard(shard_dir / read_manifest(manifest_path)["skeleton"])
+
+
+def resolve_refs(value: Any, lookup) -> Any:
+    """Replace shard placeholders using lookup(name)."""
+    if isinstance(value, dict):
+        if len(value) == 1 and SHARD_REF_KEY in value:
+            return lookup(value[SHARD_REF_KEY])
+        return value.__class__((key, resolve_refs(item, lookup)) for key, item in value.items())
+    if type(value) in (list, tuple):
+        return type(value)(resolve_refs(item, lookup) for item in value)
+    return value
+
+
+def load_shard(path: Path, mmap: bool = False) -> Any:
+    """Read (or with mmap, memory-map) one shard file."""
+    if path.suffix == ".npy":
+        import numpy as np
+        return np.load(path, mmap_mode="c" if mmap else None, allow_pickle=False)
+    if path.suffix == ".pt":
+        import torch
+        if mmap:
+            return torch.load(path, mmap=True, map_location="cpu")
+        return torch.load(path)
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def referenced_shards(manifest_paths: list[Path]) -> set:
+    """Names of every shard used by the given manifests."""
+    live = set()
+    for manifest_path in manifest_paths:
+        try:
+            live.update(read_manifest(manifest_path)["shards"])
+        except (OSError, ValueError, KeyError):
+            continue
+    return live
+
+
+def collect_garbage(shard_dir: Path, live: set) -> int:
+    """Delete shards not in live.
+
+    Returns:
+        Bytes freed
+    """
+    freed = 0
+    if not shard_dir.exists():
+        return freed
+    for path in shard_dir.iterdir():
+        if path.name in live or path.name.endswith(".tmp"):
+            continue
+        try:
+            freed += path.stat().st_size
+            path.unlink()
+        except OSError:
+            continue
+    return freed
+
+
+def _encode_array(value: Any) -> Optional[tuple]:
+    """(digest, suffix, serialize) for arrays big enough to shard, else None.
+
+    The digest covers dtype, shape and raw bytes, so it is computed without
+    serializing; serialize() is only called for shards not yet on disk.
+    """
+    try:
+        import numpy as np
+        if isinstance(value, np.ndarray) and value.dtype != object and value.nbytes >= SHARD_MIN_BYTES:
+            array = np.ascontiguousarray(value)
+            digest = hashlib.sha256(f"{array.dtype.str}{array.shape}".encode())
+            digest.update(memoryview(array.reshape(-1).view(np.uint8)))
+
+            def serialize() -> bytes:
+                buffer = io.BytesIO()
+                np.save(buffer, array, allow_pickle=False)
+                return buffer.getvalue()
+            return digest.hexdigest(), ".npy", serialize
+    except ImportError:
+        pass
+    try:
+        import torch
+        if isinstance(value, torch.Tensor) and value.numel() * value.element_size() >= SHARD_MIN_BYTES:
+            tensor = value.detach().cpu().contiguous()
+            digest = hashlib.sha256(f"{tensor.dtype}{tuple(tensor.shape)}".encode())
+            digest.update(memoryview(tensor.reshape(-1).view(torch.uint8).numpy()))
+
+            def serialize() -> bytes:
+                buffer = io.BytesIO()
+                torch.save(tensor, buffer)
+                return buffer.getvalue()
+            return digest.hexdigest(), ".pt", serialize
+    except ImportError:
+        pass
+    return None
+
+
+def _write_atomic(path: Path, payload: bytes) -> None:
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
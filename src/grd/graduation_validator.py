@@ -8,13 +8,77 @@ converting to production scripts. It implements a tiered validation approach:
 Per CONTEXT.md:
 - Reproducibility checks block graduation (random seeds, parameters cell)
 - Style checks warn only (hardcoded paths, magic commands)
+
+All rules are compiled once at import. Each code cell is scanned in a single
+pass: magic/shell lines are found with one multiline regex, then string
+literals and comments are located lexically so that seeds only count in
+real code and paths only count inside string literals (never in comments).
 """
+import argparse
+import bisect
+import glob
+import hashlib
+import json
+import os
 import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import nbformat
 
+from .cache import DiskCache, cache_key
+
+
+# Bump when rules or messages change to invalidate cached batch results
+GRADUATION_CACHE_VERSION = 1
+
+
+# Seed-setting calls or assignments; any match satisfies the requirement
+_SEED_RE = re.compile('|'.join([
+    r'random\.seed\s*\(',           # random.seed(42), np.random.seed(42), numpy.random.seed(42)
+    r'torch\.manual_seed\s*\(',     # torch.manual_seed(42)
+    r'tf\.random\.set_seed\s*\(',   # tf.random.set_seed(42)
+    r'random_seed\s*=',             # random_seed = 42 (parameter pattern)
+    r'seed\s*=\s*\d+',              # seed=42 as keyword arg
+]))
+
+# Hardcoded absolute paths inside string literals (common quote prefix first
+# so the engine can skip ahead to quote characters)
+_PATH_RE = re.compile(
+    r'["\'](?:(?P<users>\/Users\/)|(?P<home>\/home\/)|(?P<windows>[A-Za-z]:\\\\)|(?P<tilde>~\/))'
+    r'[^"\']+["\']'
+)
+_PATH_DESCRIPTIONS = {
+    'users': '/Users/',
+    'home': '/home/',
+    'windows': 'Windows drive path',
+    'tilde': '~/',
+}
+# Substrings every path match contains; cells without any skip the path scan
+_PATH_HINTS = ('/Users/', '/home/', ':\\', '~/')
+
+# IPython magics (%cmd, %%cmd) and shell escapes (!cmd) at the start of a line
+_LINE_MAGIC_RE = re.compile(
+    r'^[ \t]*(?:(?P<magic>%{1,2}\w+)|(?P<shell>![ \t]*\w+)).*$',
+    re.MULTILINE,
+)
+
+# String literals and comments, following the tokenizer's rules (escapes,
+# triple quotes). Prefixes such as r/f/b are left in the code text, which is
+# harmless. Scanning with one C-level regex is several times faster than
+# tokenize, which builds a Python object per token.
+_LITERAL_RE = re.compile(
+    r'(?P<comment>#[^\r\n]*)'
+    r'|(?P<string>"""(?:\\.|[^\\])*?"""'
+    r"|'''(?:\\.|[^\\])*?'''"
+    r'|"(?:\\.|[^"\\\n])*"'
+    r"|'(?:\\.|[^'\\\n])*')",
+    re.DOTALL,
+)
+
 
 def validate_graduation_requirements(notebook_path: str) -> dict[str, Any]:
     """
@@ -54,14 +118,185 @@ def validate_graduation_requirements(notebook_path: str) -> dict[str, Any]:
         ...     for warning in validation['warnings']:
         ...         print(f"  - {warning}")
     """
-    nb = nbformat.read(notebook_path, as_version=4)
+    with open(notebook_path, 'rb') as f:
+        cells = _load_cells(f.read())
+    return _validate_cells(cells)
+
+
+def validate_notebooks(
+    patterns: str | list[str],
+    workers: int | None = None,
+    cache_dir: str | None = ".planning/cache/graduation",
+) -> dict[str, Any]:
+    """
+    Validate every notebook matching directories or glob patterns.
+
+    Notebooks are validated concurrently in a process pool. Results are
+    cached by notebook content hash, so unchanged notebooks are skipped on
+    later runs regardless of path or mtime.
+
+    Args:
+        patterns: Directory, glob (e.g. "notebooks/**/*.ipynb"), or a list
+            of them. Directories are searched recursively for *.ipynb.
+        workers: Worker processes (default: CPU count; 1 runs in-process)
+        cache_dir: Directory for the result cache, or None to disable
+
+    Returns:
+        Dict with keys:
+            - notebooks: list of per-notebook results, each with path, passed,
+              errors, warnings, content_hash, cached and duration_ms
+            - summary: dict with total, passed, failed, cached and duration_ms
+
+    Example:
+        >>> report = validate_notebooks("notebooks/**/*.ipynb", workers=8)
+        >>> for result in report['notebooks']:
+        ...     if not result['passed']:
+        ...         print(result['path'], result['errors'])
+        >>> print(f"{report['summary']['failed']} notebooks blocked")
+    """
+    started = time.perf_counter()
+    paths = _expand_notebook_patterns(patterns)
+    cache = DiskCache(Path(cache_dir)) if cache_dir is not None else None
+
+    results: dict[str, dict[str, Any]] = {}
+    pending: list[tuple[str, bytes, str]] = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        content_hash = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        cached = cache.get(cache_key(GRADUATION_CACHE_VERSION, content_hash)) if cache else None
+        if cached is not None:
+            results[path] = {'path': path, **cached, 'content_hash': content_hash,
+                             'cached': True, 'duration_ms': 0.0}
+        else:
+            pending.append((path, raw, content_hash))
+
+    workers = workers or os.cpu_count() or 1
+    raws = [raw for _, raw, _ in pending]
+    if workers > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as executor:
+            outcomes = list(executor.map(_validate_raw, raws, chunksize=max(1, len(raws) // (4 * workers))))
+    else:
+        outcomes = [_validate_raw(raw) for raw in raws]
+
+    for (path, _, content_hash), (validation, duration_ms) in zip(pending, outcomes):
+        if cache is not None and validation.get('readable', True):
+            cache.put(cache_key(GRADUATION_CACHE_VERSION, content_hash), validation)
+        validation.pop('readable', None)
+        results[path] = {'path': path, **validation, 'content_hash': content_hash,
+                         'cached': False, 'duration_ms': duration_ms}
+
+    notebooks = [results[path] for path in paths]
+    passed = sum(1 for result in notebooks if result['passed'])
+    return {
+        'notebooks': notebooks,
+        'summary': {
+            'total': len(notebooks),
+            'passed': passed,
+            'failed': len(notebooks) - passed,
+            'cached': sum(1 for result in notebooks if result['cached']),
+            'duration_ms': round((time.perf_counter() - started) * 1000, 3),
+        },
+    }
+
+
+def _expand_notebook_patterns(patterns: str | list[str]) -> list[str]:
+    """Resolve directories and globs to a sorted, de-duplicated notebook list."""
+    if isinstance(patterns, str):
+        patterns = [patterns]
+    paths: set[str] = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, '**', '*.ipynb')
+        for path in glob.glob(pattern, recursive=True):
+            # Jupyter autosaves are copies, not notebooks to graduate
+            if '.ipynb_checkpoints' not in Path(path).parts and os.path.isfile(path):
+                paths.add(path)
+    return sorted(paths)
+
+
+def _validate_raw(raw: bytes) -> tuple[dict[str, Any], float]:
+    """Validate notebook bytes, timing the work (runs in pool workers)."""
+    started = time.perf_counter()
+    try:
+        validation = _validate_cells(_load_cells(raw))
+    except (ValueError, UnicodeDecodeError) as exc:
+        validation = {
+            'passed': False,
+            'errors': [f"Could not read notebook: {exc}"],
+            'warnings': [],
+            'readable': False,
+        }
+    return validation, round((time.perf_counter() - started) * 1000, 3)
+
+
+def _load_cells(raw: bytes) -> list[dict[str, Any]]:
+    """Parse notebook JSON into cells with string sources.
+
+    nbformat 4 notebooks are read as plain JSON, skipping nbformat's schema
+    validation (the bulk of the cost for small notebooks). Older formats
+    go through nbformat for conversion.
+    """
+    data = json.loads(raw)
+    if data.get('nbformat') != 4:
+        data = nbformat.reads(raw.decode('utf-8'), as_version=4)
+    cells = []
+    for cell in data.get('cells', []):
+        source = cell.get('source', '')
+        cells.append({
+            'cell_type': cell.get('cell_type'),
+            'source': ''.join(source) if isinstance(source, list) else source,
+            'tags': cell.get('metadata', {}).get('tags', []),
+        })
+    return cells
+
+
+def _validate_cells(cells: list[dict[str, Any]]) -> dict[str, Any]:
+    """Run every graduation rule over the cells in one pass."""
     errors: list[str] = []
-    warnings: list[str] = []
+    path_warnings: list[str] = []
+    magic_warnings: list[str] = []
+    shell_warnings: list[str] = []
+    has_random_seed = False
+    has_parameters_cell = False
+
+    for cell_idx, cell in enumerate(cells):
+        if 'parameters' in cell['tags']:
+            has_parameters_cell = True
+        if cell['cell_type'] != 'code':
+            continue
+
+        scan = _scan_cell(cell['source'], need_code=not has_random_seed)
+        if not has_random_seed and _SEED_RE.search(scan['code']):
+            has_random_seed = True
+
+        for match in scan['paths']:
+            description = _PATH_DESCRIPTIONS[match.lastgroup]
+            text = match.group()
+            # Truncate long paths for readability
+            truncated = text[:60] + '...' if len(text) > 60 else text
+            path_warnings.append(
+                f"Hardcoded {description} path in cell {cell_idx}: {truncated} "
+                "(use relative paths or parameters)"
+            )
+
+        for kind, line in scan['commands']:
+            # Truncate long commands
+            truncated = line[:50] + '...' if len(line) > 50 else line
+            if kind == 'magic':
+                magic_warnings.append(
+                    f"Magic command in cell {cell_idx}: {truncated} "
+                    "(remove or convert before graduation)"
+                )
+            else:
+                shell_warnings.append(
+                    f"Shell command in cell {cell_idx}: {truncated} "
+                    "(move to requirements.txt or script)"
+                )
 
     # === HARD REQUIREMENTS (errors block graduation) ===
 
     # Hard requirement 1: Random seed must be explicitly set
-    has_random_seed = _check_random_seed(nb)
     if not has_random_seed:
         errors.append(
             "Random seed not explicitly set. Must set at least one of: "
@@ -69,7 +304,6 @@ def validate_graduation_requirements(notebook_path: str) -> dict[str, Any]:
         )
 
     # Hard requirement 2: Must have parameters cell tag
-    has_parameters_cell = _check_parameters_cell(nb)
     if not has_parameters_cell:
         errors.append(
             "No cell tagged with 'parameters'. "
@@ -77,18 +311,8 @@ def validate_graduation_requirements(notebook_path: str) -> dict[str, Any]:
         )
 
     # === ADVISORY WARNINGS (don't block graduation) ===
-
-    # Advisory 1: Warn on hardcoded absolute paths
-    path_warnings = _check_hardcoded_paths(nb)
-    warnings.extend(path_warnings)
-
-    # Advisory 2: Warn on magic commands (will break in script)
-    magic_warnings = _check_magic_commands(nb)
-    warnings.extend(magic_warnings)
-
-    # Advisory 3: Warn on shell commands (will break in script)
-    shell_warnings = _check_shell_commands(nb)
-    warnings.extend(shell_warnings)
+    # Hardcoded paths, then magic commands, then shell commands
+    warnings = path_warnings + magic_warnings + shell_warnings
 
     return {
         'passed': len(errors) == 0,
@@ -97,102 +321,102 @@ def validate_graduation_requirements(notebook_path: str) -> dict[str, Any]:
     }
 
 
-def _check_random_seed(nb: nbformat.NotebookNode) -> bool:
-    """Check if random seed is explicitly set anywhere in the notebook."""
-    seed_patterns = [
-        r'random\.seed\s*\(',           # random.seed(42)
-        r'np\.random\.seed\s*\(',       # np.random.seed(42)
-        r'numpy\.random\.seed\s*\(',    # numpy.random.seed(42)
-        r'torch\.manual_seed\s*\(',     # torch.manual_seed(42)
-        r'tf\.random\.set_seed\s*\(',   # tf.random.set_seed(42)
-        r'random_seed\s*=',             # random_seed = 42 (parameter pattern)
-        r'seed\s*=\s*\d+',              # seed=42 as keyword arg
-    ]
-
-    for cell in nb.cells:
-        if cell.cell_type == 'code':
-            for pattern in seed_patterns:
-                if re.search(pattern, cell.source):
-                    return True
-    return False
-
-
-def _check_parameters_cell(nb: nbformat.NotebookNode) -> bool:
-    """Check if any cell has the 'parameters' tag."""
-    for cell in nb.cells:
-        tags = cell.metadata.get('tags', [])
-        if 'parameters' in tags:
-            return True
-    return False
-
-
-def _check_hardcoded_paths(nb: nbformat.NotebookNode) -> list[str]:
-    """Check for hardcoded absolute paths that will break across environments."""
-    warnings = []
-
-    # Patterns for common hardcoded paths
-    path_patterns = [
-        (r'["\']\/Users\/[^"\']+["\']', '/Users/'),
-        (r'["\']\/home\/[^"\']+["\']', '/home/'),
-        (r'["\'][A-Za-z]:\\\\[^"\']+["\']', 'Windows drive path'),
-        (r'["\']~\/[^"\']+["\']', '~/'),
-    ]
-
-    for cell_idx, cell in enumerate(nb.cells):
-        if cell.cell_type == 'code':
-            for pattern, description in path_patterns:
-                matches = re.findall(pattern, cell.source)
-                for match in matches:
-                    # Truncate long paths for readability
-                    truncated = match[:60] + '...' if len(match) > 60 else match
-                    warnings.append(
-                        f"Hardcoded {description} path in cell {cell_idx}: {truncated} "
-                        "(use relative paths or parameters)"
-                    )
-
-    return warnings
-
-
-def _check_magic_commands(nb: nbformat.NotebookNode) -> list[str]:
-    """Check for IPython magic commands that will break in Python scripts."""
-    warnings = []
-
-    # Pattern for magic commands at start of line
-    # Matches %command or %%command but not strings containing %
-    magic_pattern = r'^[%]{1,2}\w+'
-
-    for cell_idx, cell in enumerate(nb.cells):
-        if cell.cell_type == 'code':
-            for line in cell.source.split('\n'):
-                stripped = line.strip()
-                if re.match(magic_pattern, stripped):
-                    # Truncate long commands
-                    truncated = stripped[:50] + '...' if len(stripped) > 50 else stripped
-                    warnings.append(
-                        f"Magic command in cell {cell_idx}: {truncated} "
-                        "(remove or convert before graduation)"
-                    )
-
-    return warnings
-
-
-def _check_shell_commands(nb: nbformat.NotebookNode) -> list[str]:
-    """Check for shell commands (! prefix) that will break in Python scripts."""
-    warnings = []
-
-    # Pattern for shell commands at start of line
-    shell_pattern = r'^!\s*\w+'
-
-    for cell_idx, cell in enumerate(nb.cells):
-        if cell.cell_type == 'code':
-            for line in cell.source.split('\n'):
-                stripped = line.strip()
-                if re.match(shell_pattern, stripped):
-                    # Truncate long commands
-                    truncated = stripped[:50] + '...' if len(stripped) > 50 else stripped
-                    warnings.append(
-                        f"Shell command in cell {cell_idx}: {truncated} "
-                        "(move to requirements.txt or script)"
-                    )
-
-    return warnings
+def _scan_cell(source: str, need_code: bool = True) -> dict[str, Any]:
+    """Split one cell into code text, string-literal path matches and commands.
+
+    Args:
+        source: Cell source
+        need_code: Whether to build the code text (only needed until a seed
+            has been found)
+
+    Returns:
+        Dict with keys:
+            - code: source with magic/shell lines, strings and comments removed
+            - paths: _PATH_RE matches found inside string literals
+            - commands: (kind, stripped line) for magic/shell lines outside strings
+    """
+    # Blank magic/shell lines (same length) so offsets still line up
+    commands = []
+    pieces = []
+    last = 0
+    for match in _LINE_MAGIC_RE.finditer(source):
+        commands.append((match.start(), match.end(), match.lastgroup, match.group().strip()))
+        pieces += [source[last:match.start()], ' ' * (match.end() - match.start())]
+        last = match.end()
+    masked = ''.join(pieces) + source[last:] if pieces else source
+
+    code = _LITERAL_RE.sub(' ', masked) if need_code else ''
+    may_have_paths = any(hint in source for hint in _PATH_HINTS)
+    if not (commands or may_have_paths):
+        return {'code': code, 'paths': [], 'commands': []}
+
+    string_starts = []
+    string_ends = []
+    for match in _LITERAL_RE.finditer(masked):
+        if match.lastgroup == 'string':
+            string_starts.append(match.start())
+            string_ends.append(match.end())
+
+    def in_string(start: int, end: int) -> bool:
+        i = bisect.bisect_right(string_starts, start) - 1
+        return i >= 0 and end <= string_ends[i]
+
+    # A "%" or "!" line inside a triple-quoted string is text, not a command
+    commands = [command for command in commands if not in_string(command[0], command[0])]
+    paths = []
+    if may_have_paths:
+        paths = [match for match in _PATH_RE.finditer(masked) if in_string(match.start(), match.end())]
+        # Quoted paths in command lines (e.g. !cp "/home/...") still count
+        for line_start, line_end, _, _ in commands:
+            paths.extend(_PATH_RE.finditer(source, line_start, line_end))
+
+    return {
+        'code': code,
+        'paths': paths,
+        'commands': [(kind, line) for _, _, kind, line in commands],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Command-line entry point for batch graduation validation.
+
+    Usage:
+        python -m src.grd.graduation_validator "notebooks/**/*.ipynb" --workers 8 --format jsonl
+
+    Returns:
+        Exit code: 0 if every notebook passed, 1 otherwise
+    """
+    parser = argparse.ArgumentParser(
+        description="Validate notebooks against GRD graduation requirements.",
+    )
+    parser.add_argument('patterns', nargs='+', help="Notebook paths, directories, or globs")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--format', choices=['json', 'jsonl'], default='json',
+                        help="json: one report document; jsonl: one line per notebook, then the summary")
+    parser.add_argument('--output', default='-', help="Report file (default: stdout)")
+    parser.add_argument('--cache-dir', default='.planning/cache/graduation', help="Result cache directory")
+    parser.add_argument('--no-cache', action='store_true', help="Revalidate every notebook")
+    args = parser.parse_args(argv)
+
+    report = validate_notebooks(
+        args.patterns,
+        workers=args.workers,
+        cache_dir=None if args.no_cache else args.cache_dir,
+    )
+    if args.format == 'jsonl':
+        lines = [json.dumps(result) for result in report['notebooks']]
+        lines.append(json.dumps({'summary': report['summary']}))
+        content = '\n'.join(lines) + '\n'
+    else:
+        content = json.dumps(report, indent=2) + '\n'
+
+    if args.output == '-':
+        sys.stdout.write(content)
+    else:
+        Path(args.output).write_text(content)
+    return 0 if report['summary']['failed'] == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,11 +1,21 @@
 """Hardware profiling and duration estimation for reproducible ML experiments."""
 
 from .profiler import capture_hardware_profile, HardwareProfile
+from .calibration import calibrate_hardware, CalibrationResult
+from .history import RunHistory, HistoryPrediction
+from .sampler import ResourceSampler, read_resource_samples, summarize_resource_samples
 from .estimator import estimate_training_duration, DurationEstimate, estimate_eda_duration
 
 __all__ = [
     "capture_hardware_profile",
     "HardwareProfile",
+    "calibrate_hardware",
+    "CalibrationResult",
+    "RunHistory",
+    "HistoryPrediction",
+    "ResourceSampler",
+    "read_resource_samples",
+    "summarize_resource_samples",
     "estimate_training_duration",
     "estimate_eda_duration",
     "DurationEstimate",
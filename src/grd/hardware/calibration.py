@@ -0,0 +1,264 @@
+"""Micro-benchmark calibration of local compute, memory and disk throughput.
+
+The duration estimator's lookup tables know GPUs by name but treat every
+CPU as 0.1 TFLOPs. calibrate_hardware() measures the machine instead, with
+a short bounded run (a few seconds):
+- GEMM throughput: float32 matrix multiply with NumPy (GFLOPs)
+- Memory bandwidth: large array copy (GB/s, read + write)
+- Disk read speed: sequential read of a fresh temp file with the page cache
+  dropped for it where the OS allows (MB/s)
+
+Results are cached per machine fingerprint in the user cache directory
+($XDG_CACHE_HOME/grd/hardware/calibration.json, by default under
+~/.cache), not the working directory, since they describe the machine
+rather than a project. capture_hardware_profile() attaches a cached
+calibration to the profile, and the estimator uses it.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional, TypedDict
+
+logger = logging.getLogger(__name__)
+
+def _user_cache_dir() -> Path:
+    """Per-user cache root: $XDG_CACHE_HOME/grd, else ~/.cache/grd."""
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "grd"
+
+
+# Machine-wide caches (calibration, static hardware profile)
+HARDWARE_CACHE_DIR = _user_cache_dir() / "hardware"
+
+CALIBRATION_CACHE_PATH = HARDWARE_CACHE_DIR / "calibration.json"
+
+# Recalibrate after this long even if the machine looks the same
+CALIBRATION_MAX_AGE_DAYS = 30
+
+# Bytes moved by the memory and disk benchmarks
+_MEMORY_BENCH_BYTES = 64 * 1024**2
+_DISK_BENCH_BYTES = 32 * 1024**2
+
+
+class CalibrationResult(TypedDict):
+    """Measured throughput of the local machine."""
+    gemm_gflops: Optional[float]
+    memory_bandwidth_gbps: Optional[float]
+    disk_read_mbps: Optional[float]
+    machine: str
+    duration_seconds: float
+    timestamp: str
+
+
+def calibrate_hardware(
+    hardware_profile: Optional[dict] = None,
+    cache_path: Path = CALIBRATION_CACHE_PATH,
+    max_seconds: float = 3.0,
+    force: bool = False,
+) -> CalibrationResult:
+    """
+    Measure GEMM, memory and disk throughput, reusing a cached result.
+
+    Args:
+        hardware_profile: Profile from capture_hardware_profile() (captured
+            if omitted). The result is also stored in its 'calibration' key.
+        cache_path: JSON cache of results per machine fingerprint; the disk
+            benchmark runs in its directory
+        max_seconds: Time budget for the whole benchmark
+        force: Re-measure even if a fresh cached result exists
+
+    Returns:
+        CalibrationResult (a benchmark that cannot run reports None)
+
+    Examples:
+        >>> profile = capture_hardware_profile()
+        >>> calibration = calibrate_hardware(profile)
+        >>> print(f"CPU GEMM: {calibration['gemm_gflops']:.0f} GFLOPs")
+        >>> estimate = estimate_training_duration(100000, 10, 1000000, profile)
+    """
+    if hardware_profile is None:
+        from .profiler import capture_hardware_profile
+        hardware_profile = capture_hardware_profile()
+
+    cache_path = Path(cache_path)
+    if not force:
+        cached = load_calibration(hardware_profile, cache_path)
+        if cached is not None:
+            hardware_profile["calibration"] = cached
+            return cached
+
+    start = time.perf_counter()
+    result = CalibrationResult(
+        gemm_gflops=_bench_gemm(max_seconds * 0.4),
+        memory_bandwidth_gbps=_bench_memory(max_seconds * 0.3),
+        disk_read_mbps=_bench_disk(cache_path.parent, max_seconds * 0.3),
+        machine=_machine_fingerprint(hardware_profile),
+        duration_seconds=round(time.perf_counter() - start, 3),
+        timestamp=datetime.utcnow().isoformat() + "Z",
+    )
+
+    cache = _read_cache(cache_path)
+    cache[result["machine"]] = result
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not cache hardware calibration: {e}")
+
+    hardware_profile["calibration"] = result
+    return result
+
+
+def load_calibration(
+    hardware_profile: dict,
+    cache_path: Path = CALIBRATION_CACHE_PATH,
+) -> Optional[CalibrationResult]:
+    """
+    Cached calibration for this machine, if one exists and is fresh.
+
+    Args:
+        hardware_profile: Profile identifying the machine
+        cache_path: JSON cache written by calibrate_hardware()
+
+    Returns:
+        CalibrationResult, or None if this machine was never calibrated or
+        the result is older than CALIBRATION_MAX_AGE_DAYS
+    """
+    cached = _read_cache(Path(cache_path)).get(_machine_fingerprint(hardware_profile))
+    if not cached:
+        return None
+    try:
+        measured = datetime.fromisoformat(cached["timestamp"].rstrip("Z"))
+    except (KeyError, ValueError):
+        return None
+    if datetime.utcnow() - measured > timedelta(days=CALIBRATION_MAX_AGE_DAYS):
+        return None
+    return cached
+
+
+def _machine_fingerprint(hardware_profile: dict) -> str:
+    """Stable id of the hardware a calibration applies to."""
+    cpu = hardware_profile.get("cpu") or {}
+    gpu = hardware_profile.get("gpu") or {}
+    key = [
+        cpu.get("brand"),
+        cpu.get("architecture"),
+        cpu.get("cores_physical"),
+        cpu.get("cores_logical"),
+        round((hardware_profile.get("memory") or {}).get("total_gb", 0)),
+        gpu.get("name"),
+    ]
+    return hashlib.sha256(json.dumps(key).encode()).hexdigest()[:16]
+
+
+def _read_cache(cache_path: Path) -> dict:
+    try:
+        with open(cache_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _bench_gemm(budget_seconds: float) -> Optional[float]:
+    """Best float32 matmul throughput in GFLOPs."""
+    try:
+        import numpy as np
+    except ImportError:
+        logger.warning("NumPy not available, skipping GEMM calibration")
+        return None
+
+    n = 512
+    rng = np.random.default_rng(0)
+    a = rng.standard_normal((n, n), dtype=np.float32)
+    b = rng.standard_normal((n, n), dtype=np.float32)
+    a @ b  # Warm up BLAS threads
+
+    best = 0.0
+    deadline = time.perf_counter() + budget_seconds
+    while True:
+        start = time.perf_counter()
+        a @ b
+        elapsed = time.perf_counter() - start
+        if elapsed > 0:
+            best = max(best, 2 * n**3 / elapsed / 1e9)
+        if time.perf_counter() >= deadline:
+            break
+        if elapsed < budget_seconds / 50 and n < 2048:
+            # Too fast to time well: grow the problem
+            n *= 2
+            a = rng.standard_normal((n, n), dtype=np.float32)
+            b = rng.standard_normal((n, n), dtype=np.float32)
+    return round(best, 2)
+
+
+def _bench_memory(budget_seconds: float) -> Optional[float]:
+    """Best large-array copy bandwidth in GB/s (bytes read + written)."""
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    src = np.ones(_MEMORY_BENCH_BYTES // 8)
+    dst = np.empty_like(src)
+    np.copyto(dst, src)  # Fault in pages
+
+    best = 0.0
+    deadline = time.perf_counter() + budget_seconds
+    while True:
+        start = time.perf_counter()
+        np.copyto(dst, src)
+        elapsed = time.perf_counter() - start
+        if elapsed > 0:
+            best = max(best, 2 * src.nbytes / elapsed / 1e9)
+        if time.perf_counter() >= deadline:
+            break
+    return round(best, 2)
+
+
+def _bench_disk(directory: Path, budget_seconds: float) -> Optional[float]:
+    """Sequential read speed in MB/s of a fresh file in directory."""
+    chunk = os.urandom(1024**2)
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, name = tempfile.mkstemp(prefix=".calibration-", dir=directory)
+    except OSError as e:
+        logger.warning(f"Could not create disk calibration file: {e}")
+        return None
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for _ in range(_DISK_BENCH_BYTES // len(chunk)):
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+            if hasattr(os, "posix_fadvise"):
+                # Drop the file from the page cache so the read hits the disk
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+        read = 0
+        start = time.perf_counter()
+        deadline = start + budget_seconds
+        with open(name, "rb", buffering=0) as f:
+            while time.perf_counter() < deadline:
+                data = f.read(len(chunk))
+                if not data:
+                    break
+                read += len(data)
+        elapsed = time.perf_counter() - start
+        return round(read / elapsed / 1024**2, 1) if elapsed > 0 and read else None
+    except OSError as e:
+        logger.warning(f"Disk calibration failed: {e}")
+        return None
+    finally:
+        try:
+            os.remove(name)
+        except OSError:
+            pass
@@ -1,10 +1,15 @@
 """Duration estimation for ML experiments based on hardware context."""
 
 import logging
-from typing import TypedDict
+from typing import Optional, TypedDict
+
+from .history import HistoryPrediction, RunHistory, input_data_bytes, notebook_fingerprint
 
 logger = logging.getLogger(__name__)
 
+# Share of available memory a data load may use before it is memory-constrained
+MEMORY_BUDGET_FRACTION = 0.5
+
 
 class DurationEstimate(TypedDict):
     """Duration estimate for an experiment."""
@@ -14,7 +19,10 @@ class DurationEstimate(TypedDict):
     is_long_running: bool
     requires_user_confirmation: bool
     gpu_tflops: float
-    confidence: str
+    confidence: str  # LOW/MEDIUM/HIGH from heuristics, HISTORY when learned
+    lower_seconds: Optional[float]  # Prediction interval, history only
+    upper_seconds: Optional[float]
+    history_runs: int  # Similar past runs behind the estimate
 
 
 def estimate_training_duration(
@@ -23,13 +31,22 @@ def estimate_training_duration(
     model_params: int,
     hardware_profile: dict,
     batch_size: int = 32,
+    history: Optional[RunHistory] = None,
+    notebook_path: Optional[str] = None,
+    parameters: Optional[dict] = None,
 ) -> DurationEstimate:
     """
     Estimate training time based on hardware specs and data size.
 
     Uses GPU TFLOPs lookup table for common GPUs, computes total FLOPs
     required (6 * params * samples * epochs for forward + backward pass),
-    and applies 50% efficiency factor for realistic estimates.
+    and applies 50% efficiency factor for realistic estimates. Without a
+    GPU, the measured CPU GEMM throughput from calibrate_hardware() is used
+    when the profile carries a calibration.
+
+    When history holds enough similar runs of notebook_path on this
+    machine, the estimate comes from them instead (see RunHistory.predict())
+    with a 90% prediction interval, and confidence is "HISTORY".
 
     Long-running threshold: 600 seconds (10 minutes)
 
@@ -39,6 +56,9 @@ def estimate_training_duration(
         model_params: Number of model parameters
         hardware_profile: Hardware profile from capture_hardware_profile()
         batch_size: Batch size (default: 32)
+        history: Optional RunHistory of past notebook runs
+        notebook_path: Notebook that will run the training (for history)
+        parameters: Parameters it will run with (for history)
 
     Returns:
         DurationEstimate with time estimates, is_long_running flag, and confidence
@@ -55,6 +75,17 @@ def estimate_training_duration(
         >>> if estimate['is_long_running']:
         ...     print("This experiment requires user approval for long-running mode")
     """
+    if history is not None and notebook_path is not None:
+        prediction = history.predict(
+            "notebook",
+            hardware_profile,
+            work=input_data_bytes(parameters or {}),
+            notebook_hash=notebook_fingerprint(notebook_path),
+            parameters=parameters,
+        )
+        if prediction is not None:
+            return _history_estimate(prediction)
+
     # GPU TFLOPs lookup table (FP32 performance)
     GPU_TFLOPS = {
         "V100": 7.0,
@@ -71,6 +102,7 @@ def estimate_training_duration(
     # Determine GPU TFLOPs
     gpu_tflops = 5.0  # Conservative default for unknown GPUs
     confidence = "LOW"  # Start with low confidence
+    calibration = hardware_profile.get("calibration")
 
     if hardware_profile.get("gpu"):
         gpu_name = hardware_profile["gpu"]["name"]
@@ -90,6 +122,11 @@ def estimate_training_duration(
                 # Unknown GPU, use default
                 logger.info(f"Unknown GPU model '{gpu_name}', using default {gpu_tflops} TFLOPs")
                 confidence = "LOW"
+    elif calibration and calibration.get("gemm_gflops"):
+        # No GPU, but CPU matmul throughput was measured on this machine
+        gpu_tflops = calibration["gemm_gflops"] / 1000
+        confidence = "MEDIUM"
+        logger.info(f"No GPU detected, using measured CPU throughput ({gpu_tflops:.3f} TFLOPs)")
     else:
         # No GPU detected - use CPU fallback (very slow)
         logger.warning("No GPU detected, training will be slow")
@@ -116,6 +153,9 @@ def estimate_training_duration(
         requires_user_confirmation=is_long_running,
         gpu_tflops=gpu_tflops,
         confidence=confidence,
+        lower_seconds=None,
+        upper_seconds=None,
+        history_runs=0,
     )
 
 
@@ -123,17 +163,24 @@ def estimate_eda_duration(
     num_rows: int,
     num_columns: int,
     hardware_profile: dict,
+    history: Optional[RunHistory] = None,
 ) -> DurationEstimate:
     """
     Estimate exploratory data analysis (EDA) duration based on data size.
 
     Uses simpler heuristic: ~10 rows/ms for profiling operations.
-    Memory-constrained if data size exceeds available memory.
+    Memory-constrained if data size exceeds available memory; the extra
+    disk I/O is then costed from the measured disk read speed when the
+    profile carries a calibration, else as a flat 3x slowdown.
+
+    With enough past quick-explore runs on this machine in history, the
+    estimate is regressed on their size (rows x column factor) instead.
 
     Args:
         num_rows: Number of rows in dataset
         num_columns: Number of columns in dataset
         hardware_profile: Hardware profile from capture_hardware_profile()
+        history: Optional RunHistory with recorded EDA runs
 
     Returns:
         DurationEstimate with time estimates and is_long_running flag
@@ -147,23 +194,33 @@ def estimate_eda_duration(
         ... )
         >>> print(f"EDA estimated time: {estimate['estimated_minutes']:.1f} minutes")
     """
-    # Estimate data size in memory (rough approximation)
-    # Assume 8 bytes per numeric value + overhead
-    estimated_data_size_gb = (num_rows * num_columns * 8) / (1024**3)
+    if history is not None:
+        prediction = history.predict("eda", hardware_profile, work=eda_work(num_rows, num_columns))
+        if prediction is not None:
+            return _history_estimate(prediction)
+
+    estimated_data_size_gb = estimate_data_memory_gb(num_rows, num_columns)
 
     # Check if memory-constrained
     available_memory_gb = hardware_profile.get("memory", {}).get("available_gb", 8.0)
-    is_memory_constrained = estimated_data_size_gb > (available_memory_gb * 0.5)
-
-    # Base heuristic: ~10 rows/ms for profiling
-    base_seconds = num_rows / 10000
+    is_memory_constrained = estimated_data_size_gb > memory_budget_gb(hardware_profile)
 
-    # Add column overhead (more columns = more profiling work)
-    column_factor = 1 + (num_columns / 100)
-    estimated_seconds = base_seconds * column_factor
+    # Base heuristic: ~10 rows/ms for profiling, plus column overhead
+    # (more columns = more profiling work)
+    estimated_seconds = eda_work(num_rows, num_columns) / 10000
 
     # If memory-constrained, operations will be slower (disk I/O)
-    if is_memory_constrained:
+    calibration = hardware_profile.get("calibration") or {}
+    if is_memory_constrained and calibration.get("disk_read_mbps"):
+        # Data spills to disk: add one pass over it at the measured read speed
+        estimated_seconds += estimated_data_size_gb * 1024 / calibration["disk_read_mbps"]
+        confidence = "MEDIUM"
+        logger.info(
+            f"Data size ({estimated_data_size_gb:.1f} GB) exceeds available memory "
+            f"({available_memory_gb:.1f} GB), EDA will be disk-bound at "
+            f"~{calibration['disk_read_mbps']:.0f} MB/s"
+        )
+    elif is_memory_constrained:
         estimated_seconds *= 3  # 3x slower with disk operations
         confidence = "MEDIUM"
         logger.info(
@@ -187,4 +244,51 @@ def estimate_eda_duration(
         requires_user_confirmation=is_long_running,
         gpu_tflops=0.0,  # EDA doesn't use GPU
         confidence=confidence,
+        lower_seconds=None,
+        upper_seconds=None,
+        history_runs=0,
+    )
+
+
+def estimate_data_memory_gb(num_rows: int, num_columns: int, bytes_per_value: float = 8.0) -> float:
+    """
+    Estimate in-memory size of a table (rough approximation).
+
+    Args:
+        num_rows: Number of rows
+        num_columns: Number of columns
+        bytes_per_value: Average bytes per value (default 8: one numeric value)
+
+    Returns:
+        Estimated size in GB
+    """
+    return num_rows * num_columns * bytes_per_value / (1024**3)
+
+
+def memory_budget_gb(hardware_profile: dict) -> float:
+    """Memory one data load may use: MEMORY_BUDGET_FRACTION of available memory."""
+    return hardware_profile.get("memory", {}).get("available_gb", 8.0) * MEMORY_BUDGET_FRACTION
+
+
+def eda_work(num_rows: int, num_columns: int) -> float:
+    """Profiling work of a dataset: rows weighted by a column factor."""
+    return num_rows * (1 + num_columns / 100)
+
+
+def _history_estimate(prediction: HistoryPrediction) -> DurationEstimate:
+    """DurationEstimate from a RunHistory prediction."""
+    estimated_seconds = prediction["estimated_seconds"]
+    # Ask before starting anything that may plausibly exceed 10 minutes
+    is_long_running = estimated_seconds > 600
+    return DurationEstimate(
+        estimated_seconds=estimated_seconds,
+        estimated_minutes=estimated_seconds / 60,
+        estimated_hours=estimated_seconds / 3600,
+        is_long_running=is_long_running,
+        requires_user_confirmation=prediction["upper_seconds"] > 600,
+        gpu_tflops=0.0,
+        confidence="HISTORY",
+        lower_seconds=prediction["lower_seconds"],
+        upper_seconds=prediction["upper_seconds"],
+        history_runs=prediction["runs"],
     )
@@ -0,0 +1,259 @@
+"""Run-history store and learned duration model.
+
+Every recorded run (notebook experiment, quick-explore profile, ...) lands
+in a small SQLite database, by default .planning/run_history.db, keyed by:
+- kind: what ran ('notebook', 'eda')
+- notebook hash: SHA-256 of the notebook's code cells (outputs ignored)
+- parameters hash: parameters without random_seed, which does not change
+  how long a run takes
+- work: a size feature (input bytes for notebooks, rows for EDA)
+- machine: the hardware fingerprint used for calibration
+
+RunHistory.predict() fits seconds ~ work on a log-log scale over the
+similar successful runs (same kind, machine and notebook; same parameters
+when enough of those exist) and returns a prediction interval. With fewer
+than MIN_HISTORY_RUNS similar runs it returns None and the estimators keep
+their hardware heuristics.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, TypedDict
+
+from .calibration import _machine_fingerprint
+
+logger = logging.getLogger(__name__)
+
+RUN_HISTORY_PATH = Path(".planning/run_history.db")
+
+# Similar runs needed before history replaces the heuristics
+MIN_HISTORY_RUNS = 5
+
+# Two-sided coverage of predicted intervals
+INTERVAL_LEVEL = 0.9
+
+# Student t quantiles for the 90% interval by degrees of freedom
+_T_90 = {
+    1: 6.314, 2: 2.920, 3: 2.353, 4: 2.132, 5: 2.015, 6: 1.943, 7: 1.895,
+    8: 1.860, 9: 1.833, 10: 1.812, 12: 1.782, 15: 1.753, 20: 1.725,
+    30: 1.697, 60: 1.671,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    machine TEXT NOT NULL,
+    notebook_hash TEXT,
+    parameters_hash TEXT,
+    parameters TEXT,
+    work REAL,
+    seconds REAL NOT NULL,
+    success INTEGER NOT NULL,
+    recorded_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_similar ON runs (kind, machine, notebook_hash, parameters_hash);
+"""
+
+
+class HistoryPrediction(TypedDict):
+    """Duration predicted from similar past runs."""
+    estimated_seconds: float
+    lower_seconds: float
+    upper_seconds: float
+    runs: int
+    method: str  # 'regression' (on work) or 'mean'
+
+
+class RunHistory:
+    """
+    SQLite store of run durations with a per-workload regression.
+
+    Each call opens its own connection, so one RunHistory can be shared by
+    the threads of a notebook sweep.
+
+    Attributes:
+        db_path: SQLite database file
+
+    Example:
+        >>> history = RunHistory()
+        >>> result = execute_notebook_experiment(nb, run_dir, params, run_history=history)
+        >>> estimate = estimate_training_duration(..., history=history,
+        ...                                       notebook_path=nb, parameters=params)
+    """
+
+    def __init__(self, db_path: Path = RUN_HISTORY_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def record(
+        self,
+        kind: str,
+        seconds: float,
+        hardware_profile: dict,
+        work: Optional[float] = None,
+        notebook_hash: Optional[str] = None,
+        parameters: Optional[dict] = None,
+        success: bool = True,
+    ) -> None:
+        """
+        Store one run.
+
+        Args:
+            kind: Workload kind ('notebook', 'eda', ...)
+            seconds: Wall time of the run
+            hardware_profile: Profile of the machine it ran on
+            work: Size feature of the run (None if unknown)
+            notebook_hash: From notebook_fingerprint(), for notebook runs
+            parameters: Run parameters (stored as JSON)
+            success: Failed runs are kept but never used for predictions
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO runs (kind, machine, notebook_hash, parameters_hash, parameters,"
+                " work, seconds, success, recorded_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    kind,
+                    _machine_fingerprint(hardware_profile),
+                    notebook_hash,
+                    parameters_fingerprint(parameters) if parameters is not None else None,
+                    json.dumps(parameters, sort_keys=True, default=str) if parameters is not None else None,
+                    work,
+                    seconds,
+                    int(success),
+                    datetime.utcnow().isoformat() + "Z",
+                ),
+            )
+
+    def predict(
+        self,
+        kind: str,
+        hardware_profile: dict,
+        work: Optional[float] = None,
+        notebook_hash: Optional[str] = None,
+        parameters: Optional[dict] = None,
+    ) -> Optional[HistoryPrediction]:
+        """
+        Predict a run's duration from similar successful runs.
+
+        Runs with the same parameters are used alone when there are at least
+        MIN_HISTORY_RUNS of them; otherwise every run of the notebook (or
+        kind) on this machine.
+
+        Args:
+            kind: Workload kind
+            hardware_profile: Profile of the machine that will run it
+            work: Size feature of the planned run
+            notebook_hash: Notebook the run executes, if any
+            parameters: Planned parameters
+
+        Returns:
+            HistoryPrediction with an INTERVAL_LEVEL interval, or None if
+            fewer than MIN_HISTORY_RUNS similar runs exist
+        """
+        query = "SELECT work, seconds FROM runs WHERE success = 1 AND seconds > 0 AND kind = ? AND machine = ?"
+        args: list = [kind, _machine_fingerprint(hardware_profile)]
+        if notebook_hash is not None:
+            query += " AND notebook_hash = ?"
+            args.append(notebook_hash)
+
+        with self._connect() as conn:
+            rows = []
+            if parameters is not None:
+                rows = conn.execute(query + " AND parameters_hash = ?", args + [parameters_fingerprint(parameters)]).fetchall()
+            if len(rows) < MIN_HISTORY_RUNS:
+                rows = conn.execute(query, args).fetchall()
+        if len(rows) < MIN_HISTORY_RUNS:
+            return None
+
+        points = [(math.log(w), math.log(s)) for w, s in rows if w is not None and w > 0]
+        if work is not None and work > 0 and len(points) >= MIN_HISTORY_RUNS and len({x for x, _ in points}) > 1:
+            return _fit_regression(points, math.log(work))
+        return _fit_mean([math.log(s) for _, s in rows])
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+
+def notebook_fingerprint(notebook_path: str) -> str:
+    """SHA-256 of a notebook's code cell sources (outputs and metadata ignored)."""
+    with open(notebook_path) as f:
+        cells = json.load(f).get("cells", [])
+    digest = hashlib.sha256()
+    for cell in cells:
+        if cell.get("cell_type") == "code":
+            source = cell.get("source", "")
+            digest.update(("".join(source) if isinstance(source, list) else source).encode())
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def parameters_fingerprint(parameters: dict) -> str:
+    """Hash of run parameters; random_seed is left out."""
+    relevant = {key: value for key, value in parameters.items() if key != "random_seed"}
+    return hashlib.sha256(json.dumps(relevant, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+def input_data_bytes(parameters: dict) -> Optional[int]:
+    """Total size of the files named by string parameters (None if none are)."""
+    total = None
+    for value in parameters.values():
+        if not isinstance(value, str) or not value:
+            continue
+        try:
+            path = Path(value)
+            if path.is_file():
+                total = (total or 0) + path.stat().st_size
+        except (OSError, ValueError):
+            continue
+    return total
+
+
+def _t_quantile(dof: int) -> float:
+    """Upper quantile for the INTERVAL_LEVEL interval (table lookup, rounded down dof)."""
+    if dof > 60:
+        return 1.645
+    return _T_90[max(d for d in _T_90 if d <= max(dof, 1))]
+
+
+def _fit_regression(points: list, x0: float) -> HistoryPrediction:
+    """Least squares of log seconds on log work, with a prediction interval at x0."""
+    n = len(points)
+    x_mean = sum(x for x, _ in points) / n
+    y_mean = sum(y for _, y in points) / n
+    sxx = sum((x - x_mean) ** 2 for x, _ in points)
+    slope = sum((x - x_mean) * (y - y_mean) for x, y in points) / sxx
+    intercept = y_mean - slope * x_mean
+    residual = sum((y - intercept - slope * x) ** 2 for x, y in points)
+    s = math.sqrt(residual / (n - 2)) if n > 2 else 0.0
+    spread = _t_quantile(n - 2) * s * math.sqrt(1 + 1 / n + (x0 - x_mean) ** 2 / sxx)
+    y0 = intercept + slope * x0
+    return HistoryPrediction(
+        estimated_seconds=math.exp(y0),
+        lower_seconds=math.exp(y0 - spread),
+        upper_seconds=math.exp(y0 + spread),
+        runs=n,
+        method="regression",
+    )
+
+
+def _fit_mean(log_seconds: list) -> HistoryPrediction:
+    """Log-normal prediction interval for runs without a usable size feature."""
+    n = len(log_seconds)
+    mean = sum(log_seconds) / n
+    s = math.sqrt(sum((y - mean) ** 2 for y in log_seconds) / (n - 1))
+    spread = _t_quantile(n - 1) * s * math.sqrt(1 + 1 / n)
+    return HistoryPrediction(
+        estimated_seconds=math.exp(mean),
+        lower_seconds=math.exp(mean - spread),
+        upper_seconds=math.exp(mean + spread),
+        runs=n,
+        method="mean",
+    )
@@ -1,11 +1,43 @@
-"""Hardware profiling for ML experiments - captures CPU, memory, disk, and GPU specs."""
-
+"""Hardware profiling for ML experiments - captures CPU, memory, disk, and GPU specs.
+
+Static fields (CPU, total memory and disk, GPU) are slow to capture: py-cpuinfo
+spawns a subprocess and GPU detection imports torch. They cannot change while
+the machine is up, so they are captured once per boot and cached in memory
+and on disk in the user cache directory ($XDG_CACHE_HOME/grd/hardware/
+profile.json, by default under ~/.cache; per host and boot ID).
+Dynamic fields (available memory, free disk) are re-read cheaply from /proc
+and statvfs, at most every PROFILE_TTL_SECONDS.
+"""
+
+import copy
+import json
 import logging
+import os
+import shutil
+import socket
+import sys
+import threading
+import time
 from datetime import datetime
+from pathlib import Path
 from typing import TypedDict, Optional
 
+from .calibration import HARDWARE_CACHE_DIR, CalibrationResult, load_calibration
+
 logger = logging.getLogger(__name__)
 
+PROFILE_CACHE_PATH = HARDWARE_CACHE_DIR / "profile.json"
+
+# How long available memory / free disk readings are reused
+PROFILE_TTL_SECONDS = 1.0
+
+_BOOT_ID_PATH = Path("/proc/sys/kernel/random/boot_id")
+
+# Static fields for this process, and (monotonic time, memory, disk) readings
+_static_fields: Optional[dict] = None
+_dynamic_fields: Optional[tuple] = None
+_profile_lock = threading.Lock()
+
 
 class CPUInfo(TypedDict):
     """CPU information."""
@@ -45,17 +77,27 @@ class HardwareProfile(TypedDict):
     disk: DiskInfo
     gpu: Optional[GPUInfo]
     timestamp: str
+    calibration: Optional[CalibrationResult]
 
 
-def capture_hardware_profile() -> HardwareProfile:
+def capture_hardware_profile(use_cache: bool = True) -> HardwareProfile:
     """
     Capture complete hardware context for reproducibility.
 
     Uses psutil for CPU/memory/disk, py-cpuinfo for CPU details,
     torch.cuda (preferred) or GPUtil (fallback) for GPU detection.
+    Static fields come from the per-boot cache when possible, so a warm
+    call only reads /proc and statvfs (about a millisecond).
+
+    Args:
+        use_cache: Reuse cached static fields and recent dynamic readings
+            (default True); False captures everything afresh and refreshes
+            the cache
 
     Returns:
-        HardwareProfile dict with cpu, memory, disk, gpu (or None), timestamp
+        HardwareProfile dict with cpu, memory, disk, gpu (or None), timestamp,
+        and the cached calibration for this machine (or None, see
+        calibrate_hardware())
 
     Examples:
         >>> profile = capture_hardware_profile()
@@ -63,17 +105,109 @@ def capture_hardware_profile() -> HardwareProfile:
         >>> if profile['gpu']:
         ...     print(f"GPU: {profile['gpu']['name']}")
     """
+    global _dynamic_fields
+    static = _load_static_fields(use_cache)
+
+    with _profile_lock:
+        if use_cache and _dynamic_fields and time.monotonic() - _dynamic_fields[0] < PROFILE_TTL_SECONDS:
+            available_gb, free_gb = _dynamic_fields[1:]
+        else:
+            available_gb, free_gb = _available_memory_gb(), _free_disk_gb()
+            _dynamic_fields = (time.monotonic(), available_gb, free_gb)
+
     profile: HardwareProfile = {
-        "cpu": _capture_cpu_info(),
-        "memory": _capture_memory_info(),
-        "disk": _capture_disk_info(),
-        "gpu": _capture_gpu_info(),
+        "cpu": static["cpu"],
+        "memory": MemoryInfo(total_gb=static["memory_total_gb"], available_gb=available_gb),
+        "disk": DiskInfo(total_gb=static["disk_total_gb"], free_gb=free_gb),
+        "gpu": static["gpu"],
         "timestamp": datetime.utcnow().isoformat() + "Z",
+        "calibration": None,
     }
+    # Callers may modify their profile, so never hand out the cached dicts
+    profile = copy.deepcopy(profile)
+    profile["calibration"] = load_calibration(profile)
 
     return profile
 
 
+def _load_static_fields(use_cache: bool) -> dict:
+    """Static profile fields: from memory, the per-boot disk cache, or captured."""
+    global _static_fields
+    with _profile_lock:
+        if use_cache and _static_fields is not None:
+            return _static_fields
+
+        host_key = f"{socket.gethostname()}:{_boot_id()}"
+        cache = {}
+        try:
+            with open(PROFILE_CACHE_PATH) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            pass
+        if use_cache and host_key in cache:
+            _static_fields = cache[host_key]
+            return _static_fields
+
+        static = {
+            "cpu": _capture_cpu_info(),
+            "memory_total_gb": _capture_memory_info()["total_gb"],
+            "disk_total_gb": _capture_disk_info()["total_gb"],
+            "gpu": _capture_gpu_info(),
+        }
+        _static_fields = static
+        if static["cpu"]["brand"] == "Unknown" or not static["memory_total_gb"]:
+            # Profiling libraries missing: keep retrying in new processes
+            return static
+
+        # Entries of other boots of this host are stale
+        hostname = socket.gethostname()
+        cache = {key: value for key, value in cache.items() if not key.startswith(f"{hostname}:")}
+        cache[host_key] = static
+        try:
+            PROFILE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = PROFILE_CACHE_PATH.with_name(f".{PROFILE_CACHE_PATH.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(cache, f, indent=2)
+            os.replace(tmp_path, PROFILE_CACHE_PATH)
+        except OSError as e:
+            logger.debug(f"Could not cache hardware profile: {e}")
+        return static
+
+
+def _boot_id() -> Optional[str]:
+    """Identifier of the current boot (Linux boot_id, else psutil boot time)."""
+    try:
+        return _BOOT_ID_PATH.read_text().strip()
+    except OSError:
+        pass
+    try:
+        import psutil
+        return str(int(psutil.boot_time()))
+    except Exception:
+        return None
+
+
+def _available_memory_gb() -> float:
+    """Available memory from /proc/meminfo, falling back to psutil."""
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024 / (1024**3)
+    except (OSError, ValueError, IndexError):
+        pass
+    return _capture_memory_info()["available_gb"]
+
+
+def _free_disk_gb(path: str = '/') -> float:
+    """Free disk space via statvfs (as psutil computes it), falling back to psutil."""
+    try:
+        stat = os.statvfs(path)
+        return stat.f_bavail * stat.f_frsize / (1024**3)
+    except (OSError, AttributeError):
+        return _capture_disk_info(path)["free_gb"]
+
+
 def _capture_cpu_info() -> CPUInfo:
     """Capture CPU information using psutil and py-cpuinfo."""
     try:
@@ -128,12 +262,12 @@ def _capture_memory_info() -> MemoryInfo:
         return MemoryInfo(total_gb=0.0, available_gb=0.0)
 
 
-def _capture_disk_info() -> DiskInfo:
-    """Capture disk information using psutil."""
+def _capture_disk_info(path: str = '/') -> DiskInfo:
+    """Capture disk information using psutil (for the filesystem holding path)."""
     try:
         import psutil
 
-        disk = psutil.disk_usage('/')
+        disk = psutil.disk_usage(path)
         return DiskInfo(
             total_gb=disk.total / (1024**3),
             free_gb=disk.free / (1024**3),
@@ -150,8 +284,14 @@ def _capture_gpu_info() -> Optional[GPUInfo]:
     """
     Capture GPU information using torch.cuda (preferred) or GPUtil (fallback).
 
-    Returns None if no GPU detected or libraries unavailable.
+    Returns None if no GPU detected or libraries unavailable. Without a
+    GPU driver on the machine, torch is not imported at all (unless the
+    caller already imported it).
     """
+    if "torch" not in sys.modules and not _gpu_driver_present():
+        logger.info("No GPU driver found, skipping GPU detection")
+        return None
+
     # Try PyTorch first (most reliable for ML workloads)
     try:
         import torch
@@ -194,3 +334,12 @@ def _capture_gpu_info() -> Optional[GPUInfo]:
     # No GPU detected or libraries unavailable
     logger.info("No GPU detected or GPU libraries unavailable")
     return None
+
+
+def _gpu_driver_present() -> bool:
+    """Cheap check for an NVIDIA (or ROCm) driver, before importing torch or GPUtil."""
+    return (
+        os.path.exists("/proc/driver/nvidia")
+        or os.path.exists("/dev/kfd")
+        or shutil.which("nvidia-smi") is not None
+    )
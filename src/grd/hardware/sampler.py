@@ -0,0 +1,258 @@
+"""Continuous resource sampling while an experiment runs.
+
+HardwareProfile is a snapshot taken before a run. ResourceSampler records
+what the run actually used: a background thread samples the kernel process
+tree (and the system around it) every interval seconds and appends one
+row per sample to a compact binary file, run_dir/resources.bin:
+
+    b"GRDRES1\\n"                             magic
+    {"columns": [...], "interval": ...}\\n    JSON header line
+    float32 row, float32 row, ...           one value per column, NaN if unknown
+
+Rows are appended as they are taken, so the series survives kernel crashes
+and retries add to the same file. Columns:
+- time_s: seconds since the sampler (first attempt) started
+- cpu_percent: kernel process tree CPU use (100 = one core busy)
+- rss_mb: kernel process tree resident memory
+- read_mbps / write_mbps: process tree disk I/O throughput
+- available_mb: system available memory
+- swap_in_mbps: system swap-in rate (memory thrashing)
+- io_pressure / memory_pressure: Linux PSI "some avg10" (% of time stalled)
+
+summarize_resource_samples() reduces a file to p50/p95/max per column.
+Needs psutil; without it nothing is sampled.
+"""
+
+import json
+import logging
+import math
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# Seconds between samples
+RESOURCE_SAMPLE_INTERVAL_SECONDS = 1.0
+
+RESOURCE_COLUMNS = (
+    "time_s",
+    "cpu_percent",
+    "rss_mb",
+    "read_mbps",
+    "write_mbps",
+    "available_mb",
+    "swap_in_mbps",
+    "io_pressure",
+    "memory_pressure",
+)
+
+_MAGIC = b"GRDRES1\n"
+_ROW = struct.Struct(f"<{len(RESOURCE_COLUMNS)}f")
+_MB = 1024**2
+
+
+class ResourceSampler:
+    """
+    Sample CPU, memory, I/O and pressure of a kernel process tree.
+
+    Attributes:
+        pid: Kernel process id
+        path: Binary series file (appended to)
+        interval: Seconds between samples
+        samples: Rows written by this sampler
+
+    Example:
+        >>> sampler = ResourceSampler(kernel_pid, run_dir / "resources.bin")
+        >>> pm.execute_notebook(...)
+        >>> sampler.stop()
+        >>> usage = summarize_resource_samples(run_dir / "resources.bin")
+        >>> print(usage["cpu_percent"]["p50"], usage["rss_mb"]["max"])
+    """
+
+    def __init__(
+        self,
+        pid: Optional[int],
+        path: Path,
+        interval: float = RESOURCE_SAMPLE_INTERVAL_SECONDS,
+        start_time: Optional[float] = None,
+    ):
+        """
+        Args:
+            pid: Kernel process id (None: do not sample)
+            path: Series file; created with its header if missing
+            interval: Seconds between samples
+            start_time: time.time() that time_s counts from (default: now),
+                so retries continue one time axis
+        """
+        self.pid = pid
+        self.path = Path(path)
+        self.interval = interval
+        self.samples = 0
+        self._start_time = start_time if start_time is not None else time.time()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._process = None
+        if PSUTIL_AVAILABLE and pid is not None:
+            try:
+                self._process = psutil.Process(pid)
+            except psutil.Error:
+                self._process = None
+        if self._process is None:
+            return
+
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            with open(self.path, "wb") as f:
+                f.write(_MAGIC)
+                f.write(json.dumps({"columns": list(RESOURCE_COLUMNS), "interval": interval}).encode() + b"\n")
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling (one final sample is taken first)."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+
+    def _run(self) -> None:
+        previous = self._counters()
+        with open(self.path, "ab") as f:
+            while True:
+                stopped = self._stop.wait(self.interval)
+                current = self._counters()
+                if current is None or previous is None:
+                    return  # Kernel exited
+                f.write(_ROW.pack(*self._row(previous, current)))
+                f.flush()
+                self.samples += 1
+                previous = current
+                if stopped:
+                    return
+
+    def _counters(self) -> Optional[dict]:
+        """Cumulative counters of the process tree and system at one instant."""
+        try:
+            processes = [self._process] + self._process.children(recursive=True)
+        except psutil.Error:
+            return None
+        cpu = rss = read = write = 0.0
+        io_known = False
+        for process in processes:
+            try:
+                with process.oneshot():
+                    times = process.cpu_times()
+                    cpu += times.user + times.system
+                    rss += process.memory_info().rss
+                    try:
+                        io = process.io_counters()
+                        read += io.read_bytes
+                        write += io.write_bytes
+                        io_known = True
+                    except (AttributeError, psutil.AccessDenied):
+                        pass  # Not available on this platform
+            except psutil.NoSuchProcess:
+                continue  # Child exited between listing and reading
+            except psutil.Error:
+                return None
+        try:
+            swap_in = float(psutil.swap_memory().sin)
+        except (psutil.Error, RuntimeError):
+            swap_in = math.nan
+        return {
+            "time": time.time(),
+            "cpu": cpu,
+            "rss": rss,
+            "read": read if io_known else math.nan,
+            "write": write if io_known else math.nan,
+            "available": float(psutil.virtual_memory().available),
+            "swap_in": swap_in,
+        }
+
+    def _row(self, previous: dict, current: dict) -> tuple:
+        elapsed = max(current["time"] - previous["time"], 1e-6)
+        return (
+            current["time"] - self._start_time,
+            (current["cpu"] - previous["cpu"]) / elapsed * 100,
+            current["rss"] / _MB,
+            (current["read"] - previous["read"]) / elapsed / _MB,
+            (current["write"] - previous["write"]) / elapsed / _MB,
+            current["available"] / _MB,
+            (current["swap_in"] - previous["swap_in"]) / elapsed / _MB,
+            _pressure("io"),
+            _pressure("memory"),
+        )
+
+
+def read_resource_samples(path: Path) -> dict:
+    """
+    Read a series file into columns.
+
+    Returns:
+        Dict of column name -> list of floats (NaN where unknown). A
+        trailing partial row (crash mid-write) is ignored.
+    """
+    with open(path, "rb") as f:
+        if f.readline() != _MAGIC:
+            raise ValueError(f"{path} is not a resource sample file")
+        columns = json.loads(f.readline())["columns"]
+        data = f.read()
+    row = struct.Struct(f"<{len(columns)}f")
+    usable = len(data) - len(data) % row.size
+    rows = [row.unpack_from(data, offset) for offset in range(0, usable, row.size)]
+    return {name: [values[i] for values in rows] for i, name in enumerate(columns)}
+
+
+def summarize_resource_samples(path: Path) -> dict:
+    """
+    p50/p95/max per column of a series file.
+
+    Returns:
+        Dict with 'samples' and, per sampled column except time_s,
+        {'p50', 'p95', 'max'} (None where never measured). Empty dict if
+        the file does not exist.
+    """
+    if not Path(path).exists():
+        return {}
+    series = read_resource_samples(path)
+    summary: dict = {"samples": len(series.get("time_s", []))}
+    for name, values in series.items():
+        if name == "time_s":
+            continue
+        known = sorted(value for value in values if not math.isnan(value))
+        if not known:
+            summary[name] = {"p50": None, "p95": None, "max": None}
+            continue
+        summary[name] = {
+            "p50": round(_percentile(known, 0.5), 2),
+            "p95": round(_percentile(known, 0.95), 2),
+            "max": round(known[-1], 2),
+        }
+    return summary
+
+
+def _percentile(ordered: list, fraction: float) -> float:
+    """Linear-interpolated percentile of an ascending list."""
+    position = (len(ordered) - 1) * fraction
+    low = math.floor(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def _pressure(resource: str) -> float:
+    """Linux PSI 'some avg10' for io or memory (NaN where unsupported)."""
+    try:
+        with open(f"/proc/pressure/{resource}") as f:
+            for line in f:
+                if line.startswith("some"):
+                    return float(line.split()[1].split("=")[1])
+    except (OSError, ValueError, IndexError):
+        pass
+    return math.nan
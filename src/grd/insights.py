@@ -7,12 +7,6 @@ translating statistical findings into plain English with actionable recommendati
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 
-try:
-    import pandas as pd
-    PANDAS_AVAILABLE = True
-except ImportError:
-    PANDAS_AVAILABLE = False
-
 try:
     import numpy as np
     NUMPY_AVAILABLE = True
@@ -25,7 +19,16 @@ try:
 except ImportError:
     SCIPY_AVAILABLE = False
 
-from .quick import _load_data, _compute_basic_stats, _analyze_columns, _detect_quality_issues
+from .quick import (
+    PANDAS_AVAILABLE,
+    _profile_data,
+    _with_target,
+    _compute_basic_stats,
+    _analyze_columns,
+    _detect_quality_issues,
+)
+from .profiling import DatasetProfile, get_column_profile
+from .sampling import SampleInfo, describe_sample
 from .formatters import print_header_banner, print_footer
 
 
@@ -51,6 +54,10 @@ def generate_insights(
     output_dir: str = ".planning",
     target_column: Optional[str] = None,
     project_context: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Any]] = None,
+    use_cache: bool = True,
+    memory_guard: bool = True,
 ) -> Dict[str, Any]:
     """Generate plain English data insights.
 
@@ -59,6 +66,13 @@ def generate_insights(
         output_dir: Directory for output files
         target_column: Optional target column for ML context
         project_context: Optional project description for context
+        columns: Only read these columns (target_column is always included)
+        filters: Row filters in pyarrow DNF form, e.g. [('year', '>=', 2024)]
+        use_cache: Reuse a cached profile under output_dir/cache when the file
+            and profiling parameters are unchanged (default True)
+        memory_guard: Shrink the sample, stream, or project columns when the
+            predicted peak memory exceeds the memory budget; only planned
+            on a cache miss (default True)
 
     Returns:
         Dictionary with paths to generated files
@@ -67,15 +81,23 @@ def generate_insights(
         raise ImportError("pandas is required for generate_insights")
 
     # Load and analyze data
-    df = _load_data(data_path, sample_size=50000)
-    stats = _compute_basic_stats(df)
-    columns = _analyze_columns(df)
-    warnings = _detect_quality_issues(df, target_column)
+    profile, sampling, overview, _ = _profile_data(
+        data_path,
+        sample_size=50000,
+        columns=_with_target(columns, target_column),
+        filters=filters,
+        cache_dir=Path(output_dir) / "cache" / "profiles" if use_cache else None,
+        memory_guard=memory_guard,
+        target_column=target_column,
+    )
+    stats = _compute_basic_stats(profile, overview)
+    columns = _analyze_columns(profile)
+    warnings = _detect_quality_issues(profile, target_column)
 
     # Generate insights
-    critical_issues = identify_critical_issues(df, warnings)
-    recommendations = generate_recommendations(df, stats, warnings)
-    llm_prompts = generate_llm_prompts(df, stats, columns, project_context)
+    critical_issues = identify_critical_issues(profile, warnings)
+    recommendations = generate_recommendations(profile, stats, warnings)
+    llm_prompts = generate_llm_prompts(profile, stats, columns, project_context)
 
     # Print header
     print_header_banner("DATA INSIGHTS", f"Analyzing: {data_path}")
@@ -85,7 +107,7 @@ def generate_insights(
 
     # Generate technical report
     report_path = Path(output_dir) / "DATA_REPORT.md"
-    report_content = _generate_technical_report(data_path, df, stats, columns, warnings)
+    report_content = _generate_technical_report(data_path, stats, columns, warnings, sampling)
     with open(report_path, 'w') as f:
         f.write(report_content)
 
@@ -123,11 +145,11 @@ def generate_insights(
     }
 
 
-def identify_critical_issues(df: 'pd.DataFrame', warnings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def identify_critical_issues(profile: DatasetProfile, warnings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Identify critical issues requiring attention.
 
     Args:
-        df: pandas DataFrame
+        profile: Dataset profile from profile_dataframe()
         warnings: Quality warnings from analysis
 
     Returns:
@@ -145,8 +167,8 @@ def identify_critical_issues(df: 'pd.DataFrame', warnings: List[Dict[str, Any]])
 
     # Check for other critical patterns
     # Duplicate rows
-    dup_count = df.duplicated().sum()
-    if dup_count > len(df) * 0.1:
+    dup_count = profile['duplicate_rows']
+    if dup_count > profile['rows'] * 0.1:
         issues.append({
             'title': f"{dup_count:,} duplicate rows detected",
             'what_it_means': "Over 10% of your data are exact copies. This could mean data was accidentally duplicated during collection or processing.",
@@ -154,10 +176,10 @@ def identify_critical_issues(df: 'pd.DataFrame', warnings: List[Dict[str, Any]])
         })
 
     # Constant columns
-    for col in df.columns:
-        if df[col].nunique() == 1:
+    for col in profile['columns']:
+        if col['distinct'] == 1:
             issues.append({
-                'title': f"Column '{col}' has only one value",
+                'title': f"Column '{col['name']}' has only one value",
                 'what_it_means': "This column provides no useful information for analysis since every row has the same value.",
                 'recommended_action': "Remove this column from your analysis.",
             })
@@ -166,14 +188,14 @@ def identify_critical_issues(df: 'pd.DataFrame', warnings: List[Dict[str, Any]])
 
 
 def generate_recommendations(
-    df: 'pd.DataFrame',
+    profile: DatasetProfile,
     stats: Dict[str, Any],
     warnings: List[Dict[str, Any]]
 ) -> List[Dict[str, Any]]:
     """Generate prioritized recommendations.
 
     Args:
-        df: pandas DataFrame
+        profile: Dataset profile from profile_dataframe()
         stats: Basic statistics
         warnings: Quality warnings
 
@@ -190,7 +212,7 @@ def generate_recommendations(
                 'title': f"Fix {w.get('column', 'data')} issues",
                 'description': _explain_issue(w),
                 'effort': 'Medium',
-                'code_example': _get_fix_code(w, df),
+                'code_example': _get_fix_code(w, profile),
             })
 
     # Medium priority: Warnings
@@ -201,7 +223,7 @@ def generate_recommendations(
                 'title': f"Address {w.get('column', 'data')} concerns",
                 'description': _explain_issue(w),
                 'effort': 'Low',
-                'code_example': _get_fix_code(w, df),
+                'code_example': _get_fix_code(w, profile),
             })
 
     # Low priority: Improvements
@@ -218,7 +240,7 @@ def generate_recommendations(
 
 
 def generate_llm_prompts(
-    df: 'pd.DataFrame',
+    profile: DatasetProfile,
     stats: Dict[str, Any],
     columns: List[Dict[str, Any]],
     project_context: Optional[str] = None,
@@ -226,7 +248,7 @@ def generate_llm_prompts(
     """Generate LLM prompts for further exploration.
 
     Args:
-        df: pandas DataFrame
+        profile: Dataset profile from profile_dataframe()
         stats: Basic statistics
         columns: Column analysis
         project_context: Optional project description
@@ -342,12 +364,12 @@ def _suggest_action(warning: Dict[str, Any]) -> str:
     return "Review and address before proceeding."
 
 
-def _get_fix_code(warning: Dict[str, Any], df: 'pd.DataFrame') -> str:
+def _get_fix_code(warning: Dict[str, Any], profile: DatasetProfile) -> str:
     """Generate example code to fix an issue.
 
     Args:
         warning: Warning dictionary
-        df: pandas DataFrame
+        profile: Dataset profile from profile_dataframe()
 
     Returns:
         Python code example
@@ -359,7 +381,8 @@ def _get_fix_code(warning: Dict[str, Any], df: 'pd.DataFrame') -> str:
         return "# Review data and apply appropriate fix"
 
     if 'missing' in msg:
-        if col in df.columns and pd.api.types.is_numeric_dtype(df[col]):
+        col_profile = get_column_profile(profile, col)
+        if col_profile is not None and col_profile['kind'] == 'numeric':
             return f"# Fill missing values with median\ndf['{col}'].fillna(df['{col}'].median(), inplace=True)"
         else:
             return f"# Fill missing values with mode (most common value)\ndf['{col}'].fillna(df['{col}'].mode()[0], inplace=True)"
@@ -375,19 +398,19 @@ def _get_fix_code(warning: Dict[str, Any], df: 'pd.DataFrame') -> str:
 
 def _generate_technical_report(
     data_path: str,
-    df: 'pd.DataFrame',
     stats: Dict[str, Any],
     columns: List[Dict[str, Any]],
     warnings: List[Dict[str, Any]],
+    sampling: Optional[SampleInfo] = None,
 ) -> str:
     """Generate technical DATA_REPORT.md content.
 
     Args:
         data_path: Original data path
-        df: pandas DataFrame
         stats: Basic statistics
         columns: Column analysis
         warnings: Quality warnings
+        sampling: Optional description of how rows were sampled
 
     Returns:
         Markdown string
@@ -398,6 +421,8 @@ def _generate_technical_report(
     lines.append("")
     lines.append(f"**Source:** `{data_path}`")
     lines.append(f"**Generated by:** GRD Insights Mode")
+    if sampling:
+        lines.append(f"**Sample:** {describe_sample(sampling)}")
     lines.append("")
 
     # Overview
@@ -419,7 +444,8 @@ def _generate_technical_report(
     lines.append("| Column | Type | Missing | Unique |")
     lines.append("|--------|------|---------|--------|")
     for col in columns:
-        unique = df[col['name']].nunique() if col['name'] in df.columns else '?'
+        unique = col.get('unique')
+        unique = '?' if unique is None else unique
         lines.append(f"| {col['name']} | {col['dtype']} | {col['missing_pct']:.0%} | {unique} |")
     lines.append("")
 
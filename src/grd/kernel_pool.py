@@ -0,0 +1,319 @@
+"""Pre-warmed Jupyter kernel pool for short notebook experiments.
+
+Starting a kernel and importing torch/pandas can dominate short runs. A
+KernelPool starts kernels ahead of time, imports heavy modules into
+sys.modules (not the user namespace), and leases kernels to runs.
+
+Reproducibility guard, applied around every lease:
+- After a run: the user namespace is reset (%reset -f), or the kernel is
+  restarted if the run failed or the kernel reached max_runs_per_kernel
+- Before a run: global RNGs (random, numpy, torch) are reseeded with the
+  run's random_seed, then a fingerprint (user namespace names, cwd,
+  sys.path, environment, RNG state) is compared to the kernel's pristine
+  baseline. A kernel that fails the check is restarted before use.
+- A kernel that cannot be restarted is replaced by a new one, so the pool
+  keeps its size.
+- Run-specific environment variables are set after the check and removed
+  again before the reset, so they never leak into the next lease.
+
+Kernels are AsyncKernelManagers, as nbclient needs an async client to
+notice kernel death. Housekeeping code runs through a fresh blocking client
+per call, outside nbclient's event loop.
+
+The default fresh-kernel path in notebook_executor is unchanged; pass a
+pool to execute_notebook_experiment(kernel_pool=...) to opt in.
+"""
+import ast
+import json
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+try:
+    from jupyter_client import AsyncKernelManager
+    from jupyter_core.utils import run_sync
+    JUPYTER_CLIENT_AVAILABLE = True
+except ImportError:
+    JUPYTER_CLIENT_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+# Imported into sys.modules only, so the user namespace stays pristine
+DEFAULT_WARMUP_IMPORTS = ('numpy', 'pandas', 'scrapbook')
+
+# Default wait for an idle kernel before lease() gives up
+LEASE_TIMEOUT_SECONDS = 600.0
+
+# Code run in a throwaway globals dict so it never touches the user namespace
+_PRIVATE_EXEC = "__import__('builtins').exec({code!r}, {{}})"
+
+_WARMUP_CODE = """
+import importlib
+for name in {modules!r}:
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        pass
+"""
+
+_RESEED_CODE = """
+import random, sys
+random.seed({seed})
+if 'numpy' in sys.modules:
+    sys.modules['numpy'].random.seed({seed})
+if 'torch' in sys.modules:
+    sys.modules['torch'].manual_seed({seed})
+"""
+
+_RESET_CODE = "get_ipython().run_line_magic('reset', '-f')"
+
+_SET_ENV_CODE = """
+import os
+os.environ.update({env!r})
+"""
+
+_UNSET_ENV_CODE = """
+import os
+for name in {names!r}:
+    os.environ.pop(name, None)
+"""
+
+# Evaluated as a user expression; builds no names in the user namespace
+_FINGERPRINT_EXPR = (
+    "__import__('json').dumps({{"
+    "'names': sorted(k for k in get_ipython().user_ns if not k.startswith('_')), "
+    "'cwd': __import__('os').getcwd(), "
+    "'sys_path': list(__import__('sys').path), "
+    "'environ': __import__('hashlib').sha256(repr(sorted(__import__('os').environ.items())).encode()).hexdigest(), "
+    "'rng_seeded': __import__('random').getstate() == __import__('random').Random({seed}).getstate() and ("
+    "'numpy' not in __import__('sys').modules or "
+    "__import__('sys').modules['numpy'].random.get_state()[1].tobytes() == "
+    "__import__('sys').modules['numpy'].random.RandomState({seed}).get_state()[1].tobytes())"
+    "}})"
+)
+
+
+class _PooledKernel:
+    """A running kernel and its pristine fingerprint."""
+
+    def __init__(self, km: 'AsyncKernelManager'):
+        self.km = km
+        self.baseline: dict[str, Any] = {}
+        self.runs = 0
+
+
+class KernelPool:
+    """
+    Pool of pre-started, pre-imported kernels leased to notebook runs.
+
+    Thread-safe: leases block until a kernel is idle, so one pool can serve
+    a concurrent sweep.
+
+    Attributes:
+        size: Number of kernels
+        kernel_name: Jupyter kernel spec name
+        warmup_imports: Modules imported into each kernel at start
+        max_runs_per_kernel: Restart a kernel after this many runs
+        start_timeout: Seconds to wait for a kernel to become ready
+
+    Example:
+        >>> with KernelPool(size=4, warmup_imports=('numpy', 'pandas', 'torch')) as pool:
+        ...     for seed in range(20):
+        ...         execute_notebook_experiment(
+        ...             "notebooks/exploration/001_initial_test.ipynb",
+        ...             Path(f"experiments/seed_{seed}"),
+        ...             {'random_seed': seed},
+        ...             kernel_pool=pool,
+        ...         )
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        kernel_name: str = 'python3',
+        warmup_imports: tuple[str, ...] = DEFAULT_WARMUP_IMPORTS,
+        max_runs_per_kernel: int = 20,
+        start_timeout: int = 60,
+    ):
+        if not JUPYTER_CLIENT_AVAILABLE:
+            raise ImportError("jupyter_client is required for KernelPool")
+        self.size = size
+        self.kernel_name = kernel_name
+        self.warmup_imports = tuple(warmup_imports)
+        self.max_runs_per_kernel = max_runs_per_kernel
+        self.start_timeout = start_timeout
+        self._idle: queue.Queue[_PooledKernel] = queue.Queue()
+        self._kernels: list[_PooledKernel] = []
+        self._lock = threading.Lock()
+
+    def start(self) -> 'KernelPool':
+        """Start and warm every kernel."""
+        for _ in range(self.size - len(self._kernels)):
+            self._idle.put(self._start_kernel())
+        return self
+
+    def shutdown(self) -> None:
+        """Stop every kernel in the pool."""
+        with self._lock:
+            kernels, self._kernels = self._kernels, []
+        for kernel in kernels:
+            self._stop_kernel(kernel)
+
+    def __enter__(self) -> 'KernelPool':
+        return self.start()
+
+    def __exit__(self, *exc) -> bool:
+        self.shutdown()
+        return False
+
+    @contextmanager
+    def lease(
+        self,
+        random_seed: int,
+        timeout: float | None = LEASE_TIMEOUT_SECONDS,
+        env: dict[str, str] | None = None,
+    ) -> Iterator['AsyncKernelManager']:
+        """
+        Lease a clean, reseeded kernel for one run.
+
+        Args:
+            random_seed: Seed applied to the kernel's global RNGs
+            timeout: Seconds to wait for an idle kernel (default: 600;
+                None waits forever)
+            env: Environment variables set in the kernel for this run only
+
+        Yields:
+            AsyncKernelManager with a running kernel (pass as papermill's km=)
+
+        Raises:
+            RuntimeError: If the pool has no kernels, none becomes idle within
+                timeout, or the kernel cannot be brought to a clean state
+        """
+        if not self._kernels:
+            raise RuntimeError("KernelPool has no kernels; call start() or use it as a context manager")
+        try:
+            kernel = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise RuntimeError(f"No pooled kernel became idle within {timeout:g}s") from None
+        env = env or {}
+        healthy = False
+        try:
+            self._prepare(kernel, random_seed)
+            if env:
+                self._execute(kernel, _PRIVATE_EXEC.format(code=_SET_ENV_CODE.format(env=env)))
+            yield kernel.km
+            healthy = True
+        finally:
+            self._release(kernel, healthy, env)
+
+    def _prepare(self, kernel: _PooledKernel, random_seed: int) -> None:
+        """Reseed and verify the kernel matches its pristine fingerprint."""
+        for _ in range(2):
+            self._execute(kernel, _PRIVATE_EXEC.format(code=_RESEED_CODE.format(seed=int(random_seed))))
+            fingerprint = self._fingerprint(kernel, random_seed)
+            rng_seeded = fingerprint.pop('rng_seeded')
+            if rng_seeded and fingerprint == kernel.baseline:
+                return
+            logger.warning("Pooled kernel failed the clean-state check; restarting it")
+            self._restart(kernel)
+        raise RuntimeError("Pooled kernel could not be brought to a clean state")
+
+    def _release(self, kernel: _PooledKernel, healthy: bool, env: dict[str, str]) -> None:
+        """Reset or restart a kernel after a run and return it to the pool."""
+        kernel.runs += 1
+        try:
+            if not healthy or kernel.runs >= self.max_runs_per_kernel:
+                self._restart(kernel)
+            else:
+                if env:
+                    self._execute(kernel, _PRIVATE_EXEC.format(code=_UNSET_ENV_CODE.format(names=sorted(env))))
+                self._execute(kernel, _RESET_CODE)
+        except Exception as e:
+            logger.warning(f"Pooled kernel could not be recycled, restarting: {e}")
+            try:
+                self._restart(kernel)
+            except Exception as restart_error:
+                # Replace the kernel rather than hand out a broken one
+                logger.warning(f"Replacing pooled kernel: {restart_error}")
+                with self._lock:
+                    if kernel in self._kernels:
+                        self._kernels.remove(kernel)
+                self._stop_kernel(kernel)
+                try:
+                    kernel = self._start_kernel()
+                except Exception as start_error:
+                    logger.warning(f"Could not start a replacement kernel: {start_error}")
+                    return
+        self._idle.put(kernel)
+
+    def _start_kernel(self) -> _PooledKernel:
+        """Start, warm and register one kernel."""
+        kernel = _PooledKernel(AsyncKernelManager(kernel_name=self.kernel_name))
+        run_sync(kernel.km.start_kernel)()
+        try:
+            self._warm(kernel)
+        except Exception:
+            self._stop_kernel(kernel)
+            raise
+        with self._lock:
+            self._kernels.append(kernel)
+        return kernel
+
+    def _stop_kernel(self, kernel: _PooledKernel) -> None:
+        try:
+            run_sync(kernel.km.shutdown_kernel)(now=True)
+        except Exception as e:
+            logger.warning(f"Error shutting down pooled kernel: {e}")
+
+    def _restart(self, kernel: _PooledKernel) -> None:
+        run_sync(kernel.km.restart_kernel)(now=True)
+        kernel.runs = 0
+        self._warm(kernel)
+
+    def _warm(self, kernel: _PooledKernel) -> None:
+        """Import warmup modules and record the pristine fingerprint."""
+        self._execute(kernel, _PRIVATE_EXEC.format(code=_WARMUP_CODE.format(modules=self.warmup_imports)))
+        baseline = self._fingerprint(kernel, 0)
+        baseline.pop('rng_seeded')
+        kernel.baseline = baseline
+
+    def _execute(self, kernel: _PooledKernel, code: str, **kwargs: Any) -> dict[str, Any]:
+        """Run housekeeping code and wait for the kernel to report idle.
+
+        Each call uses a fresh blocking client: one kept across runs would
+        carry iopub traffic from the notebook runs.
+        """
+        client = kernel.km.blocking_client()
+        client.start_channels()
+        try:
+            client.wait_for_ready(timeout=self.start_timeout)
+            # Returns only after the request's idle status arrives on iopub
+            reply = client.execute_interactive(
+                code,
+                silent=True,
+                store_history=False,
+                timeout=self.start_timeout,
+                output_hook=lambda msg: None,
+                **kwargs,
+            )
+        finally:
+            client.stop_channels()
+        content = reply['content']
+        if content['status'] != 'ok':
+            raise RuntimeError(f"Kernel housekeeping failed: {content.get('ename')}: {content.get('evalue')}")
+        return content
+
+    def _fingerprint(self, kernel: _PooledKernel, random_seed: int) -> dict[str, Any]:
+        content = self._execute(
+            kernel,
+            '',
+            user_expressions={'fingerprint': _FINGERPRINT_EXPR.format(seed=int(random_seed))},
+        )
+        result = content['user_expressions']['fingerprint']
+        if result.get('status') != 'ok':
+            raise RuntimeError(f"Kernel fingerprint failed: {result.get('ename')}: {result.get('evalue')}")
+        # The expression's repr is a quoted JSON string
+        return json.loads(ast.literal_eval(result['data']['text/plain']))
@@ -0,0 +1,179 @@
+"""Live metrics channel for notebook experiments.
+
+Metrics are appended to a JSONL side file (run_dir/metrics.jsonl) while the
+notebook runs, one record per line:
+
+    {"name": "accuracy", "value": 0.93, "time": 1760000000.0, "cell": 7}
+
+Two writers feed the file:
+- The executor mirrors scrapbook glue() scraps from each cell's outputs as
+  soon as the cell finishes (nbclient's on_cell_executed hook), so existing
+  notebooks need no changes.
+- Notebooks can call log_metric() directly, e.g. once per epoch.
+
+Because records are flushed line by line, metrics survive a kernel crash,
+and the final metrics come from folding the file (last value per name wins)
+rather than deserializing the output notebook.
+"""
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+# Set by the executor in the kernel's environment so log_metric() can find
+# the side file; also injected as a parameter when the notebook declares it
+METRICS_PATH_ENV = 'GRD_METRICS_PATH'
+METRICS_PATH_PARAMETER = 'grd_metrics_path'
+
+# Mimetype prefix scrapbook uses for glue() outputs
+_SCRAP_MIMETYPE_PREFIX = 'application/scrapbook.scrap.'
+
+
+def log_metric(name: str, value: Any, path: str | None = None) -> None:
+    """
+    Append a metric to the run's live metrics file (call from a notebook).
+
+    Args:
+        name: Metric name
+        value: JSON-serializable value (non-serializable values are stringified)
+        path: Metrics file; defaults to the grd_metrics_path parameter
+            (if the notebook declares it), then the GRD_METRICS_PATH
+            environment variable set by the executor.
+            Without either, the call is a no-op (e.g. interactive use).
+
+    Example:
+        >>> for epoch in range(epochs):
+        ...     log_metric('val_loss', val_loss)
+    """
+    main_ns = getattr(sys.modules.get('__main__'), '__dict__', {})
+    path = path or main_ns.get(METRICS_PATH_PARAMETER) or os.environ.get(METRICS_PATH_ENV)
+    if path:
+        _append(Path(path), {'name': name, 'value': value, 'time': time.time(), 'cell': None})
+
+
+def _append(path: Path, record: dict[str, Any]) -> None:
+    # One write per line keeps concurrent appends from interleaving
+    line = json.dumps(record, default=str) + '\n'
+    with open(path, 'a') as f:
+        f.write(line)
+        f.flush()
+
+
+def scraps_from_outputs(outputs: list[dict[str, Any]]) -> list[tuple[str, Any]]:
+    """
+    Extract scrapbook glue() scraps from one cell's outputs.
+
+    Args:
+        outputs: nbformat output dicts of an executed cell
+
+    Returns:
+        List of (name, data) pairs in output order
+    """
+    scraps = []
+    for output in outputs:
+        if output.get('output_type') not in ('display_data', 'execute_result'):
+            continue
+        for mimetype, payload in output.get('data', {}).items():
+            if mimetype.startswith(_SCRAP_MIMETYPE_PREFIX) and isinstance(payload, dict):
+                if 'name' in payload:
+                    scraps.append((payload['name'], payload.get('data')))
+    return scraps
+
+
+class MetricsChannel:
+    """
+    Append-only JSONL metrics file with incremental tailing.
+
+    Attributes:
+        path: JSONL file path
+        latest: Last value seen per metric name
+        cells_seen: Cells reported through cell_hook() since the last reset
+
+    Example:
+        >>> channel = MetricsChannel(run_dir / "metrics.jsonl")
+        >>> channel.reset()
+        >>> # ... notebook runs, calling log_metric() ...
+        >>> for record in channel.poll():
+        ...     print(record['name'], record['value'])
+        >>> final = channel.metrics()
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.latest: dict[str, Any] = {}
+        self.cells_seen = 0
+        self._offset = 0
+
+    def reset(self) -> None:
+        """Start a fresh file (e.g. at the start of an attempt)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text('')
+        self.latest = {}
+        self.cells_seen = 0
+        self._offset = 0
+
+    def write(self, name: str, value: Any, cell: int | None = None) -> None:
+        """Append one metric record."""
+        _append(self.path, {'name': name, 'value': value, 'time': time.time(), 'cell': cell})
+
+    def poll(self) -> list[dict[str, Any]]:
+        """
+        Read records appended since the last poll.
+
+        Only complete lines are consumed; a line still being written is
+        picked up by a later poll.
+
+        Returns:
+            New records in file order
+        """
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(self._offset)
+                chunk = f.read()
+        except FileNotFoundError:
+            return []
+        end = chunk.rfind(b'\n') + 1
+        self._offset += end
+
+        records = []
+        for line in chunk[:end].splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # Torn line from a crashed writer
+            records.append(record)
+            self.latest[record['name']] = record['value']
+        return records
+
+    def metrics(self) -> dict[str, Any]:
+        """Fold every record so far into {name: last value}."""
+        self.poll()
+        return dict(self.latest)
+
+    def cell_hook(
+        self,
+        on_metrics: Callable[[list[dict[str, Any]]], None] | None = None,
+    ) -> Callable[..., None]:
+        """
+        Build an nbclient on_cell_executed hook for this channel.
+
+        The hook mirrors the cell's glue() scraps into the file, then tails
+        the file and passes any new records to on_metrics.
+
+        Args:
+            on_metrics: Optional callback receiving newly seen records
+
+        Returns:
+            Hook accepting nbclient's (cell, cell_index, execute_reply) kwargs
+        """
+        def hook(cell: Any = None, cell_index: int | None = None, **kwargs: Any) -> None:
+            self.cells_seen += 1
+            if cell is not None:
+                for name, value in scraps_from_outputs(cell.get('outputs', [])):
+                    self.write(name, value, cell=cell_index)
+            records = self.poll()
+            if records and on_metrics is not None:
+                on_metrics(records)
+        return hook
@@ -2,18 +2,66 @@
 
 This module provides the core execution engine for running Jupyter notebooks
 through the GRD validation loop with full reproducibility guarantees:
-- Fresh kernel per run (papermill handles automatically)
+- Fresh kernel per run, or an opt-in pool of pre-warmed kernels with a
+  clean-state guard (kernel_pool.py)
 - Cell-level timeouts to catch infinite loops
-- Structured output extraction via scrapbook
-- Retry logic for transient failures
+- Live metric capture to a JSONL side file (scrapbook glue() scraps are
+  mirrored as each cell finishes; see metrics_channel.py)
+- Per-cell wall/CPU time, peak RSS and output size (profile.json)
+- A CPU/RSS/I/O/pressure time series for the whole run (resources.bin)
+- Opt-in memoization of cell results across runs (cell_cache.py)
+- Opt-in offloading of large outputs to blob files (output_offload.py)
+- Retry of transient failures only (kernel death, cell timeouts, out of
+  memory) with exponential backoff, resuming from the cell cache or the
+  run's CheckpointHandler checkpoints
+- Parallel parameter sweeps with a hardware-sized worker pool
+- Opt-in recording of run durations for learned estimates (hardware/history.py)
 """
+import csv
+import inspect
+import itertools
 import json
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 
 import papermill as pm
 import scrapbook as sb
+from jupyter_client import AsyncKernelManager
+from jupyter_core.utils import run_sync
+from nbclient.exceptions import CellTimeoutError, DeadKernelError
+
+from .hardware import capture_hardware_profile, HardwareProfile, RunHistory
+from .hardware.sampler import RESOURCE_SAMPLE_INTERVAL_SECONDS, ResourceSampler, summarize_resource_samples
+from .hardware.history import input_data_bytes, notebook_fingerprint
+from .admission import predict_file_memory_gb
+from .cell_cache import CellCache
+from .cell_profiler import CellProfiler
+from .experiment.checkpoint_handler import _EPOCH_FILE_RE, CHECKPOINT_DIR_ENV, CHECKPOINT_DIR_PARAMETER
+from .kernel_pool import KernelPool
+from .metrics_channel import MetricsChannel, METRICS_PATH_ENV, METRICS_PATH_PARAMETER, scraps_from_outputs
+from .output_offload import OutputOffloader
+
+# Sweep sizing when no run's data files can be sized
+DEFAULT_MEMORY_PER_RUN_GB = 2.0
+
+# Memory of a kernel with the usual scientific stack imported, before any data
+KERNEL_BASE_MEMORY_GB = 0.25
+
+# Cell error names worth retrying: resource exhaustion and flaky I/O.
+# Any other cell error is deterministic and fails the run immediately.
+TRANSIENT_ERROR_NAMES = frozenset({
+    'MemoryError',
+    'OutOfMemoryError',  # torch.cuda.OutOfMemoryError
+    'TimeoutError',
+    'ConnectionError',
+    'ConnectionResetError',
+    'ConnectionRefusedError',
+    'BrokenPipeError',
+})
 
 
 def execute_notebook_experiment(
@@ -22,15 +70,45 @@ def execute_notebook_experiment(
     parameters: dict[str, Any],
     execution_timeout: int = 300,
     start_timeout: int = 60,
-    retry_on_failure: bool = True
+    retry_on_failure: bool = True,
+    kernel_pool: KernelPool | None = None,
+    on_metrics: Callable[[list[dict[str, Any]]], None] | None = None,
+    cell_cache: CellCache | None = None,
+    max_attempts: int | None = None,
+    retry_backoff_seconds: float = 2.0,
+    max_output_bytes: int | None = None,
+    max_stream_bytes: int | None = None,
+    run_history: RunHistory | None = None,
+    resource_sample_interval: float | None = RESOURCE_SAMPLE_INTERVAL_SECONDS
 ) -> dict[str, Any]:
     """
     Execute a notebook as a GRD experiment with reproducibility guarantees.
 
     This function executes a parameterized Jupyter notebook using papermill,
-    extracts metrics via scrapbook, and saves results to the run directory.
+    captures metrics live, and saves results to the run directory.
     Each execution uses a fresh kernel to ensure reproducibility.
 
+    Metrics stream to run_dir/metrics.jsonl while the notebook runs: glue()
+    scraps are mirrored after each cell, and notebooks may also call
+    metrics_channel.log_metric(), which finds the file through the
+    GRD_METRICS_PATH environment variable of the kernel. Final metrics are folded from that file,
+    so the output notebook is never re-parsed and metrics survive crashes.
+
+    Only transient failures are retried: kernel death (including OOM
+    kills), cell timeouts and errors named in TRANSIENT_ERROR_NAMES. Any
+    other cell error reproduces on every attempt, so the run fails at once.
+    A retry resumes instead of starting over where it can: with cell_cache
+    it restores every cell that completed, and notebooks that point a
+    CheckpointHandler at run_checkpoint_dir() (run_dir/checkpoints, from
+    the kernel's GRD_CHECKPOINT_DIR environment variable) pick up their
+    latest checkpoint. Without either, a retry re-runs the whole notebook
+    from the first cell.
+
+    The run-specific paths reach the kernel through its environment, so
+    output.ipynb and cell cache keys hold only the given parameters. A
+    notebook whose parameters cell declares grd_metrics_path or
+    grd_checkpoint_dir also gets them injected as parameters.
+
     Args:
         notebook_path: Path to input notebook (e.g., "notebooks/exploration/exp.ipynb")
         run_dir: Directory for outputs (e.g., Path("experiments/run_042"))
@@ -39,16 +117,53 @@ def execute_notebook_experiment(
         execution_timeout: Seconds per cell before timeout (default: 300 = 5 min).
             Applies to each cell individually, not total execution.
         start_timeout: Seconds to wait for kernel startup (default: 60).
-        retry_on_failure: If True, retry once on execution failure before
-            marking run as failed (default: True).
+        retry_on_failure: If True, retry transient failures before marking
+            the run as failed (default: True).
+        kernel_pool: Optional KernelPool of pre-warmed kernels. The run leases
+            a kernel that is reset, reseeded with random_seed and checked
+            clean, instead of starting a fresh one (default: fresh kernel).
+        on_metrics: Optional callback receiving new metric records (dicts
+            with name, value, time, cell) after each cell finishes.
+        cell_cache: Optional CellCache. The longest prefix of cells whose
+            source, parameters read, input files and predecessors are
+            unchanged is restored from the cache instead of executed
+            (default: execute every cell). Also what lets a retry skip
+            the cells that completed before a transient failure.
+        max_attempts: Total attempts for transient failures when
+            retry_on_failure is set (default: 2).
+        retry_backoff_seconds: Wait before the first retry; doubles on each
+            further retry (default: 2.0).
+        max_output_bytes: Rich outputs (images, HTML, JSON) larger than this
+            are moved to run_dir/output_blobs/ and referenced from
+            output.ipynb (default: keep every output inline).
+        max_stream_bytes: stdout/stderr kept in output.ipynb per cell; the
+            full text of longer streams goes to run_dir/output_blobs/
+            (default: no cap).
+        run_history: Optional RunHistory that records this run's duration
+            (keyed by notebook, parameters, input data size and machine),
+            so estimate_training_duration() can learn from it.
+        resource_sample_interval: Seconds between samples of kernel CPU,
+            RSS, I/O and system memory/IO pressure, written to
+            run_dir/resources.bin (default: 1.0; None disables sampling).
 
     Returns:
         Dict with keys:
             - success: bool - True if notebook executed without errors
             - output_notebook: str | None - Path to executed notebook with outputs
-            - metrics: dict - All metrics extracted via scrapbook glue()
+            - metrics: dict - All metrics from glue() or log_metric() (last value wins)
             - error: str | None - Error message if execution failed
             - execution_time_seconds: float - Total execution time
+            - slowest_cells: list - Up to 5 cell profiles (cell_index,
+              source_preview, wall_seconds, cpu_seconds, peak_rss_mb,
+              output_bytes), slowest first. All cells are in
+              run_dir/profile.json.
+            - cached_cells: int - Code cells restored from cell_cache
+            - resource_usage: dict - p50/p95/max per sampled resource
+              (cpu_percent, rss_mb, read_mbps, ...) over all attempts,
+              see summarize_resource_samples(); {} if not sampled
+            - attempts: int - Attempts made
+            - failure_kind: str | None - 'transient' or 'deterministic' for
+              the last failure, None if the first attempt succeeded
 
     Raises:
         ValueError: If 'random_seed' not in parameters (hard requirement for
@@ -81,33 +196,87 @@ def execute_notebook_experiment(
     run_dir = Path(run_dir)
     run_dir.mkdir(parents=True, exist_ok=True)
     output_path = run_dir / "output.ipynb"
+    resources_path = run_dir / "resources.bin"
+    resources_path.unlink(missing_ok=True)
+    channel = MetricsChannel(run_dir.resolve() / "metrics.jsonl")
+    checkpoint_dir = run_dir.resolve() / "checkpoints"
+    run_env = {
+        METRICS_PATH_ENV: str(channel.path),
+        CHECKPOINT_DIR_ENV: str(checkpoint_dir),
+    }
+    # Only notebooks that declare the paths get them as parameters;
+    # papermill warns about any other unknown parameter
+    declared = pm.inspect_notebook(notebook_path)
+    run_parameters = {**parameters}
+    for name, value in ((METRICS_PATH_PARAMETER, str(channel.path)), (CHECKPOINT_DIR_PARAMETER, str(checkpoint_dir))):
+        if name in declared:
+            run_parameters[name] = value
 
     # Determine retry attempts
-    max_attempts = 2 if retry_on_failure else 1
+    if not retry_on_failure:
+        max_attempts = 1
+    max_attempts = max(1, max_attempts if max_attempts is not None else 2)
     attempt = 0
     last_error = None
+    failure_kind = None
+
+    profiler = None
+    cached_cells = 0
+    offloader = None
+    if max_output_bytes is not None or max_stream_bytes is not None:
+        offloader = OutputOffloader(run_dir / "output_blobs", max_output_bytes, max_stream_bytes)
 
     while attempt < max_attempts:
         attempt += 1
+        attempt_start = time.time()
+        resumed_checkpoint = attempt > 1 and _latest_checkpoint_epoch(checkpoint_dir) is not None
+        channel.reset()
+        input_path = notebook_path
+        if cell_cache is not None:
+            # A retry re-reads the cache, so it resumes after the last stored cell
+            plan = cell_cache.prepare(notebook_path, parameters, run_dir / ".cell_cache_input.ipynb")
+            input_path = plan['input_path']
+            cached_cells = plan['cached_cells']
         try:
-            # Execute with papermill (fresh kernel per run - automatic)
-            # kernel_name=None auto-detects from notebook metadata,
-            # falls back to current environment if not specified
-            pm.execute_notebook(
-                notebook_path,
-                str(output_path),
-                parameters=parameters,
-                execution_timeout=execution_timeout,
-                start_timeout=start_timeout,
-                kernel_name=None,  # Auto-detect from notebook metadata
-            )
+            with _run_kernel(notebook_path, kernel_pool, parameters['random_seed'], run_env) as km:
+                profiler = CellProfiler(_kernel_pid(km))
+                sampler = None
+                if resource_sample_interval is not None:
+                    sampler = ResourceSampler(_kernel_pid(km), resources_path, resource_sample_interval, start_time)
+                hooks = [profiler.on_cell_end, channel.cell_hook(on_metrics)]
+                snapshot_hook = cell_cache.cell_hook(km) if cell_cache is not None else None
+                if snapshot_hook is not None:
+                    hooks.append(snapshot_hook)
+                if offloader is not None:
+                    # After the cache hook, so cached outputs stay complete
+                    hooks.append(offloader)
+                try:
+                    # kernel_name=None auto-detects from notebook metadata;
+                    # the kernel itself is already running (km)
+                    pm.execute_notebook(
+                        input_path,
+                        str(output_path),
+                        parameters=run_parameters,
+                        execution_timeout=execution_timeout,
+                        start_timeout=start_timeout,
+                        kernel_name=None,
+                        km=km,
+                        on_notebook_start=snapshot_hook.start if snapshot_hook is not None else None,
+                        on_cell_execute=profiler.on_cell_start,
+                        on_cell_executed=_chain_hooks(*hooks),
+                    )
+                finally:
+                    profiler.stop()
+                    profiler.write(run_dir / "profile.json")
+                    if sampler is not None:
+                        sampler.stop()
+                    if snapshot_hook is not None:
+                        snapshot_hook.close()
+                        _finalize_cached_cells(cell_cache, output_path, channel)
+                        if offloader is not None and cached_cells:
+                            offloader.offload_notebook(output_path)
 
-            # Extract metrics with scrapbook
-            nb = sb.read_notebook(str(output_path))
-            metrics = {
-                name: scrap.data
-                for name, scrap in nb.scraps.items()
-            }
+            metrics = _collect_metrics(channel, output_path)
 
             # Add execution time to metrics
             execution_time = time.time() - start_time
@@ -118,38 +287,50 @@ def execute_notebook_experiment(
             with open(metrics_path, 'w') as f:
                 json.dump(metrics, f, indent=2, default=str)
 
+            if run_history is not None:
+                # Only this attempt's own time: failed attempts and backoff
+                # before it are not part of how long the notebook takes
+                _record_run(
+                    run_history, notebook_path, parameters, time.time() - attempt_start, True,
+                    partial=bool(cached_cells) or resumed_checkpoint,
+                )
+
             return {
                 'success': True,
                 'output_notebook': str(output_path),
                 'metrics': metrics,
                 'error': None,
-                'execution_time_seconds': execution_time
+                'execution_time_seconds': execution_time,
+                'slowest_cells': profiler.slowest(),
+                'cached_cells': cached_cells,
+                'resource_usage': summarize_resource_samples(resources_path),
+                'attempts': attempt,
+                'failure_kind': failure_kind
             }
 
-        except pm.PapermillExecutionError as e:
-            last_error = str(e)
+        except (pm.PapermillExecutionError, DeadKernelError, CellTimeoutError) as e:
+            last_error = str(e) if isinstance(e, pm.PapermillExecutionError) else f"{type(e).__name__}: {e}"
+            if not _is_transient_failure(e):
+                # Code errors reproduce on every attempt
+                failure_kind = 'deterministic'
+                break
+            failure_kind = 'transient'
             if attempt < max_attempts:
-                print(f"Execution failed (attempt {attempt}/{max_attempts}): {e}")
-                print("Retrying...")
-            # Continue to next attempt or exit loop
+                delay = retry_backoff_seconds * 2 ** (attempt - 1)
+                print(f"Execution failed (attempt {attempt}/{max_attempts}): {last_error}")
+                print(f"Retrying in {delay:g}s ({_describe_resume(cell_cache, checkpoint_dir)})...")
+                time.sleep(delay)
 
     # All attempts failed
     execution_time = time.time() - start_time
 
-    # Try to extract partial metrics if output notebook exists
-    metrics = {}
-    output_notebook_path = None
-    if output_path.exists():
-        output_notebook_path = str(output_path)
-        try:
-            nb = sb.read_notebook(str(output_path))
-            metrics = {
-                name: scrap.data
-                for name, scrap in nb.scraps.items()
-            }
-        except Exception:
-            # Failed to extract metrics from partial notebook
-            pass
+    # Metrics streamed before the failure survive in the side file
+    output_notebook_path = str(output_path) if output_path.exists() else None
+    try:
+        metrics = _collect_metrics(channel, output_path)
+    except Exception:
+        # Failed to extract metrics from partial notebook
+        metrics = {}
 
     metrics['execution_time_seconds'] = execution_time
 
@@ -158,10 +339,394 @@ def execute_notebook_experiment(
     with open(metrics_path, 'w') as f:
         json.dump(metrics, f, indent=2, default=str)
 
+    if run_history is not None:
+        _record_run(run_history, notebook_path, parameters, execution_time, False, partial=bool(cached_cells))
+
     return {
         'success': False,
         'output_notebook': output_notebook_path,
         'metrics': metrics,
         'error': last_error,
-        'execution_time_seconds': execution_time
+        'execution_time_seconds': execution_time,
+        'slowest_cells': profiler.slowest() if profiler is not None else [],
+        'cached_cells': cached_cells,
+        'resource_usage': summarize_resource_samples(resources_path),
+        'attempts': attempt,
+        'failure_kind': failure_kind
+    }
+
+
+@contextmanager
+def _run_kernel(
+    notebook_path: str,
+    kernel_pool: KernelPool | None,
+    random_seed: int,
+    env: dict[str, str]
+) -> Iterator[AsyncKernelManager]:
+    """Provide a running kernel for one attempt.
+
+    Fresh kernels are started here rather than inside papermill so the cell
+    profiler can watch the kernel process; papermill/nbclient use the given
+    kernel and leave shutdown to us. The manager must be asynchronous: nbclient
+    only notices a dead kernel through an async client, and with a blocking
+    one it waits for output forever. env is added to the kernel's environment.
+    """
+    if kernel_pool is not None:
+        # Leased kernel: the pool resets and reseeds it around the run
+        with kernel_pool.lease(random_seed, env=env) as km:
+            yield km
+        return
+
+    km = AsyncKernelManager(kernel_name=_notebook_kernel_name(notebook_path))
+    run_sync(km.start_kernel)(env={**os.environ, **env})
+    try:
+        yield km
+    finally:
+        run_sync(km.shutdown_kernel)(now=True)
+
+
+def _notebook_kernel_name(notebook_path: str) -> str:
+    """Kernel spec name from notebook metadata, as papermill would pick it."""
+    with open(notebook_path) as f:
+        metadata = json.load(f).get('metadata', {})
+    return metadata.get('kernelspec', {}).get('name') or 'python3'
+
+
+def _kernel_pid(km: AsyncKernelManager) -> int | None:
+    """Process id of a running kernel (jupyter_client 7+ and older)."""
+    provisioner = getattr(km, 'provisioner', None)
+    if getattr(provisioner, 'pid', None) is not None:
+        return provisioner.pid
+    return getattr(getattr(km, 'kernel', None), 'pid', None)
+
+
+def _chain_hooks(*hooks: Callable[..., Any]) -> Callable[..., Any]:
+    """Combine nbclient hooks so each receives the same keyword arguments.
+
+    nbclient awaits a hook that returns an awaitable, so the chain is a
+    coroutine and awaits the asynchronous hooks (the cell cache snapshot)
+    in order.
+    """
+    async def hook(**kwargs: Any) -> None:
+        for each in hooks:
+            result = each(**kwargs)
+            if inspect.isawaitable(result):
+                await result
+    return hook
+
+
+def _is_transient_failure(error: Exception) -> bool:
+    """Whether a failed attempt may succeed when retried."""
+    if isinstance(error, (DeadKernelError, CellTimeoutError)):
+        return True
+    return getattr(error, 'ename', None) in TRANSIENT_ERROR_NAMES
+
+
+def _latest_checkpoint_epoch(checkpoint_dir: Path) -> int | None:
+    """Newest epoch saved in the run's checkpoint directory, if any."""
+    # Plain (.pt) and sharded (.manifest.json) epoch files
+    matches = [_EPOCH_FILE_RE.match(path.name) for path in checkpoint_dir.glob("checkpoint_epoch_*")]
+    return max((int(match.group(1)) for match in matches if match), default=None)
+
+
+def _describe_resume(cell_cache: CellCache | None, checkpoint_dir: Path) -> str:
+    """Where a retry will pick up, for the retry message."""
+    epoch = _latest_checkpoint_epoch(checkpoint_dir)
+    points = []
+    if cell_cache is not None:
+        points.append("after the last cached cell")
+    if epoch is not None:
+        points.append(f"from checkpoint epoch {epoch}")
+    return "resuming " + " and ".join(points) if points else "from the first cell"
+
+
+def _finalize_cached_cells(cell_cache: CellCache, output_path: Path, channel: MetricsChannel) -> None:
+    """Restore skipped cells in the output notebook and replay their scraps."""
+    for outputs in cell_cache.finalize(output_path):
+        for name, value in scraps_from_outputs(outputs):
+            channel.write(name, value)
+
+
+def _record_run(
+    run_history: RunHistory,
+    notebook_path: str,
+    parameters: dict[str, Any],
+    seconds: float,
+    success: bool,
+    partial: bool
+) -> None:
+    """Add a finished run to the duration history.
+
+    Partial runs (cells restored from the cell cache, or a retry that
+    resumed from a checkpoint) did only part of the work, so they are
+    stored as unsuccessful and never feed predictions.
+    """
+    try:
+        run_history.record(
+            'notebook',
+            seconds,
+            capture_hardware_profile(),
+            work=input_data_bytes(parameters),
+            notebook_hash=notebook_fingerprint(notebook_path),
+            parameters=parameters,
+            success=success and not partial,
+        )
+    except Exception as e:
+        # History is advisory; never fail a finished run over it
+        print(f"Could not record run history: {e}")
+
+
+def _collect_metrics(channel: MetricsChannel, output_path: Path) -> dict[str, Any]:
+    """Fold the live metrics file, falling back to scrapbook if it never ran.
+
+    The cell hook needs nbclient >= 0.6. With older versions no cell is ever
+    reported, so scraps are read from the output notebook as before.
+    """
+    metrics = channel.metrics()
+    if channel.cells_seen == 0 and output_path.exists():
+        nb = sb.read_notebook(str(output_path))
+        metrics.update({name: scrap.data for name, scrap in nb.scraps.items()})
+    return metrics
+
+
+def _predict_run_memory_gb(parameter_sets: list[dict[str, Any]]) -> float:
+    """Peak memory of one sweep run, predicted from the data files it reads."""
+    paths = {
+        value for params in parameter_sets for value in params.values()
+        if isinstance(value, str) and Path(value).suffix in ('.csv', '.jsonl', '.parquet') and Path(value).is_file()
+    }
+    predictions = [gb for gb in map(predict_file_memory_gb, sorted(paths)) if gb is not None]
+    if not predictions:
+        return DEFAULT_MEMORY_PER_RUN_GB
+    memory_per_run_gb = KERNEL_BASE_MEMORY_GB + max(predictions)
+    available_gb = capture_hardware_profile()['memory']['available_gb']
+    print(f"Memory guard: predicted {memory_per_run_gb:.1f} GB per run from its data files")
+    if memory_per_run_gb > available_gb:
+        print(f"Warning: one run may need more than the {available_gb:.1f} GB available; "
+              "runs will execute one at a time")
+    return memory_per_run_gb
+
+
+def expand_parameter_grid(grid: dict[str, list[Any]]) -> list[dict[str, Any]]:
+    """
+    Expand a parameter grid into the Cartesian product of its values.
+
+    Args:
+        grid: Mapping of parameter name to candidate values
+
+    Returns:
+        List of parameter dicts, one per combination (grid key order)
+
+    Example:
+        >>> expand_parameter_grid({'alpha': [0.1, 0.5], 'random_seed': [1, 2]})
+        [{'alpha': 0.1, 'random_seed': 1}, {'alpha': 0.1, 'random_seed': 2},
+         {'alpha': 0.5, 'random_seed': 1}, {'alpha': 0.5, 'random_seed': 2}]
+    """
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+
+def default_sweep_workers(
+    memory_per_run_gb: float = 2.0,
+    profile: HardwareProfile | None = None,
+) -> int:
+    """
+    Size a sweep worker pool from the machine's cores and free memory.
+
+    Each run executes in its own kernel process, so concurrency is bounded by
+    physical cores (falling back to logical cores) and by how many runs fit
+    in available memory.
+
+    Args:
+        memory_per_run_gb: Expected peak memory of one notebook run
+        profile: Hardware profile (captured if not provided)
+
+    Returns:
+        Number of concurrent runs (at least 1)
+    """
+    profile = profile or capture_hardware_profile()
+    cores = profile['cpu']['cores_physical'] or profile['cpu']['cores_logical'] or 1
+    available_gb = profile['memory']['available_gb']
+    if available_gb > 0 and memory_per_run_gb > 0:
+        cores = min(cores, int(available_gb // memory_per_run_gb))
+    return max(1, cores)
+
+
+def execute_notebook_sweep(
+    notebook_path: str,
+    sweep_dir: Path,
+    parameters: list[dict[str, Any]] | dict[str, list[Any]],
+    max_workers: int | None = None,
+    memory_per_run_gb: float | None = None,
+    execution_timeout: int = 300,
+    start_timeout: int = 60,
+    retry_on_failure: bool = True,
+    kernel_pool: KernelPool | None = None,
+    cell_cache: CellCache | None = None,
+    max_attempts: int | None = None,
+    max_output_bytes: int | None = None,
+    max_stream_bytes: int | None = None,
+    run_history: RunHistory | None = None,
+    resource_sample_interval: float | None = RESOURCE_SAMPLE_INTERVAL_SECONDS
+) -> dict[str, Any]:
+    """
+    Execute a notebook once per parameter set, running sets concurrently.
+
+    Each run gets its own run directory (sweep_dir/run_000, run_001, ...)
+    and goes through execute_notebook_experiment, so every run keeps the
+    fresh-kernel reproducibility guarantees. Runs are dispatched from a
+    bounded thread pool; the notebooks themselves execute in separate kernel
+    processes, so threads only wait on kernels. When all runs finish, a
+    consolidated metrics table is written to sweep_dir/sweep_metrics.csv
+    and the full results to sweep_dir/sweep.json.
+
+    Args:
+        notebook_path: Path to input notebook
+        sweep_dir: Directory that will hold one run directory per parameter set
+        parameters: List of parameter dicts, or a grid (dict of name -> values)
+            expanded with expand_parameter_grid(). Every set MUST include
+            'random_seed'.
+        max_workers: Concurrent runs (default: sized by default_sweep_workers())
+        memory_per_run_gb: Expected peak memory per run, used for default
+            sizing (default: predicted from the largest data file named in
+            the parameters, assuming the notebook loads it whole; 2.0 GB if
+            none can be sized)
+        execution_timeout: Seconds per cell before timeout
+        start_timeout: Seconds to wait for kernel startup
+        retry_on_failure: Retry transient failures of each run
+        kernel_pool: Optional KernelPool shared by all runs; concurrency is
+            then also bounded by the pool size
+        cell_cache: Optional CellCache shared by all runs, so cells that do
+            not read the swept parameters are reused across runs
+        max_attempts: Attempt budget per run for transient failures
+        max_output_bytes: Offload larger rich outputs of each run to blobs
+        max_stream_bytes: Cap stdout/stderr kept inline per cell
+        run_history: Optional RunHistory recording every run's duration
+        resource_sample_interval: Seconds between resource samples of each
+            run (None disables sampling)
+
+    Returns:
+        Dict with keys:
+            - runs: list of per-run results (run_id, run_dir, parameters, plus
+              the execute_notebook_experiment result keys), in input order
+            - succeeded: int - Number of successful runs
+            - failed: int - Number of failed runs
+            - workers: int - Concurrent runs used
+            - metrics_table: str - Path to sweep_metrics.csv
+            - wall_time_seconds: float - Total sweep time
+
+    Raises:
+        ValueError: If any parameter set lacks 'random_seed'.
+
+    Example:
+        >>> sweep = execute_notebook_sweep(
+        ...     notebook_path="notebooks/exploration/001_initial_test.ipynb",
+        ...     sweep_dir=Path("experiments/seed_sweep"),
+        ...     parameters={'alpha': [0.6], 'random_seed': list(range(50))},
+        ... )
+        >>> print(f"{sweep['succeeded']}/{len(sweep['runs'])} runs succeeded")
+    """
+    start_time = time.time()
+
+    parameter_sets = expand_parameter_grid(parameters) if isinstance(parameters, dict) else list(parameters)
+    missing = [i for i, params in enumerate(parameter_sets) if 'random_seed' not in params]
+    if missing:
+        raise ValueError(
+            f"parameter sets {missing} are missing 'random_seed'. "
+            "GRD requires explicit random seed management to ensure reproducible results."
+        )
+
+    sweep_dir = Path(sweep_dir)
+    sweep_dir.mkdir(parents=True, exist_ok=True)
+    if memory_per_run_gb is None:
+        memory_per_run_gb = _predict_run_memory_gb(parameter_sets)
+    workers = max_workers or default_sweep_workers(memory_per_run_gb)
+    if kernel_pool is not None:
+        workers = min(workers, kernel_pool.size)
+    workers = max(1, min(workers, len(parameter_sets) or 1))
+
+    runs: list[dict[str, Any] | None] = [None] * len(parameter_sets)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        for i, params in enumerate(parameter_sets):
+            run_dir = sweep_dir / f"run_{i:03d}"
+            future = executor.submit(
+                execute_notebook_experiment,
+                notebook_path,
+                run_dir,
+                params,
+                execution_timeout=execution_timeout,
+                start_timeout=start_timeout,
+                retry_on_failure=retry_on_failure,
+                kernel_pool=kernel_pool,
+                cell_cache=cell_cache,
+                max_attempts=max_attempts,
+                max_output_bytes=max_output_bytes,
+                max_stream_bytes=max_stream_bytes,
+                run_history=run_history,
+                resource_sample_interval=resource_sample_interval,
+            )
+            futures[future] = (i, run_dir, params)
+
+        for done, future in enumerate(as_completed(futures), start=1):
+            i, run_dir, params = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # Kernel start failures etc. must not abort the other runs
+                result = {
+                    'success': False,
+                    'output_notebook': None,
+                    'metrics': {},
+                    'error': f"{type(e).__name__}: {e}",
+                    'execution_time_seconds': None,
+                    'slowest_cells': [],
+                    'cached_cells': 0,
+                    'resource_usage': {},
+                    'attempts': 0,
+                    'failure_kind': None,
+                }
+            runs[i] = {'run_id': run_dir.name, 'run_dir': str(run_dir), 'parameters': params, **result}
+            status = "ok" if result['success'] else "FAILED"
+            print(f"[{done}/{len(parameter_sets)}] {run_dir.name} {status}")
+
+    metrics_table = sweep_dir / "sweep_metrics.csv"
+    _write_sweep_table(metrics_table, runs)
+    succeeded = sum(1 for run in runs if run['success'])
+    summary = {
+        'runs': runs,
+        'succeeded': succeeded,
+        'failed': len(runs) - succeeded,
+        'workers': workers,
+        'metrics_table': str(metrics_table),
+        'wall_time_seconds': time.time() - start_time,
     }
+    with open(sweep_dir / "sweep.json", 'w') as f:
+        json.dump(summary, f, indent=2, default=str)
+    return summary
+
+
+def _write_sweep_table(path: Path, runs: list[dict[str, Any]]) -> None:
+    """Write one CSV row per run with params.* and metrics.* columns."""
+    param_names = list(dict.fromkeys(name for run in runs for name in run['parameters']))
+    metric_names = list(dict.fromkeys(name for run in runs for name in run['metrics']))
+    header = (
+        ['run_id', 'success', 'execution_time_seconds']
+        + [f"params.{name}" for name in param_names]
+        + [f"metrics.{name}" for name in metric_names]
+    )
+
+    def cell(value: Any) -> Any:
+        if value is None or isinstance(value, (str, int, float, bool)):
+            return value
+        return json.dumps(value, default=str)
+
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for run in runs:
+            writer.writerow(
+                [run['run_id'], run['success'], run['execution_time_seconds']]
+                + [cell(run['parameters'].get(name)) for name in param_names]
+                + [cell(run['metrics'].get(name)) for name in metric_names]
+            )
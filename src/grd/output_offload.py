@@ -0,0 +1,200 @@
+"""Output size control for executed notebooks.
+
+Large outputs (plots, HTML tables, long JSON) make run_dir/output.ipynb huge
+and every later read of the notebook slow. OutputOffloader runs as an
+nbclient on_cell_executed hook, so outputs are rewritten as each cell
+finishes, before papermill saves the notebook:
+- Rich output payloads over max_output_bytes are written to
+  content-addressed blob files (run_dir/output_blobs/<sha256>.<ext>) and
+  replaced by a reference. Images keep a Markdown link so the notebook
+  still renders in Jupyter.
+- stdout/stderr beyond max_stream_bytes per cell are cut; the full stream
+  text goes to a blob, so nothing is lost.
+
+scrapbook scraps and error outputs are never touched. inline_blobs() puts
+the original payloads back.
+"""
+import base64
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import nbformat
+
+# Output metadata key mapping mimetype -> blob path (relative to the notebook)
+BLOB_METADATA_KEY = 'grd_blobs'
+
+# Output metadata key listing placeholder mimetypes added in place of blobs
+_PLACEHOLDER_METADATA_KEY = 'grd_blob_placeholders'
+
+# Mimetype prefixes that must stay inline (metrics and papermill bookkeeping)
+_INLINE_PREFIXES = ('application/scrapbook.scrap.', 'application/papermill.')
+
+_EXTENSIONS = {
+    'image/png': '.png',
+    'image/jpeg': '.jpg',
+    'image/gif': '.gif',
+    'image/svg+xml': '.svg',
+    'text/html': '.html',
+    'text/plain': '.txt',
+    'text/markdown': '.md',
+    'text/latex': '.tex',
+    'application/json': '.json',
+    'application/javascript': '.js',
+}
+
+# Binary mimetypes are stored base64-encoded in notebooks
+_BASE64_MIMETYPES = ('image/png', 'image/jpeg', 'image/gif')
+
+
+class OutputOffloader:
+    """
+    Offload heavy cell outputs to blob files as cells finish.
+
+    Attributes:
+        blob_dir: Directory for blob files (next to the output notebook)
+        max_output_bytes: Largest payload kept inline per mimetype (None: no limit)
+        max_stream_bytes: stdout/stderr kept inline per cell and stream (None: no limit)
+        offloaded_bytes: Total payload bytes moved out of the notebook so far
+
+    Example:
+        >>> offloader = OutputOffloader(run_dir / "output_blobs", max_output_bytes=64 * 1024)
+        >>> pm.execute_notebook(..., on_cell_executed=offloader)
+    """
+
+    def __init__(
+        self,
+        blob_dir: Path,
+        max_output_bytes: int | None = 64 * 1024,
+        max_stream_bytes: int | None = None,
+    ):
+        self.blob_dir = Path(blob_dir)
+        self.max_output_bytes = max_output_bytes
+        self.max_stream_bytes = max_stream_bytes
+        self.offloaded_bytes = 0
+
+    def __call__(self, cell: Any = None, cell_index: int | None = None, **kwargs: Any) -> None:
+        """nbclient on_cell_executed hook: rewrite the cell's outputs in place."""
+        if cell is not None and cell.get('outputs'):
+            self.offload_cell(cell)
+
+    def offload_cell(self, cell: Any) -> None:
+        """Offload oversized payloads and cap stream text of one code cell."""
+        streamed: dict[str, int] = {}
+        for output in cell['outputs']:
+            if BLOB_METADATA_KEY in output.get('metadata', {}):
+                continue  # Already offloaded (offload_notebook after cell hooks)
+            output_type = output.get('output_type')
+            if output_type == 'stream' and self.max_stream_bytes is not None:
+                self._cap_stream(output, streamed)
+            elif output_type in ('display_data', 'execute_result') and self.max_output_bytes is not None:
+                self._offload_data(output)
+
+    def offload_notebook(self, notebook_path: Path) -> None:
+        """Apply offload_cell to every code cell of a saved notebook."""
+        nb = nbformat.read(str(notebook_path), as_version=4)
+        for cell in nb.cells:
+            if cell.cell_type == 'code' and cell.get('outputs'):
+                self.offload_cell(cell)
+        nbformat.write(nb, str(notebook_path))
+
+    def _offload_data(self, output: Any) -> None:
+        data = output.get('data', {})
+        references = {}
+        for mimetype, payload in list(data.items()):
+            if mimetype.startswith(_INLINE_PREFIXES):
+                continue
+            text = _payload_text(payload)
+            if len(text) <= self.max_output_bytes:
+                continue
+            references[mimetype] = self._write_blob(_payload_bytes(mimetype, text), _EXTENSIONS.get(mimetype, '.bin'))
+            self.offloaded_bytes += len(text)
+            del data[mimetype]
+        if not references:
+            return
+
+        placeholders = []
+        if 'text/plain' not in data:
+            data['text/plain'] = '\n'.join(
+                f"<{mimetype} output ({path}) offloaded>" for mimetype, path in references.items()
+            )
+            placeholders.append('text/plain')
+        images = [path for mimetype, path in references.items() if mimetype.startswith('image/')]
+        if images and 'text/markdown' not in data:
+            data['text/markdown'] = '\n'.join(f"![output]({path})" for path in images)
+            placeholders.append('text/markdown')
+        metadata = output.setdefault('metadata', {})
+        metadata[BLOB_METADATA_KEY] = references
+        metadata[_PLACEHOLDER_METADATA_KEY] = placeholders
+
+    def _cap_stream(self, output: Any, streamed: dict[str, int]) -> None:
+        text = _payload_text(output.get('text', ''))
+        name = output.get('name', 'stdout')
+        budget = max(self.max_stream_bytes - streamed.get(name, 0), 0)
+        streamed[name] = streamed.get(name, 0) + len(text)
+        if len(text) <= budget:
+            return
+        path = self._write_blob(text.encode(), '.txt')
+        self.offloaded_bytes += len(text) - budget
+        output['text'] = text[:budget] + f"\n[... {len(text) - budget} characters truncated; full {name} in {path}]\n"
+        output.setdefault('metadata', {})[BLOB_METADATA_KEY] = {name: path}
+
+    def _write_blob(self, content: bytes, extension: str) -> str:
+        """Store content under its hash; returns the path relative to the notebook."""
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        name = hashlib.sha256(content).hexdigest() + extension
+        path = self.blob_dir / name
+        if not path.exists():
+            tmp = path.with_name(f"{name}.{os.getpid()}.tmp")
+            tmp.write_bytes(content)
+            os.replace(tmp, path)
+        return f"{self.blob_dir.name}/{name}"
+
+
+def inline_blobs(notebook_path: Path, output_path: Path | None = None) -> None:
+    """
+    Put offloaded rich outputs back into a notebook.
+
+    Truncated streams are left as they are; their full text stays in the
+    referenced blob.
+
+    Args:
+        notebook_path: Notebook written with an OutputOffloader
+        output_path: Where to write the result (default: overwrite notebook_path)
+    """
+    notebook_path = Path(notebook_path)
+    nb = nbformat.read(str(notebook_path), as_version=4)
+    for cell in nb.cells:
+        for output in cell.get('outputs', []):
+            references = output.get('metadata', {}).get(BLOB_METADATA_KEY)
+            if not references or 'data' not in output:
+                continue
+            for mimetype in output['metadata'].pop(_PLACEHOLDER_METADATA_KEY, []):
+                output['data'].pop(mimetype, None)
+            for mimetype, path in references.items():
+                content = (notebook_path.parent / path).read_bytes()
+                if mimetype in _BASE64_MIMETYPES:
+                    output['data'][mimetype] = base64.b64encode(content).decode('ascii')
+                elif mimetype == 'application/json':
+                    output['data'][mimetype] = json.loads(content)
+                else:
+                    output['data'][mimetype] = content.decode()
+            del output['metadata'][BLOB_METADATA_KEY]
+    nbformat.write(nb, str(output_path or notebook_path))
+
+
+def _payload_text(payload: Any) -> str:
+    """Notebook payloads are strings, lists of lines, or JSON objects."""
+    if isinstance(payload, str):
+        return payload
+    if isinstance(payload, list):
+        return ''.join(payload)
+    return json.dumps(payload)
+
+
+def _payload_bytes(mimetype: str, text: str) -> bytes:
+    if mimetype in _BASE64_MIMETYPES:
+        return base64.b64decode(text)
+    return text.encode()
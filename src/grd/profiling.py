@@ -0,0 +1,762 @@
+"""Single-pass columnar profiling engine for data exploration.
+
+This module computes every per-column statistic that quick-explore and insights
+modes need in one vectorized pass per column. Downstream consumers (basic stats,
+column table, distribution highlights, quality warnings) read from the same
+cached profile instead of re-walking the DataFrame with repeated isnull(),
+nunique() and duplicated() calls.
+
+For files that do not fit in memory (or where a head sample would be biased),
+DatasetAccumulator builds the same DatasetProfile from a stream of chunks using
+the mergeable sketches in sketches.py.
+
+Wide tables can be profiled across a thread or process pool (profile_dataframe
+with workers > 1). The process backend copies numeric columns once into a
+shared-memory block that workers attach to, so the DataFrame is never pickled.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, Any, Iterable, List, Optional, Tuple, TypedDict
+
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from .sketches import MomentAccumulator, KLLSketch, HyperLogLog, StreamingHistogram
+
+
+# Number of histogram bins used for sparklines and distribution summaries
+HISTOGRAM_BINS = 8
+
+
+class ColumnProfile(TypedDict):
+    """Statistics for a single column, computed in one pass."""
+    name: str
+    dtype: str
+    kind: str  # 'numeric', 'boolean', 'datetime', 'categorical', 'text', 'other'
+    count: int  # non-null values
+    missing: int
+    distinct: Optional[int]  # None if unknown (footer-only profiles)
+    memory_bytes: int
+    infinite: int  # non-null +/-inf values, left out of every numeric statistic
+    min: Optional[float]
+    max: Optional[float]
+    mean: Optional[float]
+    std: Optional[float]
+    skewness: Optional[float]
+    q1: Optional[float]
+    median: Optional[float]
+    q3: Optional[float]
+    histogram: List[int]
+    outliers: int
+
+
+class DatasetProfile(TypedDict):
+    """Dataset-level profile shared by all report sections."""
+    rows: int
+    memory_bytes: int
+    duplicate_rows: int
+    columns: List[ColumnProfile]
+
+
+def profile_dataframe(
+    df: 'pd.DataFrame',
+    workers: Optional[int] = None,
+    backend: str = 'process',
+) -> DatasetProfile:
+    """Profile every column of a DataFrame in a single pass.
+
+    Args:
+        df: pandas DataFrame
+        workers: Number of parallel workers (None or 1 profiles serially)
+        backend: 'process' (shared-memory process pool) or 'thread'
+
+    Returns:
+        DatasetProfile with per-column statistics and dataset-level counts
+    """
+    if not PANDAS_AVAILABLE:
+        raise ImportError("pandas is required for profiling")
+
+    rows = len(df)
+    column_memory = df.memory_usage(index=False, deep=True)
+
+    if workers and workers > 1 and len(df.columns) > 1:
+        columns = _profile_columns_parallel(df, column_memory, workers, backend)
+    else:
+        columns = [
+            _profile_column(df.iloc[:, i], str(name), int(column_memory.iloc[i]))
+            for i, name in enumerate(df.columns)
+        ]
+
+    return DatasetProfile(
+        rows=rows,
+        memory_bytes=int(column_memory.sum()) + int(df.index.memory_usage(deep=True)),
+        duplicate_rows=int(df.duplicated().sum()) if rows > 0 else 0,
+        columns=columns,
+    )
+
+
+def column_kind(dtype: Any) -> str:
+    """Classify a pandas dtype into a profiling kind.
+
+    Args:
+        dtype: pandas or numpy dtype (or its string form)
+
+    Returns:
+        One of 'numeric', 'boolean', 'datetime', 'categorical', 'text', 'other'
+    """
+    types = pd.api.types
+    if isinstance(dtype, str):
+        try:
+            dtype = types.pandas_dtype(dtype)
+        except TypeError:
+            return 'other'
+    if types.is_bool_dtype(dtype):
+        return 'boolean'
+    if types.is_numeric_dtype(dtype) and not types.is_complex_dtype(dtype):
+        return 'numeric'
+    if types.is_datetime64_any_dtype(dtype):
+        return 'datetime'
+    if isinstance(dtype, pd.CategoricalDtype):
+        return 'categorical'
+    if types.is_object_dtype(dtype) or types.is_string_dtype(dtype):
+        return 'text'
+    return 'other'
+
+
+def empty_column_profile(name: str, dtype: str, kind: str) -> ColumnProfile:
+    """Create a column profile with no statistics filled in.
+
+    Args:
+        name: Column name
+        dtype: String form of the column dtype
+        kind: Profiling kind from column_kind()
+
+    Returns:
+        ColumnProfile with zero counts and no numeric statistics
+    """
+    return ColumnProfile(
+        name=name,
+        dtype=dtype,
+        kind=kind,
+        count=0,
+        missing=0,
+        distinct=0,
+        memory_bytes=0,
+        infinite=0,
+        min=None,
+        max=None,
+        mean=None,
+        std=None,
+        skewness=None,
+        q1=None,
+        median=None,
+        q3=None,
+        histogram=[],
+        outliers=0,
+    )
+
+
+def _profile_column(series: 'pd.Series', name: str, memory_bytes: int) -> ColumnProfile:
+    """Profile one column.
+
+    Numeric columns are sorted once; min/max, distinct count, quantiles and
+    IQR outliers all come from that sorted array. Other columns get a single
+    isna() and nunique() call.
+
+    Args:
+        series: Column data
+        name: Column name
+        memory_bytes: Deep memory usage of the column
+
+    Returns:
+        ColumnProfile for the column
+    """
+    kind = column_kind(series.dtype)
+    profile = empty_column_profile(name, str(series.dtype), kind)
+    profile['memory_bytes'] = memory_bytes
+
+    if kind == 'numeric' and NUMPY_AVAILABLE:
+        _profile_numeric_values(profile, series.to_numpy(dtype='float64', na_value=np.nan))
+    else:
+        missing = int(series.isna().sum())
+        profile['count'] = len(series) - missing
+        profile['missing'] = missing
+        try:
+            profile['distinct'] = int(series.nunique())
+        except TypeError:
+            # Unhashable values (e.g. lists from nested JSON)
+            profile['distinct'] = int(series.astype(str).nunique())
+
+    return profile
+
+
+def _profile_numeric_values(profile: ColumnProfile, values: 'np.ndarray') -> None:
+    """Fill counts and numeric statistics from a float64 array with NaN nulls.
+
+    Args:
+        profile: Column profile to update in place
+        values: Column values as float64
+    """
+    valid = np.sort(values[~np.isnan(values)])
+    profile['count'] = len(valid)
+    profile['missing'] = len(values) - len(valid)
+    _fill_numeric_stats(profile, valid)
+
+
+def _fill_numeric_stats(profile: ColumnProfile, valid: 'np.ndarray') -> None:
+    """Fill numeric statistics from a sorted array of non-null values.
+
+    Infinite values are counted in profile['infinite'] and otherwise
+    ignored, as in the streaming ColumnAccumulator.
+
+    Args:
+        profile: Column profile to update in place
+        valid: Sorted float64 array without NaN
+    """
+    if len(valid) == 0:
+        return
+
+    profile['distinct'] = 1 + int(np.count_nonzero(valid[1:] != valid[:-1]))
+
+    finite = valid if np.isfinite(valid[0]) and np.isfinite(valid[-1]) else valid[np.isfinite(valid)]
+    n = len(finite)
+    profile['infinite'] = len(valid) - n
+    if n == 0:
+        return
+
+    profile['min'] = float(finite[0])
+    profile['max'] = float(finite[-1])
+
+    mean = float(finite.mean())
+    deviations = finite - mean
+    m2 = float(np.mean(deviations ** 2))
+    m3 = float(np.mean(deviations ** 3))
+    profile['mean'] = mean
+    profile['std'] = (m2 * n / (n - 1)) ** 0.5 if n > 1 else 0.0
+    profile['skewness'] = m3 / m2 ** 1.5 if m2 > 0 else 0.0
+
+    q1, median, q3 = np.quantile(finite, [0.25, 0.5, 0.75])
+    profile['q1'] = float(q1)
+    profile['median'] = float(median)
+    profile['q3'] = float(q3)
+
+    hist, _ = np.histogram(finite, bins=HISTOGRAM_BINS)
+    profile['histogram'] = hist.tolist()
+
+    # IQR outliers via binary search on the sorted values
+    iqr = q3 - q1
+    lower = q1 - 1.5 * iqr
+    upper = q3 + 1.5 * iqr
+    below = int(np.searchsorted(finite, lower, side='left'))
+    above = n - int(np.searchsorted(finite, upper, side='right'))
+    profile['outliers'] = below + above
+
+
+def _profile_columns_parallel(
+    df: 'pd.DataFrame',
+    column_memory: 'pd.Series',
+    workers: int,
+    backend: str,
+) -> List[ColumnProfile]:
+    """Profile columns across a worker pool, preserving column order.
+
+    Args:
+        df: pandas DataFrame
+        column_memory: Deep memory usage per column (positional)
+        workers: Number of workers
+        backend: 'process' or 'thread'
+
+    Returns:
+        List of ColumnProfile in DataFrame column order
+    """
+    specs = [
+        (i, str(name), int(column_memory.iloc[i]))
+        for i, name in enumerate(df.columns)
+    ]
+
+    if backend == 'thread':
+        # numpy sort/quantile release the GIL, so threads scale on numeric columns
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_profile_column, df.iloc[:, i], name, memory)
+                for i, name, memory in specs
+            ]
+            return [future.result() for future in futures]
+
+    if backend != 'process':
+        raise ValueError(f"Unknown parallel backend: {backend!r} (expected 'process' or 'thread')")
+
+    numeric = [spec for spec in specs if column_kind(df.iloc[:, spec[0]].dtype) == 'numeric']
+    profiles: List[Optional[ColumnProfile]] = [None] * len(specs)
+
+    # One row per numeric column, so each worker reads a contiguous slice
+    shape = (len(numeric), len(df))
+    shm = shared_memory.SharedMemory(create=True, size=max(1, shape[0] * shape[1] * 8))
+    try:
+        block = np.ndarray(shape, dtype='float64', buffer=shm.buf)
+        for row, (i, _, _) in enumerate(numeric):
+            block[row] = df.iloc[:, i].to_numpy(dtype='float64', na_value=np.nan)
+        del block
+
+        # A few batches per worker balances load without per-column task overhead
+        batch_size = max(1, len(numeric) // (workers * 4))
+        batches = [
+            [
+                (row, name, str(df.iloc[:, i].dtype), memory)
+                for row, (i, name, memory) in enumerate(numeric[start:start + batch_size], start)
+            ]
+            for start in range(0, len(numeric), batch_size)
+        ]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_profile_shared_columns, shm.name, shape, batch)
+                for batch in batches
+            ]
+
+            # Non-numeric columns are profiled here while workers run
+            numeric_positions = {i for i, _, _ in numeric}
+            for i, name, memory in specs:
+                if i not in numeric_positions:
+                    profiles[i] = _profile_column(df.iloc[:, i], name, memory)
+
+            positions = [i for i, _, _ in numeric]
+            for batch, future in zip(batches, futures):
+                for (row, _, _, _), profile in zip(batch, future.result()):
+                    profiles[positions[row]] = profile
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return profiles
+
+
+def _profile_shared_columns(
+    shm_name: str,
+    shape: Tuple[int, int],
+    batch: List[Tuple[int, str, str, int]],
+) -> List[ColumnProfile]:
+    """Worker: profile numeric columns from a shared-memory block.
+
+    Args:
+        shm_name: Name of the shared-memory block
+        shape: (numeric_columns, rows) shape of the block
+        batch: (block_row, name, dtype, memory_bytes) per column
+
+    Returns:
+        ColumnProfile per batch entry, in batch order
+    """
+    shm = _attach_shared_memory(shm_name)
+    try:
+        block = np.ndarray(shape, dtype='float64', buffer=shm.buf)
+        profiles = []
+        for row, name, dtype, memory in batch:
+            profile = empty_column_profile(name, dtype, 'numeric')
+            profile['memory_bytes'] = memory
+            _profile_numeric_values(profile, block[row])
+            profiles.append(profile)
+        del block
+        return profiles
+    finally:
+        shm.close()
+
+
+def _attach_shared_memory(name: str) -> 'shared_memory.SharedMemory':
+    """Attach to an existing block without taking ownership of it.
+
+    The creating process owns (and unlinks) the block; workers must not.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 has no track flag. Pool workers share the parent's
+        # resource tracker, so the duplicate registration is a no-op.
+        return shared_memory.SharedMemory(name=name)
+
+
+def parquet_footer_profile(path: str, columns: Optional[List[str]] = None) -> DatasetProfile:
+    """Profile a Parquet file from footer metadata without decoding data pages.
+
+    Row counts, null counts and min/max come from per-row-group statistics;
+    memory is the uncompressed column size. Distinct counts are only known for
+    constant columns (min == max), so moments, quantiles and duplicates are
+    left empty.
+
+    Args:
+        path: Path to Parquet file
+        columns: Optional list of columns to include
+
+    Returns:
+        DatasetProfile with footer-derived statistics
+    """
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(path)
+    metadata = parquet_file.metadata
+    schema = parquet_file.schema_arrow
+    rows = metadata.num_rows
+
+    # Map top-level columns to their leaf column chunk position
+    leaf_index = {
+        metadata.schema.column(i).path: i for i in range(metadata.num_columns)
+    }
+
+    profiles = []
+    for field in schema:
+        if columns is not None and field.name not in columns:
+            continue
+        dtype = _arrow_dtype_name(field.type)
+        profile = empty_column_profile(field.name, dtype, column_kind(dtype))
+        profile['distinct'] = None
+
+        i = leaf_index.get(field.name)
+        if i is None:
+            # Nested column: no single leaf carries its statistics
+            profile['count'] = rows
+            profiles.append(profile)
+            continue
+
+        nulls = 0
+        nulls_known = True
+        low = high = None
+        min_max_known = True
+        for group in range(metadata.num_row_groups):
+            chunk = metadata.row_group(group).column(i)
+            profile['memory_bytes'] += chunk.total_uncompressed_size
+            stats = chunk.statistics
+            if stats is None or not stats.has_null_count:
+                nulls_known = False
+            else:
+                nulls += stats.null_count
+            if stats is None or not stats.has_min_max:
+                min_max_known = False
+            elif metadata.row_group(group).num_rows > (stats.null_count or 0):
+                low = stats.min if low is None else min(low, stats.min)
+                high = stats.max if high is None else max(high, stats.max)
+
+        profile['missing'] = nulls if nulls_known else 0
+        profile['count'] = rows - profile['missing']
+        if min_max_known and low is not None:
+            if profile['kind'] == 'numeric':
+                profile['min'], profile['max'] = float(low), float(high)
+            if low == high and nulls_known:
+                profile['distinct'] = 1
+        profiles.append(profile)
+
+    return DatasetProfile(
+        rows=rows,
+        memory_bytes=sum(p['memory_bytes'] for p in profiles),
+        duplicate_rows=0,
+        columns=profiles,
+    )
+
+
+def _arrow_dtype_name(arrow_type: Any) -> str:
+    """Name the pandas dtype an Arrow type converts to."""
+    import pyarrow as pa
+    if pa.types.is_dictionary(arrow_type):
+        return 'category'
+    try:
+        return str(np.dtype(arrow_type.to_pandas_dtype()))
+    except (NotImplementedError, TypeError):
+        return 'object'
+
+
+def get_column_profile(profile: DatasetProfile, name: str) -> Optional[ColumnProfile]:
+    """Look up a column profile by name.
+
+    Args:
+        profile: Dataset profile
+        name: Column name
+
+    Returns:
+        ColumnProfile if the column exists, None otherwise
+    """
+    for col in profile['columns']:
+        if col['name'] == name:
+            return col
+    return None
+
+
+def profile_chunks(chunks: Iterable['pd.DataFrame']) -> DatasetProfile:
+    """Profile a stream of DataFrame chunks with flat memory.
+
+    Counts, missing values, min/max and moments are exact; quantiles,
+    outliers, distinct counts and duplicate rows are sketch estimates.
+
+    Args:
+        chunks: Iterable of DataFrames sharing (mostly) the same columns
+
+    Returns:
+        DatasetProfile covering every row of every chunk
+    """
+    if not PANDAS_AVAILABLE:
+        raise ImportError("pandas is required for profiling")
+
+    accumulator = DatasetAccumulator()
+    for chunk in chunks:
+        accumulator.update(chunk)
+    return accumulator.to_profile()
+
+
+def _hash_values(values: 'pd.Series') -> 'np.ndarray':
+    """Hash values to uint64, falling back to str() for unhashable objects."""
+    try:
+        return pd.util.hash_pandas_object(values, index=False).to_numpy()
+    except TypeError:
+        return pd.util.hash_pandas_object(values.astype(str), index=False).to_numpy()
+
+
+def _merge_dtype(current: str, new: str) -> str:
+    """Reconcile dtypes inferred independently for different chunks."""
+    if current == new:
+        return current
+    if column_kind(current) == 'numeric' and column_kind(new) == 'numeric':
+        return 'float64'
+    return 'object'
+
+
+class ColumnAccumulator:
+    """Mergeable per-column state for streaming profiles.
+
+    Attributes:
+        name: Column name
+        dtype: Dtype reconciled across chunks (None until first update)
+        kind: Profiling kind derived from dtype
+        count: Non-null values seen
+        missing: Null values seen
+        infinite: Non-null +/-inf values, left out of the numeric sketches
+        memory_bytes: Deep memory usage summed over chunks
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.dtype: Optional[str] = None
+        self.kind: Optional[str] = None
+        self.count = 0
+        self.missing = 0
+        self.memory_bytes = 0
+        self.distinct = HyperLogLog()
+        self._reset_numeric()
+
+    def _reset_numeric(self) -> None:
+        self.infinite = 0
+        self.moments = MomentAccumulator()
+        self.quantiles = KLLSketch()
+        self.histogram = StreamingHistogram()
+
+    def _set_dtype(self, dtype: str) -> None:
+        merged = dtype if self.dtype is None else _merge_dtype(self.dtype, dtype)
+        kind = column_kind(merged)
+        if self.kind == 'numeric' and kind != 'numeric':
+            # Mixed column (e.g. numbers then strings): numeric stats no longer apply
+            self._reset_numeric()
+        self.dtype, self.kind = merged, kind
+
+    def update(self, series: 'pd.Series', memory_bytes: int) -> None:
+        """Add one chunk of column values.
+
+        Args:
+            series: Column values for this chunk
+            memory_bytes: Deep memory usage of the chunk column
+        """
+        self._set_dtype(str(series.dtype))
+        self.memory_bytes += memory_bytes
+
+        if column_kind(series.dtype) == 'numeric':
+            values = series.to_numpy(dtype='float64', na_value=np.nan)
+            valid = values[~np.isnan(values)]
+            self.count += len(valid)
+            self.missing += len(values) - len(valid)
+            self.distinct.update(pd.util.hash_array(valid))
+            if self.kind == 'numeric':
+                finite = valid[np.isfinite(valid)]
+                self.infinite += len(valid) - len(finite)
+                self.moments.update(finite)
+                self.quantiles.update(finite)
+                self.histogram.update(finite)
+        else:
+            valid = series[series.notna()]
+            self.count += len(valid)
+            self.missing += len(series) - len(valid)
+            self.distinct.update(_hash_values(valid))
+
+    def add_missing(self, rows: int) -> None:
+        """Record rows where this column was absent from the chunk."""
+        self.missing += rows
+
+    def merge(self, other: 'ColumnAccumulator') -> None:
+        """Combine state built over a disjoint set of rows."""
+        if other.dtype is not None:
+            self._set_dtype(other.dtype)
+        self.count += other.count
+        self.missing += other.missing
+        self.memory_bytes += other.memory_bytes
+        self.distinct.merge(other.distinct)
+        if self.kind == 'numeric' and other.kind == 'numeric':
+            self.infinite += other.infinite
+            self.moments.merge(other.moments)
+            self.quantiles.merge(other.quantiles)
+            self.histogram.merge(other.histogram)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON-safe dict."""
+        return {
+            'name': self.name,
+            'dtype': self.dtype,
+            'kind': self.kind,
+            'count': self.count,
+            'missing': self.missing,
+            'memory_bytes': self.memory_bytes,
+            'infinite': self.infinite,
+            'distinct': self.distinct.to_dict(),
+            'moments': self.moments.to_dict(),
+            'quantiles': self.quantiles.to_dict(),
+            'histogram': self.histogram.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'ColumnAccumulator':
+        """Restore from to_dict() output."""
+        acc = cls(state['name'])
+        acc.dtype, acc.kind = state['dtype'], state['kind']
+        acc.count, acc.missing = state['count'], state['missing']
+        acc.memory_bytes, acc.infinite = state['memory_bytes'], state['infinite']
+        acc.distinct = HyperLogLog.from_dict(state['distinct'])
+        acc.moments = MomentAccumulator.from_dict(state['moments'])
+        acc.quantiles = KLLSketch.from_dict(state['quantiles'])
+        acc.histogram = StreamingHistogram.from_dict(state['histogram'])
+        return acc
+
+    def to_profile(self) -> ColumnProfile:
+        """Finalize into a ColumnProfile."""
+        profile = empty_column_profile(self.name, self.dtype or 'object', self.kind or 'other')
+        profile['count'] = self.count
+        profile['missing'] = self.missing
+        profile['memory_bytes'] = self.memory_bytes
+        profile['infinite'] = self.infinite
+        if self.count > 0:
+            profile['distinct'] = min(self.count, max(1, int(round(self.distinct.estimate()))))
+
+        moments = self.moments
+        if self.kind == 'numeric' and moments.n > 0:
+            profile['min'] = moments.min
+            profile['max'] = moments.max
+            profile['mean'] = moments.mean
+            profile['std'] = moments.std
+            profile['skewness'] = moments.skewness
+
+            q1, median, q3 = self.quantiles.quantiles([0.25, 0.5, 0.75])
+            profile['q1'], profile['median'], profile['q3'] = q1, median, q3
+            profile['histogram'] = self.histogram.rebin(HISTOGRAM_BINS, moments.min, moments.max)
+
+            # IQR outliers estimated from the quantile sketch CDF
+            iqr = q3 - q1
+            below = self.quantiles.cdf(np.array([q1 - 1.5 * iqr]))[0]
+            not_above = self.quantiles.cdf(np.array([q3 + 1.5 * iqr]), inclusive=True)[0]
+            profile['outliers'] = int(round((below + 1 - not_above) * moments.n))
+
+        return profile
+
+
+class DatasetAccumulator:
+    """Mergeable dataset-level state for streaming profiles.
+
+    Attributes:
+        rows: Rows seen
+        columns: Column accumulators in first-seen order
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.columns: Dict[str, ColumnAccumulator] = {}
+        self.index_memory_bytes = 0
+        # Larger sketch for whole rows: duplicate counts are a small difference
+        self._row_hashes = HyperLogLog(p=16)
+
+    def update(self, chunk: 'pd.DataFrame') -> None:
+        """Add one DataFrame chunk.
+
+        Args:
+            chunk: Rows to profile
+        """
+        rows = len(chunk)
+        column_memory = chunk.memory_usage(index=False, deep=True)
+        seen = set()
+
+        for i, name in enumerate(chunk.columns):
+            name = str(name)
+            seen.add(name)
+            if name not in self.columns:
+                self.columns[name] = ColumnAccumulator(name)
+                # Rows from earlier chunks had no value for this column
+                self.columns[name].add_missing(self.rows)
+            self.columns[name].update(chunk.iloc[:, i], int(column_memory.iloc[i]))
+
+        for name, accumulator in self.columns.items():
+            if name not in seen:
+                accumulator.add_missing(rows)
+
+        self.rows += rows
+        self.index_memory_bytes += int(chunk.index.memory_usage(deep=True))
+        if rows > 0:
+            self._row_hashes.update(_hash_values(chunk))
+
+    def merge(self, other: 'DatasetAccumulator') -> None:
+        """Combine state built over a disjoint set of rows."""
+        for name, accumulator in self.columns.items():
+            if name not in other.columns:
+                accumulator.add_missing(other.rows)
+        for name, accumulator in other.columns.items():
+            if name not in self.columns:
+                self.columns[name] = ColumnAccumulator(name)
+                self.columns[name].add_missing(self.rows)
+            self.columns[name].merge(accumulator)
+        self.rows += other.rows
+        self.index_memory_bytes += other.index_memory_bytes
+        self._row_hashes.merge(other._row_hashes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON-safe dict for incremental profiling."""
+        return {
+            'rows': self.rows,
+            'index_memory_bytes': self.index_memory_bytes,
+            'columns': [acc.to_dict() for acc in self.columns.values()],
+            'row_hashes': self._row_hashes.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'DatasetAccumulator':
+        """Restore from to_dict() output."""
+        acc = cls()
+        acc.rows = state['rows']
+        acc.index_memory_bytes = state['index_memory_bytes']
+        for column in state['columns']:
+            acc.columns[column['name']] = ColumnAccumulator.from_dict(column)
+        acc._row_hashes = HyperLogLog.from_dict(state['row_hashes'])
+        return acc
+
+    def to_profile(self) -> DatasetProfile:
+        """Finalize into a DatasetProfile."""
+        columns = [acc.to_profile() for acc in self.columns.values()]
+        distinct_rows = int(round(self._row_hashes.estimate())) if self.rows else 0
+        duplicate_rows = max(0, self.rows - distinct_rows)
+        # Differences within ~3 standard errors of the sketch are noise
+        if duplicate_rows <= 3 * self._row_hashes.relative_error * self.rows:
+            duplicate_rows = 0
+        return DatasetProfile(
+            rows=self.rows,
+            memory_bytes=sum(c['memory_bytes'] for c in columns) + self.index_memory_bytes,
+            duplicate_rows=duplicate_rows,
+            columns=columns,
+        )
@@ -4,9 +4,12 @@ This module provides fast data exploration capabilities for the /grd:quick-explo
 prioritizing speed over comprehensiveness.
 """
 
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from pathlib import Path
+import hashlib
+import io
 import json
+import time
 
 try:
     import pandas as pd
@@ -14,18 +17,6 @@ try:
 except ImportError:
     PANDAS_AVAILABLE = False
 
-try:
-    import numpy as np
-    NUMPY_AVAILABLE = True
-except ImportError:
-    NUMPY_AVAILABLE = False
-
-try:
-    from scipy import stats
-    SCIPY_AVAILABLE = True
-except ImportError:
-    SCIPY_AVAILABLE = False
-
 from .formatters import (
     print_header_banner,
     print_tldr,
@@ -36,6 +27,28 @@ from .formatters import (
     generate_sparkline,
     get_quality_indicator,
 )
+from .profiling import (
+    DatasetAccumulator,
+    DatasetProfile,
+    profile_dataframe,
+    profile_chunks,
+    parquet_footer_profile,
+)
+from .sampling import SampleInfo, reservoir_sample, sample_parquet, describe_sample
+from .cache import DiskCache, cache_key, file_fingerprint, to_json_native
+from .hardware import RunHistory, capture_hardware_profile
+from .admission import AccessPlan, plan_data_access
+from .hardware.estimator import eda_work
+
+
+# Rows per chunk when streaming a file through the sampler
+SAMPLE_CHUNK_ROWS = 100000
+
+# Bump when the cached profile layout changes to invalidate old entries
+PROFILE_CACHE_VERSION = 2
+
+# Bytes hashed at each end of the processed prefix to detect non-append edits
+INCREMENTAL_CHECK_BYTES = 64 * 1024
 
 
 def quick_explore(
@@ -43,6 +56,18 @@ def quick_explore(
     output_dir: str = ".planning",
     target_column: Optional[str] = None,
     sample_size: int = 10000,
+    streaming: bool = False,
+    chunk_size: int = 100000,
+    workers: Optional[int] = None,
+    seed: int = 42,
+    stratify: bool = False,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Any]] = None,
+    footer_only: bool = False,
+    use_cache: bool = True,
+    incremental: bool = False,
+    run_history: Optional[RunHistory] = None,
+    memory_guard: bool = True,
 ) -> Dict[str, Any]:
     """Perform quick exploratory data analysis.
 
@@ -51,21 +76,61 @@ def quick_explore(
         output_dir: Directory for output files
         target_column: Optional target column for ML context
         sample_size: Max rows to analyze for speed (default 10k)
+        streaming: If True, profile the full file in chunks with flat memory
+            instead of loading a sample (sample_size is ignored)
+        chunk_size: Rows per chunk in streaming mode (default 100k)
+        workers: Profile columns across this many processes (default: serial).
+            Worth it for wide tables (hundreds of columns).
+        seed: Random seed for reproducible sampling (default 42)
+        stratify: If True, stratify the sample on target_column
+        columns: Only read these columns (target_column is always included)
+        filters: Row filters in pyarrow DNF form, e.g. [('year', '>=', 2024)].
+            Pushed down to Parquet row groups; applied per chunk for text formats.
+        footer_only: Profile a Parquet file from its footer statistics alone
+            (row/null counts, min/max) without decoding any data pages
+        use_cache: Reuse a cached profile under output_dir/cache when the file
+            and profiling parameters are unchanged (default True)
+        incremental: For append-only CSV/JSONL, persist streaming profile
+            state and on later runs parse only the rows appended since.
+            Implies streaming; requires use_cache.
+        run_history: Optional RunHistory; full streaming profiles record
+            their duration so estimate_eda_duration() can learn from them
+        memory_guard: Predict the peak memory of the requested read path
+            from file metadata and, when it exceeds the memory budget,
+            shrink read chunks and the sample, stream, or project columns
+            (see admission.plan_data_access). Only runs on a cache miss;
+            the adapted plan is returned as 'memory_plan' (default True)
 
     Returns:
         Dictionary with analysis results
     """
     if not PANDAS_AVAILABLE:
         raise ImportError("pandas is required for quick_explore")
-
-    # Load data
-    df = _load_data(data_path, sample_size)
-
-    # Compute statistics
-    stats = _compute_basic_stats(df)
-    columns = _analyze_columns(df)
-    highlights = _get_distribution_highlights(df)
-    warnings = _detect_quality_issues(df, target_column)
+    if incremental and not use_cache:
+        raise ValueError("incremental profiling stores its state in the cache; use_cache must be True")
+
+    # Profile every column once, then derive each report section from it
+    profile, sampling, overview, memory_plan = _profile_data(
+        data_path,
+        sample_size,
+        streaming=streaming,
+        chunk_size=chunk_size,
+        workers=workers,
+        seed=seed,
+        stratify_column=target_column if stratify else None,
+        columns=_with_target(columns, target_column),
+        filters=filters,
+        footer_only=footer_only,
+        cache_dir=Path(output_dir) / "cache" / "profiles" if use_cache else None,
+        incremental=incremental,
+        run_history=run_history,
+        memory_guard=memory_guard,
+        target_column=target_column,
+    )
+    stats = _compute_basic_stats(profile, overview)
+    columns = _analyze_columns(profile)
+    highlights = _get_distribution_highlights(profile)
+    warnings = _detect_quality_issues(profile, target_column)
 
     # Print to console
     print_header_banner("QUICK EXPLORE", f"Analyzing: {data_path}")
@@ -82,7 +147,8 @@ def quick_explore(
         columns=columns,
         highlights=highlights,
         warnings=warnings,
-        mode="quick"
+        mode="quick",
+        sampling=sampling,
     )
 
     # Ensure output directory exists
@@ -105,65 +171,578 @@ def quick_explore(
         'columns': columns,
         'highlights': highlights,
         'warnings': warnings,
+        'sampling': sampling,
+        'memory_plan': memory_plan,
         'report_path': str(report_path)
     }
 
 
-def _load_data(path: str, sample_size: int) -> 'pd.DataFrame':
-    """Load data from file with optional sampling.
+def _admit(
+    data_path: str,
+    sample_size: int,
+    streaming: bool,
+    chunk_size: int,
+    columns: Optional[List[str]],
+    target_column: Optional[str],
+    filters: Optional[List[Any]],
+    stratify_column: Optional[str] = None,
+) -> AccessPlan:
+    """Fit the requested read path into the memory budget, announcing changes."""
+    plan = plan_data_access(
+        data_path,
+        sample_size,
+        streaming=streaming,
+        chunk_size=chunk_size if streaming else SAMPLE_CHUNK_ROWS,
+        columns=columns,
+        target_column=target_column,
+        filters=filters,
+        stratify=stratify_column is not None,
+    )
+    if plan['adapted']:
+        print(f"Memory guard: {plan['reason']}")
+    return plan
+
+
+def _profile_data(
+    data_path: str,
+    sample_size: int,
+    streaming: bool = False,
+    chunk_size: int = 100000,
+    workers: Optional[int] = None,
+    seed: int = 42,
+    stratify_column: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Any]] = None,
+    footer_only: bool = False,
+    cache_dir: Optional[Path] = None,
+    incremental: bool = False,
+    run_history: Optional[RunHistory] = None,
+    sample_chunk_rows: int = SAMPLE_CHUNK_ROWS,
+    memory_guard: bool = False,
+    target_column: Optional[str] = None,
+) -> Tuple[DatasetProfile, SampleInfo, Optional[DatasetProfile], Optional[AccessPlan]]:
+    """Load and profile a data file using the requested access path.
+
+    With cache_dir, the result is cached keyed by the file fingerprint
+    (path, size, mtime) and every requested parameter that affects the
+    profile, so a repeat run skips parsing and profiling entirely. The
+    memory guard only plans the read on a cache miss; its adaptations are
+    not part of the key, so hits never depend on free memory.
+
+    Args:
+        data_path: Path to data file
+        sample_size: Max rows to sample (ignored when streaming)
+        streaming: Profile the full file in chunks with flat memory
+        chunk_size: Rows per chunk in streaming mode
+        workers: Parallel workers for in-memory column profiling
+        seed: Random seed for reproducible sampling
+        stratify_column: Optional column to stratify the sample on
+        columns: Optional column projection
+        filters: Optional row filters in pyarrow DNF form
+        footer_only: Profile a Parquet file from footer statistics alone
+        cache_dir: Optional directory for the persistent profile cache
+        incremental: Stream the file, resuming from state saved in cache_dir
+            (append-only CSV/JSONL)
+        run_history: Optional RunHistory receiving the duration of full
+            streaming profiles (the work estimate_eda_duration() models)
+        sample_chunk_rows: Rows per read chunk when sampling text formats
+            (the sample does not depend on it, so it is not in the cache key)
+        memory_guard: Fit the read path into the memory budget before loading
+        target_column: Column kept first if the memory guard projects columns
+
+    Returns:
+        Tuple of (profile, SampleInfo, overview, memory_plan). overview is a
+        full-file Parquet footer profile used for exact overview metrics, or
+        None. memory_plan is the AccessPlan the memory guard chose, or None
+        (guard off, footer-only, or a cache hit).
+    """
+    memory_plan = None
+    if incremental:
+        if cache_dir is None:
+            raise ValueError("incremental profiling requires a cache directory")
+        if memory_guard:
+            memory_plan = _admit(data_path, sample_size, True, chunk_size, columns, target_column, filters)
+            chunk_size, columns = memory_plan['chunk_size'], memory_plan['columns']
+        profile = _profile_incremental(data_path, chunk_size, columns, filters, cache_dir)
+        sampling = SampleInfo(
+            method='full',
+            seed=seed,
+            sample_rows=profile['rows'],
+            total_rows=profile['rows'],
+            stratify_column=None,
+        )
+        return profile, sampling, None, memory_plan
+
+    if cache_dir is not None:
+        cache = DiskCache(cache_dir)
+        key = cache_key(
+            PROFILE_CACHE_VERSION,
+            file_fingerprint(data_path),
+            {
+                'sample_size': None if streaming or footer_only else sample_size,
+                'streaming': streaming,
+                'chunk_size': chunk_size if streaming else None,
+                'seed': seed,
+                'stratify_column': stratify_column,
+                'columns': columns,
+                'filters': filters,
+                'footer_only': footer_only,
+            },
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            return cached['profile'], cached['sampling'], cached['overview'], None
+
+        result = _profile_data(
+            data_path,
+            sample_size,
+            streaming=streaming,
+            chunk_size=chunk_size,
+            workers=workers,
+            seed=seed,
+            stratify_column=stratify_column,
+            columns=columns,
+            filters=filters,
+            footer_only=footer_only,
+            run_history=run_history,
+            sample_chunk_rows=sample_chunk_rows,
+            memory_guard=memory_guard,
+            target_column=target_column,
+        )
+        # Return the stored form, so a hit and a miss give the same types
+        stored = to_json_native({'profile': result[0], 'sampling': result[1], 'overview': result[2]})
+        cache.put(key, stored)
+        return stored['profile'], stored['sampling'], stored['overview'], result[3]
+
+    if memory_guard and not footer_only:
+        memory_plan = _admit(data_path, sample_size, streaming, chunk_size, columns, target_column, filters,
+                             stratify_column)
+        streaming, sample_size, columns = memory_plan['streaming'], memory_plan['sample_size'], memory_plan['columns']
+        if streaming:
+            chunk_size = memory_plan['chunk_size']
+        else:
+            sample_chunk_rows = memory_plan['chunk_size']
+
+    is_parquet = Path(data_path).suffix == '.parquet'
+
+    if footer_only:
+        if not is_parquet:
+            raise ValueError("footer_only profiling requires a Parquet file")
+        if filters:
+            raise ValueError("footer_only profiling cannot apply row filters")
+        profile = parquet_footer_profile(data_path, columns)
+        sampling = SampleInfo(
+            method='footer',
+            seed=seed,
+            sample_rows=0,
+            total_rows=profile['rows'],
+            stratify_column=None,
+        )
+        return profile, sampling, None, None
+
+    if streaming:
+        start = time.perf_counter()
+        profile = profile_chunks(_iter_chunks(data_path, chunk_size, columns, filters))
+        if run_history is not None:
+            run_history.record(
+                'eda',
+                time.perf_counter() - start,
+                capture_hardware_profile(),
+                work=eda_work(profile['rows'], len(profile['columns'])),
+            )
+        sampling = SampleInfo(
+            method='full',
+            seed=seed,
+            sample_rows=profile['rows'],
+            total_rows=profile['rows'],
+            stratify_column=None,
+        )
+    else:
+        df, sampling = _load_data(
+            data_path,
+            sample_size,
+            seed=seed,
+            stratify_column=stratify_column,
+            columns=columns,
+            filters=filters,
+            chunk_rows=sample_chunk_rows,
+        )
+        profile = profile_dataframe(df, workers=workers)
+
+    # Footer statistics describe the unfiltered file, so only use them without filters
+    overview = None
+    if is_parquet and not filters and sampling['method'] != 'full':
+        overview = parquet_footer_profile(data_path, columns)
+    return profile, sampling, overview, memory_plan
+
+
+def _load_data(
+    path: str,
+    sample_size: int,
+    seed: int = 42,
+    stratify_column: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Any]] = None,
+    chunk_rows: int = SAMPLE_CHUNK_ROWS,
+) -> Tuple['pd.DataFrame', SampleInfo]:
+    """Load a reproducible random sample of a data file.
+
+    CSV/JSON/JSONL are streamed through a reservoir sampler; Parquet samples
+    rows from the footer row counts and decodes only the touched row groups.
+    With filters, Parquet is scanned through pyarrow.dataset so predicates are
+    pushed down and row groups whose statistics cannot match are skipped.
 
     Args:
         path: Path to data file
         sample_size: Maximum rows to load
+        seed: Random seed for reproducible sampling
+        stratify_column: Optional column to stratify the sample on
+        columns: Optional list of columns to read (projection)
+        filters: Optional row filters in pyarrow DNF form, e.g.
+            [('year', '>=', 2024), ('region', 'in', ['EU', 'US'])]
+        chunk_rows: Rows per chunk streamed through the reservoir sampler
 
     Returns:
-        pandas DataFrame
+        Tuple of (pandas DataFrame, SampleInfo describing the sample)
+    """
+    path = Path(path)
+    if columns is not None and stratify_column and stratify_column not in columns:
+        columns = list(columns) + [stratify_column]
+
+    if path.suffix == '.parquet' and not filters:
+        return sample_parquet(path, sample_size, seed, stratify_column, columns)
+    if path.suffix in ('.csv', '.json', '.jsonl', '.parquet'):
+        return reservoir_sample(
+            _iter_chunks(path, chunk_rows, columns, filters),
+            sample_size,
+            seed,
+            stratify_column,
+        )
+    raise ValueError(f"Unsupported file format: {path.suffix}")
+
+
+def _iter_chunks(
+    path: str,
+    chunk_size: int,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Any]] = None,
+) -> Iterator['pd.DataFrame']:
+    """Read a data file as a stream of DataFrame chunks.
+
+    Args:
+        path: Path to data file
+        chunk_size: Rows per chunk
+        columns: Optional list of columns to read (projection)
+        filters: Optional row filters in pyarrow DNF form
+
+    Yields:
+        pandas DataFrame chunks covering the whole file (after filtering)
     """
     path = Path(path)
 
-    if path.suffix == '.csv':
-        # Check file size for sampling decision
-        df = pd.read_csv(path, nrows=sample_size)
-    elif path.suffix == '.parquet':
-        df = pd.read_parquet(path)
-        if len(df) > sample_size:
-            df = df.sample(n=sample_size, random_state=42)
-    elif path.suffix in ('.json', '.jsonl'):
-        df = pd.read_json(path, lines=path.suffix == '.jsonl', nrows=sample_size)
+    if path.suffix == '.parquet':
+        yield from _iter_parquet_chunks(path, chunk_size, columns, filters)
+        return
+
+    yield from _iter_text_chunks(path, path.suffix, chunk_size, columns, filters)
+
+
+def _iter_text_chunks(
+    source: Any,
+    suffix: str,
+    chunk_size: int,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Any]] = None,
+    names: Optional[List[str]] = None,
+) -> Iterator['pd.DataFrame']:
+    """Stream CSV/JSON/JSONL chunks from a path or open text handle.
+
+    Args:
+        source: Path or readable text handle
+        suffix: File format ('.csv', '.json' or '.jsonl')
+        chunk_size: Rows per chunk
+        columns: Optional list of columns to read (projection)
+        filters: Optional row filters in pyarrow DNF form
+        names: CSV header to use when source starts mid-file (no header row)
+
+    Yields:
+        pandas DataFrame chunks (after filtering)
+    """
+    # Text formats cannot skip data, but projection still saves parsing and memory
+    read_columns = columns
+    if columns is not None and filters:
+        read_columns = list(dict.fromkeys(list(columns) + _filter_columns(filters)))
+
+    if suffix == '.csv':
+        header = None if names is not None else 'infer'
+        reader = pd.read_csv(
+            source, chunksize=chunk_size, usecols=read_columns, names=names, header=header,
+        )
+    elif suffix == '.jsonl':
+        reader = pd.read_json(source, lines=True, chunksize=chunk_size)
+    elif suffix == '.json':
+        # A single JSON document cannot be split; read it whole
+        reader = _single_chunk(pd.read_json(source))
     else:
-        raise ValueError(f"Unsupported file format: {path.suffix}")
+        raise ValueError(f"Unsupported file format: {suffix}")
+
+    with reader:
+        for chunk in reader:
+            if filters:
+                chunk = chunk[_filter_mask(chunk, filters)]
+            if columns is not None:
+                chunk = chunk[list(columns)]
+            yield chunk
+
+
+def _iter_parquet_chunks(
+    path: Path,
+    chunk_size: int,
+    columns: Optional[List[str]],
+    filters: Optional[List[Any]],
+) -> Iterator['pd.DataFrame']:
+    """Stream Parquet record batches with projection and predicate pushdown."""
+    offset = 0
+    if filters:
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+        dataset = ds.dataset(path, format='parquet')
+        batches = dataset.to_batches(
+            columns=columns,
+            filter=pq.filters_to_expression(filters),
+            batch_size=chunk_size,
+        )
+    else:
+        import pyarrow.parquet as pq
+        batches = pq.ParquetFile(path).iter_batches(batch_size=chunk_size, columns=columns)
+
+    for batch in batches:
+        chunk = batch.to_pandas()
+        # Keep a running row index so samples can be put back in file order
+        chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+        offset += len(chunk)
+        yield chunk
+
 
-    return df
+def _profile_incremental(
+    data_path: str,
+    chunk_size: int,
+    columns: Optional[List[str]],
+    filters: Optional[List[Any]],
+    cache_dir: Path,
+) -> DatasetProfile:
+    """Stream-profile an append-only CSV/JSONL, parsing only new bytes.
+
+    The mergeable DatasetAccumulator state is saved with the byte offset it
+    covers. On the next run, if the file still starts with the same bytes
+    (checked by hashing the header and the end of the processed prefix),
+    only the bytes past that offset are parsed and merged in. Otherwise the
+    file is treated as rewritten and profiled from scratch.
 
+    Args:
+        data_path: Path to CSV or JSONL file
+        chunk_size: Rows per chunk
+        columns: Optional column projection
+        filters: Optional row filters in pyarrow DNF form
+        cache_dir: Directory holding the saved state
 
-def _compute_basic_stats(df: 'pd.DataFrame') -> Dict[str, Any]:
+    Returns:
+        DatasetProfile for the whole file
+    """
+    path = Path(data_path)
+    if path.suffix not in ('.csv', '.jsonl'):
+        raise ValueError("incremental profiling supports append-only CSV and JSONL files")
+
+    cache = DiskCache(cache_dir)
+    key = cache_key(
+        PROFILE_CACHE_VERSION,
+        'incremental',
+        str(path.resolve()),
+        {'columns': columns, 'filters': filters},
+    )
+    size = path.stat().st_size
+
+    state = cache.get(key)
+    if (
+        state is not None
+        and state['offset'] <= size
+        and _prefix_digest(path, state['offset']) == state['prefix_digest']
+    ):
+        accumulator = DatasetAccumulator.from_dict(state['accumulator'])
+        start, names = state['offset'], state['names']
+    else:
+        accumulator, start, names = DatasetAccumulator(), 0, None
+
+    if start < size:
+        if path.suffix == '.csv' and names is None:
+            names = list(pd.read_csv(path, nrows=0).columns)
+            start = _header_end(path)
+        with io.TextIOWrapper(io.BufferedReader(_ByteRange(path, start, size)), encoding='utf-8') as source:
+            for chunk in _iter_text_chunks(source, path.suffix, chunk_size, columns, filters, names):
+                accumulator.update(chunk)
+
+    # A trailing partial line may still be being written; resuming after it
+    # would split a record, so only save state at a line boundary
+    if size and _ends_with_newline(path, size):
+        cache.put(key, {
+            'offset': size,
+            'prefix_digest': _prefix_digest(path, size),
+            'names': names,
+            'accumulator': accumulator.to_dict(),
+        })
+    return accumulator.to_profile()
+
+
+class _ByteRange(io.RawIOBase):
+    """Read-only view of bytes [start, end) of a file."""
+
+    def __init__(self, path: Path, start: int, end: int):
+        self._file = open(path, 'rb')
+        self._file.seek(start)
+        self._remaining = end - start
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer)[:max(self._remaining, 0)]
+        n = self._file.readinto(view) or 0
+        self._remaining -= n
+        return n
+
+    def close(self) -> None:
+        self._file.close()
+        super().close()
+
+
+def _prefix_digest(path: Path, offset: int) -> str:
+    """Hash the first and last bytes of file[:offset]."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        digest.update(f.read(min(offset, INCREMENTAL_CHECK_BYTES)))
+        tail_start = max(0, offset - INCREMENTAL_CHECK_BYTES)
+        f.seek(tail_start)
+        digest.update(f.read(offset - tail_start))
+    return digest.hexdigest()
+
+
+def _header_end(path: Path) -> int:
+    """Byte offset just past the CSV header line."""
+    with open(path, 'rb') as f:
+        f.readline()
+        return f.tell()
+
+
+def _ends_with_newline(path: Path, size: int) -> bool:
+    with open(path, 'rb') as f:
+        f.seek(size - 1)
+        return f.read(1) == b'\n'
+
+
+class _single_chunk:
+    """Context-managed one-item reader, mirroring pandas chunked readers."""
+
+    def __init__(self, df: 'pd.DataFrame'):
+        self.df = df
+
+    def __enter__(self):
+        return iter([self.df])
+
+    def __exit__(self, *exc):
+        return False
+
+
+def _filter_columns(filters: List[Any]) -> List[str]:
+    """Columns referenced by DNF filters."""
+    groups = filters if isinstance(filters[0], list) else [filters]
+    return [name for group in groups for name, _, _ in group]
+
+
+def _filter_mask(df: 'pd.DataFrame', filters: List[Any]) -> 'pd.Series':
+    """Evaluate pyarrow-style DNF filters on a DataFrame.
+
+    A flat list of (column, op, value) tuples is a conjunction; a list of
+    such lists is a disjunction of conjunctions.
+
+    Args:
+        df: DataFrame chunk
+        filters: Filters in pyarrow DNF form
+
+    Returns:
+        Boolean mask of rows that pass
+    """
+    groups = filters if isinstance(filters[0], list) else [filters]
+    mask = pd.Series(False, index=df.index)
+    for group in groups:
+        group_mask = pd.Series(True, index=df.index)
+        for name, op, value in group:
+            column = df[name]
+            if op in ('=', '=='):
+                group_mask &= column == value
+            elif op == '!=':
+                group_mask &= column != value
+            elif op == '<':
+                group_mask &= column < value
+            elif op == '<=':
+                group_mask &= column <= value
+            elif op == '>':
+                group_mask &= column > value
+            elif op == '>=':
+                group_mask &= column >= value
+            elif op == 'in':
+                group_mask &= column.isin(value)
+            elif op == 'not in':
+                group_mask &= ~column.isin(value)
+            else:
+                raise ValueError(f"Unsupported filter operator: {op!r}")
+        mask |= group_mask
+    return mask
+
+
+def _with_target(columns: Optional[List[str]], target_column: Optional[str]) -> Optional[List[str]]:
+    """Add the target column to a projection so it is never dropped."""
+    if columns is None or not target_column or target_column in columns:
+        return columns
+    return list(columns) + [target_column]
+
+
+def _compute_basic_stats(
+    profile: DatasetProfile,
+    overview: Optional[DatasetProfile] = None,
+) -> Dict[str, Any]:
     """Compute basic dataset statistics.
 
     Args:
-        df: pandas DataFrame
+        profile: Dataset profile from profile_dataframe()
+        overview: Optional full-file profile (Parquet footer) whose exact
+            row, missing and memory counts replace the sample's
 
     Returns:
         Dictionary with basic stats
     """
-    memory_mb = df.memory_usage(deep=True).sum() / (1024 * 1024)
+    columns = profile['columns']
+    memory_mb = profile['memory_bytes'] / (1024 * 1024)
 
     # Count column types
-    numeric_cols = len(df.select_dtypes(include=['number']).columns)
-    categorical_cols = len(df.select_dtypes(include=['object', 'category']).columns)
-    datetime_cols = len(df.select_dtypes(include=['datetime64']).columns)
-
-    # Missing data
-    missing_total = df.isnull().sum().sum()
-    total_cells = df.shape[0] * df.shape[1]
+    numeric_cols = sum(1 for c in columns if c['kind'] == 'numeric')
+    categorical_cols = sum(1 for c in columns if c['kind'] in ('text', 'categorical'))
+    datetime_cols = sum(1 for c in columns if c['kind'] == 'datetime')
+
+    # Missing data (exact full-file counts when footer statistics are available)
+    counts = overview or profile
+    missing_total = sum(c['missing'] for c in counts['columns'])
+    total_cells = counts['rows'] * len(counts['columns'])
     missing_pct = missing_total / total_cells if total_cells > 0 else 0
-    null_columns = (df.isnull().sum() > 0).sum()
+    null_columns = sum(1 for c in counts['columns'] if c['missing'] > 0)
+    if overview is not None:
+        memory_mb = overview['memory_bytes'] / (1024 * 1024)
 
     # Issue severity
-    issue_count, issue_severity = _assess_overall_quality(df)
+    issue_count, issue_severity = _assess_overall_quality(profile)
 
     return {
-        'rows': len(df),
-        'columns': len(df.columns),
+        'rows': counts['rows'],
+        'columns': len(columns),
         'memory_mb': memory_mb,
         'missing_pct': missing_pct,
         'null_columns': null_columns,
@@ -175,90 +754,64 @@ def _compute_basic_stats(df: 'pd.DataFrame') -> Dict[str, Any]:
     }
 
 
-def _analyze_columns(df: 'pd.DataFrame') -> List[Dict[str, Any]]:
+def _analyze_columns(profile: DatasetProfile) -> List[Dict[str, Any]]:
     """Analyze each column for the summary table.
 
     Args:
-        df: pandas DataFrame
+        profile: Dataset profile from profile_dataframe()
 
     Returns:
         List of column analysis dictionaries
     """
     columns = []
+    rows = profile['rows']
 
-    for col in df.columns:
-        col_data = df[col]
-        dtype = str(col_data.dtype)
-        missing_pct = col_data.isnull().sum() / len(col_data)
-
-        # Distribution for numeric columns
-        distribution = []
-        skewness = None
-
-        if pd.api.types.is_numeric_dtype(col_data):
-            # Remove nulls for histogram
-            valid_data = col_data.dropna()
-            if len(valid_data) > 0:
-                try:
-                    hist, _ = np.histogram(valid_data, bins=8)
-                    distribution = hist.tolist()
-
-                    if SCIPY_AVAILABLE and len(valid_data) > 3:
-                        skewness = stats.skew(valid_data)
-                except (ValueError, TypeError):
-                    pass
+    for col in profile['columns']:
+        missing_pct = col['missing'] / rows if rows > 0 else 0
+
+        # Skewness is only meaningful with a handful of values
+        skewness = col['skewness'] if col['count'] > 3 else None
 
         columns.append({
-            'name': col,
-            'dtype': dtype,
+            'name': col['name'],
+            'dtype': col['dtype'],
             'missing_pct': missing_pct,
-            'distribution': distribution,
+            'unique': col['distinct'],
+            'distribution': col['histogram'],
             'skewness': skewness,
         })
 
     return columns
 
 
-def _get_distribution_highlights(df: 'pd.DataFrame') -> List[Dict[str, Any]]:
+def _get_distribution_highlights(profile: DatasetProfile) -> List[Dict[str, Any]]:
     """Get notable distribution characteristics.
 
     Args:
-        df: pandas DataFrame
+        profile: Dataset profile from profile_dataframe()
 
     Returns:
         List of distribution highlights
     """
     highlights = []
 
-    for col in df.select_dtypes(include=['number']).columns:
-        col_data = df[col].dropna()
-        if len(col_data) < 10:
+    for col in profile['columns']:
+        if col['kind'] != 'numeric' or col['count'] < 10:
             continue
 
-        skewness = 0
-        outliers = 0
+        skewness = col['skewness'] or 0
+        outliers = col['outliers']
         note = None
 
-        if SCIPY_AVAILABLE:
-            skewness = stats.skew(col_data)
-
-        # Simple outlier detection using IQR
-        if NUMPY_AVAILABLE:
-            q1, q3 = np.percentile(col_data, [25, 75])
-            iqr = q3 - q1
-            lower = q1 - 1.5 * iqr
-            upper = q3 + 1.5 * iqr
-            outliers = ((col_data < lower) | (col_data > upper)).sum()
-
         # Only include if notable
-        if abs(skewness) > 1.0 or outliers > len(col_data) * 0.05:
-            if outliers > len(col_data) * 0.1:
+        if abs(skewness) > 1.0 or outliers > col['count'] * 0.05:
+            if outliers > col['count'] * 0.1:
                 note = "High outlier count may affect models"
             elif abs(skewness) > 2:
                 note = "Consider log transform"
 
             highlights.append({
-                'column': col,
+                'column': col['name'],
                 'skewness': skewness,
                 'outliers': outliers,
                 'note': note,
@@ -268,64 +821,78 @@ def _get_distribution_highlights(df: 'pd.DataFrame') -> List[Dict[str, Any]]:
 
 
 def _detect_quality_issues(
-    df: 'pd.DataFrame',
+    profile: DatasetProfile,
     target_column: Optional[str] = None
 ) -> List[Dict[str, Any]]:
     """Detect data quality issues quickly.
 
     Args:
-        df: pandas DataFrame
+        profile: Dataset profile from profile_dataframe()
         target_column: Optional target column
 
     Returns:
         List of quality warnings
     """
     warnings = []
+    rows = profile['rows']
+    if rows == 0:
+        return warnings
 
     # High missing columns
-    for col in df.columns:
-        missing_pct = df[col].isnull().sum() / len(df)
+    for col in profile['columns']:
+        missing_pct = col['missing'] / rows
         if missing_pct > 0.3:
             warnings.append({
                 'severity': 'critical',
-                'column': col,
+                'column': col['name'],
                 'message': f"{missing_pct:.0%} missing values"
             })
         elif missing_pct > 0.1:
             warnings.append({
                 'severity': 'warning',
-                'column': col,
+                'column': col['name'],
                 'message': f"{missing_pct:.0%} missing values"
             })
 
     # Constant columns
-    for col in df.columns:
-        if df[col].nunique() == 1:
+    for col in profile['columns']:
+        if col['distinct'] == 1:
             warnings.append({
                 'severity': 'warning',
-                'column': col,
+                'column': col['name'],
                 'message': "Constant column (only one unique value)"
             })
 
+    # Infinite values are left out of every numeric statistic
+    for col in profile['columns']:
+        if col['infinite']:
+            warnings.append({
+                'severity': 'warning',
+                'column': col['name'],
+                'message': f"{col['infinite']} infinite values (excluded from statistics)"
+            })
+
     # High cardinality categorical
-    for col in df.select_dtypes(include=['object']).columns:
-        unique_ratio = df[col].nunique() / len(df)
+    for col in profile['columns']:
+        if col['kind'] != 'text' or col['distinct'] is None:
+            continue
+        unique_ratio = col['distinct'] / rows
         if unique_ratio > 0.9:
             warnings.append({
                 'severity': 'info',
-                'column': col,
-                'message': f"High cardinality ({df[col].nunique()} unique values) - may be ID column"
+                'column': col['name'],
+                'message': f"High cardinality ({col['distinct']} unique values) - may be ID column"
             })
 
     # Quick leakage check - column name patterns
     leakage_patterns = ['target', 'label', 'outcome', 'result', 'future', 'leak']
-    for col in df.columns:
-        col_lower = col.lower()
+    for col in profile['columns']:
+        col_lower = col['name'].lower()
         if any(p in col_lower for p in leakage_patterns):
-            if target_column and col != target_column:
+            if target_column and col['name'] != target_column:
                 warnings.append({
                     'severity': 'warning',
-                    'column': col,
+                    'column': col['name'],
                     'message': f"Column name suggests potential leakage"
                 })
 
@@ -336,20 +903,23 @@ def _detect_quality_issues(
     return warnings[:10]  # Limit to top 10
 
 
-def _assess_overall_quality(df: 'pd.DataFrame') -> Tuple[int, str]:
+def _assess_overall_quality(profile: DatasetProfile) -> Tuple[int, str]:
     """Assess overall data quality for TL;DR.
 
     Args:
-        df: pandas DataFrame
+        profile: Dataset profile from profile_dataframe()
 
     Returns:
         Tuple of (issue_count, severity)
     """
     issues = 0
     max_severity = 'info'
+    rows = profile['rows']
+    columns = profile['columns']
 
     # Check missing data
-    missing_pct = df.isnull().sum().sum() / (df.shape[0] * df.shape[1])
+    total_cells = rows * len(columns)
+    missing_pct = sum(c['missing'] for c in columns) / total_cells if total_cells > 0 else 0
     if missing_pct > 0.3:
         issues += 1
         max_severity = 'critical'
@@ -359,14 +929,14 @@ def _assess_overall_quality(df: 'pd.DataFrame') -> Tuple[int, str]:
             max_severity = 'warning'
 
     # Check constant columns
-    constant_cols = sum(1 for col in df.columns if df[col].nunique() == 1)
+    constant_cols = sum(1 for c in columns if c['distinct'] == 1)
     if constant_cols > 0:
         issues += constant_cols
         if max_severity == 'info':
             max_severity = 'warning'
 
     # Check duplicate rows
-    dup_pct = df.duplicated().sum() / len(df)
+    dup_pct = profile['duplicate_rows'] / rows if rows > 0 else 0
     if dup_pct > 0.1:
         issues += 1
         if max_severity != 'critical':
@@ -381,7 +951,8 @@ def generate_markdown_report(
     columns: List[Dict[str, Any]],
     highlights: List[Dict[str, Any]],
     warnings: List[Dict[str, Any]],
-    mode: str = "quick"
+    mode: str = "quick",
+    sampling: Optional[SampleInfo] = None,
 ) -> str:
     """Generate markdown report content.
 
@@ -392,6 +963,7 @@ def generate_markdown_report(
         highlights: Distribution highlights
         warnings: Quality warnings
         mode: 'quick' or 'full'
+        sampling: Optional description of how rows were sampled
 
     Returns:
         Markdown string
@@ -410,6 +982,8 @@ def generate_markdown_report(
 
     lines.append(f"**Source:** `{data_path}`")
     lines.append(f"**Generated:** Quick Explore Mode")
+    if sampling:
+        lines.append(f"**Sample:** {describe_sample(sampling)}")
     lines.append("")
 
     # Overview
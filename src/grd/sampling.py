@@ -0,0 +1,309 @@
+"""Reproducible random and stratified sampling without full materialization.
+
+This module backs quick-explore and insights loading:
+- CSV/JSONL: reservoir sampling over streamed chunks (memory ~ sample size)
+- Parquet: random row selection that decodes only the row groups it touches
+- Optional stratification on a target column with proportional allocation
+
+Reservoirs use bottom-k sampling (keep the k rows with the smallest random
+keys), which is equivalent to classic reservoir sampling but vectorizes per
+chunk. Every sample is reproducible from its seed and carries a SampleInfo
+record describing how it was drawn, so reports can state it.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, TypedDict
+
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# Above this many distinct target values, stratification falls back to uniform
+MAX_STRATA = 100
+
+
+class SampleInfo(TypedDict):
+    """How a sample was drawn."""
+    method: str  # 'full', 'reservoir', 'row-group', or 'footer'
+    seed: int
+    sample_rows: int
+    total_rows: int
+    stratify_column: Optional[str]
+
+
+class _Reservoir:
+    """Bottom-k reservoir: keeps the rows with the k smallest random keys."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.frame: Optional['pd.DataFrame'] = None
+        self.keys = np.empty(0)
+
+    def offer(self, frame: 'pd.DataFrame', keys: 'np.ndarray') -> None:
+        if len(frame) == 0:
+            return
+        if self.frame is not None and len(self.keys) >= self.size:
+            # Only rows that beat the current worst key can enter
+            admitted = keys < self.keys.max()
+            frame, keys = frame[admitted], keys[admitted]
+            if len(frame) == 0:
+                return
+        frame = frame if self.frame is None else pd.concat([self.frame, frame])
+        keys = np.concatenate([self.keys, keys])
+        if len(keys) > self.size:
+            keep = np.argpartition(keys, self.size - 1)[:self.size]
+            frame, keys = frame.iloc[keep], keys[keep]
+        self.frame, self.keys = frame, keys
+
+    def smallest(self, n: int) -> 'pd.DataFrame':
+        if self.frame is None or n <= 0:
+            return pd.DataFrame()
+        if n >= len(self.keys):
+            return self.frame
+        return self.frame.iloc[np.argpartition(self.keys, n - 1)[:n]]
+
+
+def reservoir_sample(
+    chunks: Iterable['pd.DataFrame'],
+    sample_size: int,
+    seed: int = 42,
+    stratify_column: Optional[str] = None,
+) -> Tuple['pd.DataFrame', SampleInfo]:
+    """Draw a uniform or stratified random sample from a stream of chunks.
+
+    Stratified sampling keeps up to sample_size rows per stratum until the
+    end, so it can hold up to MAX_STRATA * sample_size rows (never more than
+    the file); admission.plan_data_access(stratify=True) budgets for that.
+
+    Args:
+        chunks: DataFrame chunks (e.g. pd.read_csv(chunksize=...))
+        sample_size: Number of rows to keep
+        seed: Random seed for reproducibility
+        stratify_column: Optional column to stratify on (proportional allocation)
+
+    Returns:
+        Tuple of (sample DataFrame in original row order, SampleInfo)
+    """
+    rng = np.random.default_rng(seed)
+    uniform = _Reservoir(sample_size)
+    strata: Dict[Any, _Reservoir] = {}
+    strata_counts: Dict[Any, int] = {}
+    stratified = stratify_column is not None
+    total_rows = 0
+
+    for chunk in chunks:
+        keys = rng.random(len(chunk))
+        total_rows += len(chunk)
+
+        if stratified and stratify_column not in chunk.columns:
+            raise ValueError(f"Stratify column '{stratify_column}' not found in data")
+
+        if not stratified:
+            uniform.offer(chunk, keys)
+            continue
+
+        groups = chunk.groupby(stratify_column, dropna=False, sort=False).indices
+        for value, positions in groups.items():
+            # NaN keys do not compare equal across chunks; use one sentinel
+            value = None if pd.isna(value) else value
+            if value not in strata:
+                strata[value] = _Reservoir(sample_size)
+                strata_counts[value] = 0
+            strata[value].offer(chunk.iloc[positions], keys[positions])
+            strata_counts[value] += len(positions)
+
+        if len(strata) > MAX_STRATA:
+            # Too many strata (e.g. continuous target). The global bottom-k is a
+            # subset of the per-stratum bottom-k sets, so this fallback is exact.
+            for reservoir in strata.values():
+                if reservoir.frame is not None:
+                    uniform.offer(reservoir.frame, reservoir.keys)
+            strata.clear()
+            stratified = False
+
+    if stratified and strata:
+        allocation = _allocate(strata_counts, sample_size)
+        frames = [strata[value].smallest(n) for value, n in allocation.items()]
+        sample = pd.concat(frames) if frames else pd.DataFrame()
+    else:
+        stratify_column = None
+        sample = uniform.frame if uniform.frame is not None else pd.DataFrame()
+
+    sample = sample.sort_index()
+    info = SampleInfo(
+        method='full' if len(sample) >= total_rows else 'reservoir',
+        seed=seed,
+        sample_rows=len(sample),
+        total_rows=total_rows,
+        stratify_column=stratify_column,
+    )
+    return sample, info
+
+
+def sample_parquet(
+    path: Path,
+    sample_size: int,
+    seed: int = 42,
+    stratify_column: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+) -> Tuple['pd.DataFrame', SampleInfo]:
+    """Draw a random sample from Parquet, decoding only touched row groups.
+
+    Row counts come from the footer. Selected rows are grouped by row group
+    and each touched group is decoded once. Stratification reads only the
+    stratify column for the whole file.
+
+    Args:
+        path: Path to Parquet file
+        sample_size: Number of rows to keep
+        seed: Random seed for reproducibility
+        stratify_column: Optional column to stratify on (proportional allocation)
+        columns: Optional list of columns to decode (projection)
+
+    Returns:
+        Tuple of (sample DataFrame indexed by global row position, SampleInfo)
+    """
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(path)
+    metadata = parquet_file.metadata
+    total_rows = metadata.num_rows
+
+    if total_rows <= sample_size:
+        df = parquet_file.read(columns=columns).to_pandas()
+        return df, SampleInfo(
+            method='full',
+            seed=seed,
+            sample_rows=len(df),
+            total_rows=total_rows,
+            stratify_column=None,
+        )
+
+    rng = np.random.default_rng(seed)
+    if stratify_column is not None:
+        labels = parquet_file.read(columns=[stratify_column]).column(0).to_pandas()
+        selected = _stratified_positions(labels, sample_size, rng)
+        if selected is None:
+            stratify_column = None
+    if stratify_column is None:
+        selected = rng.choice(total_rows, size=sample_size, replace=False)
+    selected = np.sort(selected)
+
+    group_sizes = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+    group_ends = np.cumsum(group_sizes)
+    group_of_row = np.searchsorted(group_ends, selected, side='right')
+
+    frames: List['pd.DataFrame'] = []
+    for group in np.unique(group_of_row):
+        group_start = group_ends[group] - group_sizes[group]
+        local = selected[group_of_row == group] - group_start
+        table = parquet_file.read_row_group(int(group), columns=columns)
+        frames.append(table.take(local).to_pandas())
+
+    sample = pd.concat(frames, ignore_index=True)
+    sample.index = selected
+    return sample, SampleInfo(
+        method='row-group',
+        seed=seed,
+        sample_rows=len(sample),
+        total_rows=total_rows,
+        stratify_column=stratify_column,
+    )
+
+
+def _stratified_positions(
+    labels: 'pd.Series',
+    sample_size: int,
+    rng: 'np.random.Generator',
+) -> Optional['np.ndarray']:
+    """Pick row positions with proportional allocation per label.
+
+    Returns None if there are too many strata to stratify meaningfully.
+    """
+    groups = labels.groupby(labels, dropna=False, sort=False).indices
+    if len(groups) > MAX_STRATA:
+        return None
+    allocation = _allocate({value: len(pos) for value, pos in groups.items()}, sample_size)
+    return np.concatenate([
+        rng.choice(groups[value], size=n, replace=False)
+        for value, n in allocation.items()
+    ])
+
+
+def _allocate(counts: Dict[Any, int], sample_size: int) -> Dict[Any, int]:
+    """Proportional allocation with at least one row per non-empty stratum.
+
+    With more strata than sample_size, only the sample_size largest strata
+    get a row.
+
+    Args:
+        counts: Rows per stratum
+        sample_size: Total rows to allocate
+
+    Returns:
+        Rows to draw per stratum (sums to min(sample_size, total rows))
+    """
+    total = sum(counts.values())
+    if total <= sample_size:
+        return dict(counts)
+    if len(counts) > sample_size:
+        # More strata than rows: one row from each of the largest strata
+        largest = sorted(counts, key=lambda value: counts[value], reverse=True)[:sample_size]
+        return {value: 1 for value in largest}
+
+    allocation = {
+        value: min(count, max(1, round(sample_size * count / total)))
+        for value, count in counts.items()
+    }
+    # Rounding can overshoot or undershoot; adjust the largest strata
+    by_size = sorted(counts, key=lambda value: counts[value], reverse=True)
+    i = 0
+    while sum(allocation.values()) > sample_size and max(allocation.values()) > 1:
+        value = by_size[i % len(by_size)]
+        if allocation[value] > 1:
+            allocation[value] -= 1
+        i += 1
+    i = 0
+    while sum(allocation.values()) < sample_size:
+        value = by_size[i % len(by_size)]
+        if allocation[value] < counts[value]:
+            allocation[value] += 1
+        i += 1
+    return allocation
+
+
+def describe_sample(info: SampleInfo) -> str:
+    """Render a one-line description of how a sample was drawn.
+
+    Args:
+        info: SampleInfo from a sampling function
+
+    Returns:
+        Human-readable description for reports
+    """
+    if info['method'] == 'full':
+        return f"all {info['total_rows']:,} rows"
+    if info['method'] == 'footer':
+        return f"Parquet footer statistics for all {info['total_rows']:,} rows (no data pages decoded)"
+
+    if info['stratify_column']:
+        kind = f"random sample stratified by '{info['stratify_column']}'"
+    else:
+        kind = "uniform random sample"
+    source = {
+        'reservoir': 'reservoir over streamed chunks',
+        'row-group': 'selected Parquet row groups',
+    }.get(info['method'], info['method'])
+    return (
+        f"{info['sample_rows']:,} of {info['total_rows']:,} rows, "
+        f"{kind} from {source} (seed {info['seed']})"
+    )